@@ -0,0 +1,109 @@
+"""
+Parallel cleaning pipeline for all solar plant files.
+Discovers every plant generation and weather sensor CSV in a directory and
+cleans them in a process pool, skipping files that are already up to date.
+"""
+
+import os
+import re
+import glob
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from clean import clean_solar_generation
+from clean1 import clean_solar_weather
+
+# Raw file pattern -> (output name template, cleaning function)
+CLEANING_RULES = [
+    (re.compile(r'^Plant_(\d+)_Generation_Data\.csv$'), 'Plant_{plant}_Cleaned.csv', clean_solar_generation),
+    (re.compile(r'^Plant_(\d+)_Weather_Sensor_Data\.csv$'), 'Plant_{plant}_Weather_Cleaned.csv', clean_solar_weather),
+]
+
+def discover_plant_files(data_dir='.'):
+    """Find all raw plant generation and weather files in data_dir"""
+    jobs = []
+    for file_path in sorted(glob.glob(os.path.join(data_dir, 'Plant_*.csv'))):
+        file_name = os.path.basename(file_path)
+        for pattern, output_template, clean_func in CLEANING_RULES:
+            match = pattern.match(file_name)
+            if match:
+                output_path = os.path.join(data_dir, output_template.format(plant=match.group(1)))
+                jobs.append((file_path, output_path, clean_func))
+                break
+    return jobs
+
+def is_up_to_date(input_path, output_path):
+    """Check whether the cleaned output is newer than its raw input"""
+    if not os.path.exists(output_path):
+        return False
+    return os.path.getmtime(output_path) >= os.path.getmtime(input_path)
+
+def _clean_one(file_path, output_path, clean_func):
+    """Worker: clean a single file and return its timing"""
+    start = time.perf_counter()
+    df = clean_func(file_path, output_path)
+    return file_path, len(df), time.perf_counter() - start
+
+def clean_all_plants(data_dir='.', max_workers=None, force=False):
+    """
+    Clean all plant files found in data_dir using a process pool
+
+    Args:
+        data_dir (str): Directory containing the raw Plant_*.csv files
+        max_workers (int): Number of worker processes (defaults to CPU count)
+        force (bool): Re-clean files even if their output is up to date
+
+    Returns:
+        dict: Per-file status, row count and elapsed seconds
+    """
+    print("🚀 Starting parallel plant cleaning pipeline")
+
+    jobs = discover_plant_files(data_dir)
+    if not jobs:
+        print(f"⚠️ No plant files found in {data_dir}")
+        return {}
+
+    report = {}
+    pending = []
+    for file_path, output_path, clean_func in jobs:
+        if not force and is_up_to_date(file_path, output_path):
+            print(f"⏭️ Skipping {os.path.basename(file_path)} (output is up to date)")
+            report[file_path] = {'status': 'skipped', 'rows': None, 'seconds': 0.0}
+        else:
+            pending.append((file_path, output_path, clean_func))
+
+    if pending:
+        max_workers = max_workers or os.cpu_count() or 1
+        max_workers = min(max_workers, len(pending))
+        print(f"🔄 Cleaning {len(pending)} files with {max_workers} workers...")
+
+        total_start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_clean_one, *job): job[0] for job in pending}
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    _, rows, seconds = future.result()
+                    report[file_path] = {'status': 'cleaned', 'rows': rows, 'seconds': seconds}
+                    print(f"⏱️ {os.path.basename(file_path)}: {rows} rows in {seconds:.2f}s")
+                except Exception as e:
+                    report[file_path] = {'status': 'failed', 'rows': None, 'seconds': None, 'error': str(e)}
+                    print(f"❌ Failed to clean {os.path.basename(file_path)}: {e}")
+
+        elapsed = time.perf_counter() - total_start
+        failed = [path for path, _, _ in pending if report[path]['status'] == 'failed']
+        print(f"✅ Cleaned {len(pending) - len(failed)} files in {elapsed:.2f}s")
+        if failed:
+            print(f"❌ {len(failed)} files failed: {', '.join(os.path.basename(path) for path in failed)}")
+
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Clean all solar plant files in parallel")
+    parser.add_argument('--data-dir', default='.', help="Directory containing Plant_*.csv files")
+    parser.add_argument('--workers', type=int, default=None, help="Number of worker processes")
+    parser.add_argument('--force', action='store_true', help="Re-clean files even if up to date")
+    args = parser.parse_args()
+
+    clean_all_plants(args.data_dir, max_workers=args.workers, force=args.force)
@@ -0,0 +1,189 @@
+"""
+Long-horizon forecasting from a precomputed NASA POWER climatology.
+Historical daily POWER data is reduced once to per-grid-cell, per-day-of-year
+means and percentiles and stored as a compact float32 array store. Forecast
+weather for any site and future date range is then a vectorized lookup, with
+no network fetch, ready for a single model pass.
+"""
+
+import os
+import json
+import argparse
+import numpy as np
+import pandas as pd
+
+CLIMATOLOGY_DIR = os.path.join('.cache', 'climatology')
+
+# Weather columns stored per cell and day of year (NASA POWER processed names)
+CLIMATOLOGY_PARAMETERS = ['SOLAR_RADIATION', 'TEMPERATURE', 'HUMIDITY', 'WIND_SPEED']
+CLIMATOLOGY_STATISTICS = ['mean', 'p10', 'p50', 'p90']
+
+# Grid cell size in degrees (NASA POWER meteorology is 0.5 x 0.625)
+GRID_RESOLUTION = 0.5
+
+# Farthest a site may be from its nearest stored cell center, in grid cells
+# (a site's own cell center is at most ~0.7 cells away)
+MAX_CELL_DISTANCE = 1.0
+
+# Days on each side of a day of year pooled into its statistics
+SMOOTHING_DAYS = 7
+
+def grid_cell(latitude, longitude, resolution=GRID_RESOLUTION):
+    """Center of the grid cell containing each coordinate"""
+    return (np.floor(np.asarray(latitude) / resolution) * resolution + resolution / 2,
+            np.floor(np.asarray(longitude) / resolution) * resolution + resolution / 2)
+
+def day_of_year_statistics(weather_data, smoothing_days=SMOOTHING_DAYS):
+    """
+    Per-day-of-year statistics of one cell's historical weather
+
+    Returns:
+        np.ndarray: float32 (366, parameters, statistics)
+    """
+    doy = weather_data['DATE'].dt.dayofyear.to_numpy() - 1
+    values = np.column_stack([
+        weather_data[column].to_numpy(dtype=float) if column in weather_data.columns
+        else np.full(len(weather_data), np.nan)
+        for column in CLIMATOLOGY_PARAMETERS
+    ])
+    values[values <= -999] = np.nan  # POWER fill value
+
+    stats = np.full((366, len(CLIMATOLOGY_PARAMETERS), len(CLIMATOLOGY_STATISTICS)), np.nan, dtype=np.float32)
+    for day in range(366):
+        # Circular window so late December pools with early January
+        distance = np.abs(doy - day)
+        window = values[np.minimum(distance, 366 - distance) <= smoothing_days]
+        if len(window) == 0:
+            continue
+        stats[day, :, 0] = np.nanmean(window, axis=0)
+        stats[day, :, 1:] = np.nanpercentile(window, [10, 50, 90], axis=0).T
+    return stats
+
+class ClimatologyStore:
+    """Per-cell, per-day-of-year weather statistics with vectorized lookup"""
+
+    def __init__(self, cells, stats, resolution=GRID_RESOLUTION):
+        self.cells = np.asarray(cells, dtype=np.float32)   # (n_cells, 2) lat/lon centers
+        self.stats = stats                                 # (n_cells, 366, parameters, statistics)
+        self.resolution = resolution
+
+    @classmethod
+    def build(cls, weather_by_site, resolution=GRID_RESOLUTION, smoothing_days=SMOOTHING_DAYS):
+        """
+        Build from historical daily POWER frames
+
+        Args:
+            weather_by_site (dict): (latitude, longitude) -> processed POWER frame;
+                sites in the same grid cell are pooled
+        """
+        by_cell = {}
+        for (latitude, longitude), weather_data in weather_by_site.items():
+            cell = tuple(float(c) for c in grid_cell(latitude, longitude, resolution))
+            by_cell.setdefault(cell, []).append(weather_data)
+
+        cells = list(by_cell.keys())
+        stats = np.stack([
+            day_of_year_statistics(pd.concat(by_cell[cell], ignore_index=True), smoothing_days)
+            for cell in cells
+        ])
+        print(f"✅ Climatology built for {len(cells)} grid cells")
+        return cls(cells, stats, resolution)
+
+    def save(self, directory=CLIMATOLOGY_DIR):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, 'cells.npy'), self.cells)
+        np.save(os.path.join(directory, 'stats.npy'), self.stats)
+        with open(os.path.join(directory, 'meta.json'), 'w') as f:
+            json.dump({'resolution': self.resolution, 'parameters': CLIMATOLOGY_PARAMETERS,
+                       'statistics': CLIMATOLOGY_STATISTICS}, f)
+
+    @classmethod
+    def load(cls, directory=CLIMATOLOGY_DIR):
+        """Load with the statistics memory-mapped"""
+        with open(os.path.join(directory, 'meta.json')) as f:
+            meta = json.load(f)
+        return cls(np.load(os.path.join(directory, 'cells.npy')),
+                   np.load(os.path.join(directory, 'stats.npy'), mmap_mode='r'),
+                   meta['resolution'])
+
+    def nearest_cells(self, latitude, longitude):
+        """
+        Stored cell nearest to each coordinate
+
+        Returns:
+            tuple: (cell indices, distances in degrees of latitude)
+        """
+        latitude = np.atleast_1d(np.asarray(latitude, dtype=float))
+        longitude = np.atleast_1d(np.asarray(longitude, dtype=float))
+        dlat = latitude[:, None] - self.cells[None, :, 0]
+        dlon = (longitude[:, None] - self.cells[None, :, 1] + 180) % 360 - 180
+        dlon *= np.cos(np.radians(latitude))[:, None]
+        distance = np.sqrt(dlat ** 2 + dlon ** 2)
+        nearest = np.argmin(distance, axis=1)
+        return nearest, distance[np.arange(len(nearest)), nearest]
+
+    def forecast_weather(self, latitude, longitude, start_date, end_date, statistic='mean'):
+        """
+        Climatological daily weather for a site and date range
+
+        Each parameter takes the statistic of its own day-of-year
+        distribution, so the 'p10' and 'p90' frames are per-parameter
+        marginal percentiles: a day that is p10 for irradiance is not
+        generally p10 for temperature, and the power predicted from them is
+        not the p10/p90 of power.
+
+        Args:
+            start_date, end_date (str): YYYYMMDD, any horizon
+            statistic (str): One of CLIMATOLOGY_STATISTICS
+
+        Returns:
+            pd.DataFrame: DATE plus the CLIMATOLOGY_PARAMETERS columns, like
+                NASAPowerAPI._process_api_response before derived features
+
+        Raises:
+            ValueError: If no stored cell is within MAX_CELL_DISTANCE grid
+                cells of the site
+        """
+        dates = pd.date_range(pd.to_datetime(start_date, format='%Y%m%d'),
+                              pd.to_datetime(end_date, format='%Y%m%d'), freq='D')
+        cells, distances = self.nearest_cells(latitude, longitude)
+        if distances[0] > MAX_CELL_DISTANCE * self.resolution:
+            raise ValueError(f"No climatology within {MAX_CELL_DISTANCE * self.resolution:g}° of "
+                             f"({latitude}, {longitude}); nearest cell is {distances[0]:.1f}° away")
+        cell = cells[0]
+        values = self.stats[cell, dates.dayofyear.to_numpy() - 1, :, CLIMATOLOGY_STATISTICS.index(statistic)]
+
+        weather_data = pd.DataFrame(np.asarray(values, dtype=float), columns=CLIMATOLOGY_PARAMETERS)
+        weather_data.insert(0, 'DATE', dates)
+        return weather_data
+
+def build_climatology_from_api(coordinates, start_year, end_year, api=None):
+    """
+    Fetch historical daily POWER data and build a ClimatologyStore
+
+    Args:
+        coordinates (list): (latitude, longitude) pairs, one fetch per grid cell
+        start_year, end_year (int): Inclusive range of historical years
+    """
+    from nasa_power_integration import NASAPowerAPI
+    api = api or NASAPowerAPI()
+
+    weather_by_site = {}
+    for latitude, longitude in {tuple(float(c) for c in grid_cell(lat, lon)) for lat, lon in coordinates}:
+        weather_data = api.fetch_weather_data(latitude, longitude, f"{start_year}0101", f"{end_year}1231")
+        if weather_data.empty:
+            print(f"⚠️ Skipping cell ({latitude}, {longitude}): no historical data")
+            continue
+        weather_by_site[(latitude, longitude)] = weather_data
+    return ClimatologyStore.build(weather_by_site)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a NASA POWER climatology store")
+    parser.add_argument('--site', nargs=2, type=float, action='append', required=True,
+                        metavar=('LAT', 'LON'), help="Site to cover (repeatable)")
+    parser.add_argument('--years', nargs=2, type=int, default=[2001, 2020], metavar=('START', 'END'))
+    parser.add_argument('--output', default=CLIMATOLOGY_DIR)
+    args = parser.parse_args()
+
+    build_climatology_from_api(args.site, *args.years).save(args.output)
+    print(f"✅ Climatology saved to {args.output}")
@@ -0,0 +1,168 @@
+"""
+Pre-aggregated time cube of predicted energy per site.
+Keeps energy totals per (site, period) at hour, day, month and year levels,
+updated incrementally as predictions land, so dashboard rollups are dict
+lookups instead of re-predicting and re-summing at the base resolution.
+Each site keeps one base resolution (hourly, daily or monthly intervals);
+re-predicting an interval replaces its earlier value instead of adding to it,
+within a retention window that bounds the per-interval history.
+"""
+
+import pickle
+import numpy as np
+import pandas as pd
+
+# Cube level -> numpy datetime unit of its periods
+CUBE_LEVELS = {'hour': 'h', 'day': 'D', 'month': 'M', 'year': 'Y'}
+
+# Levels a site's base intervals can have
+BASE_RESOLUTIONS = ['hour', 'day', 'month']
+
+# Base intervals older than this (behind the site's latest) are evicted
+DEFAULT_RETENTION = pd.Timedelta(days=400)
+
+class EnergyCube:
+    """Energy totals (kWh) per site and period, maintained incrementally"""
+
+    def __init__(self, retention=DEFAULT_RETENTION):
+        """
+        Args:
+            retention: Timedelta of base intervals kept per site for
+                replacement, or None to keep them all
+        """
+        self.cells = {level: {} for level in CUBE_LEVELS}  # level -> site -> period -> [kWh, intervals]
+        self._base = {}  # site -> resolution and sorted interval/energy arrays of the latest predictions
+        self.retention = pd.Timedelta(retention).to_timedelta64() if retention is not None else None
+
+    def add(self, site, timestamps, energy, resolution='hour'):
+        """
+        Record energy for one site, replacing any earlier values for the same intervals
+
+        Readings that fall into the same interval are summed. Intervals older
+        than the retention window behind the site's latest interval are
+        skipped, since their earlier value is no longer known.
+
+        Args:
+            site: Hashable site key
+            timestamps (array-like): Start of each reading
+            energy (array-like): Energy per reading in kWh
+            resolution (str): Base interval of the site, one of BASE_RESOLUTIONS
+
+        Raises:
+            ValueError: Unknown resolution, or a site already recorded at another one
+        """
+        if resolution not in BASE_RESOLUTIONS:
+            raise ValueError(f"Unknown resolution {resolution!r}, expected one of {BASE_RESOLUTIONS}")
+        unit = CUBE_LEVELS[resolution]
+        base = self._base.get(site)
+        if base is None:
+            base = {'resolution': resolution, 'intervals': np.empty(0, dtype=f'datetime64[{unit}]'),
+                    'energy': np.empty(0)}
+        elif base['resolution'] != resolution:
+            raise ValueError(f"Site {site!r} is recorded at {base['resolution']} resolution, "
+                             f"cannot add {resolution} data")
+
+        intervals = pd.DatetimeIndex(timestamps).to_numpy().astype(f'datetime64[{unit}]')
+        energy = np.asarray(energy, dtype=float)
+
+        if self.retention is not None and len(base['intervals']):
+            current = intervals.astype('datetime64[ns]') >= self._cutoff(base['intervals'][-1])
+            if not current.all():
+                print(f"⚠️ Skipping {np.count_nonzero(~current)} readings older than the retention window")
+                intervals, energy = intervals[current], energy[current]
+        if len(intervals) == 0:
+            return self
+
+        # One value per interval
+        intervals, inverse = np.unique(intervals, return_inverse=True)
+        energy = np.bincount(inverse, weights=energy, minlength=len(intervals))
+
+        # Change per interval against what the cube already holds
+        known = base['intervals']
+        position = np.searchsorted(known, intervals)
+        found = position < len(known)
+        found[found] = known[position[found]] == intervals[found]
+        deltas = energy.copy()
+        deltas[found] -= base['energy'][position[found]]
+
+        known_energy = base['energy'].copy()
+        known_energy[position[found]] = energy[found]
+        merged = np.concatenate([known, intervals[~found]])
+        order = np.argsort(merged, kind='stable')
+        base['intervals'] = merged[order]
+        base['energy'] = np.concatenate([known_energy, energy[~found]])[order]
+        if self.retention is not None and len(base['intervals']):
+            keep = base['intervals'].astype('datetime64[ns]') >= self._cutoff(base['intervals'][-1])
+            base['intervals'], base['energy'] = base['intervals'][keep], base['energy'][keep]
+        self._base[site] = base
+
+        # One grouped update per level at or above the base resolution
+        new_intervals = ~found
+        for level in list(CUBE_LEVELS)[list(CUBE_LEVELS).index(resolution):]:
+            periods, inverse = np.unique(intervals.astype(f'datetime64[{CUBE_LEVELS[level]}]'), return_inverse=True)
+            sums = np.bincount(inverse, weights=deltas, minlength=len(periods))
+            counts = np.bincount(inverse, weights=new_intervals, minlength=len(periods))
+            cells = self.cells[level].setdefault(site, {})
+            for period, total, count in zip(periods, sums, counts):
+                cell = cells.setdefault(period, [0.0, 0])
+                cell[0] += float(total)
+                cell[1] += int(count)
+        return self
+
+    def _cutoff(self, latest):
+        """Oldest replaceable interval start, as datetime64[ns]"""
+        return latest.astype('datetime64[ns]') - self.retention
+
+    def resolution(self, site):
+        """Base resolution a site is recorded at, or None"""
+        base = self._base.get(site)
+        return base['resolution'] if base else None
+
+    def add_predictions(self, site, weather_data, predictions, step_hours=None):
+        """
+        Record predicted power (kW) for the rows of a NASA POWER frame
+
+        Args:
+            step_hours (float): Interval length; inferred from the DATE spacing
+                (1 for hourly, 24 for daily data) when not given. It also
+                sets the site's base resolution (hour, day or month)
+        """
+        timestamps = pd.DatetimeIndex(weather_data['DATE'])
+        if step_hours is None:
+            step_hours = (np.median(np.diff(timestamps)) / pd.Timedelta(hours=1)) if len(timestamps) > 1 else 24.0
+        # Sub-hourly readings are summed into hours
+        resolution = 'month' if step_hours >= 24 * 28 else 'day' if step_hours >= 24 else 'hour'
+        return self.add(site, timestamps, np.asarray(predictions, dtype=float) * step_hours, resolution)
+
+    @staticmethod
+    def _period(level, period):
+        return np.datetime64(pd.Timestamp(period).to_datetime64(), CUBE_LEVELS[level])
+
+    def total(self, site, level, period):
+        """Energy of one site in one period, e.g. total(site, 'month', '2024-06')"""
+        cell = self.cells[level].get(site, {}).get(self._period(level, period))
+        return cell[0] if cell else 0.0
+
+    def series(self, site, level, start=None, end=None):
+        """Per-period totals of one site as a Series, optionally limited to [start, end]"""
+        cells = self.cells[level].get(site, {})
+        periods = sorted(cells)
+        if start is not None:
+            periods = [p for p in periods if p >= self._period(level, start)]
+        if end is not None:
+            periods = [p for p in periods if p <= self._period(level, end)]
+        return pd.Series([cells[p][0] for p in periods],
+                         index=pd.DatetimeIndex(periods), name=f'{level}_energy_kwh')
+
+    def sites(self):
+        """Site keys present in the cube"""
+        return list(self.cells['year'].keys())
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(path):
+        with open(path, 'rb') as f:
+            return pickle.load(f)
@@ -0,0 +1,128 @@
+"""
+Importance-based feature pruning.
+Ranks the engineered features by gain or permutation importance of a fast
+LightGBM probe, then searches for the smallest top-k feature set whose
+validation R² stays within a tolerance of the full feature set. Only
+servable features are candidates: nothing derived from the target and nothing
+NASA POWER weather cannot provide, since those are filled with constants at
+serving time. The selected list is what gets stored as 'feature_columns' in
+the model file, so fewer features are computed and evaluated per prediction.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+from sklearn.inspection import permutation_importance
+from sklearn.metrics import r2_score
+
+def get_probe_model():
+    """Fast model used to rank features and score candidate subsets"""
+    import lightgbm as lgb
+    return lgb.LGBMRegressor(
+        n_estimators=200, num_leaves=31, learning_rate=0.1,
+        random_state=42, n_jobs=-1, verbose=-1
+    )
+
+def servable_features(columns):
+    """Columns that can be computed from NASA POWER weather at prediction time"""
+    from optimized_solar_ml import TARGET_DERIVED_FEATURES
+    from nasa_power_integration import NASA_FEATURE_SOURCES
+    return [
+        column for column in columns
+        if column in NASA_FEATURE_SOURCES and column not in TARGET_DERIVED_FEATURES
+    ]
+
+def rank_features(X_fit, y_fit, X_val, y_val, method='gain'):
+    """
+    Rank features by importance of a probe fitted on all of them
+
+    Args:
+        method (str): 'gain' uses the probe's total split gain,
+            'permutation' the validation R² drop when a feature is shuffled
+
+    Returns:
+        tuple: (pd.Series of importances sorted descending, full-feature validation R²)
+    """
+    probe = get_probe_model()
+    probe.fit(X_fit, y_fit)
+    full_r2 = r2_score(y_val, probe.predict(X_val))
+
+    if method == 'permutation':
+        importance = permutation_importance(
+            probe, X_val, y_val, scoring='r2', n_repeats=5, random_state=42, n_jobs=-1
+        ).importances_mean
+    elif method == 'gain':
+        importance = probe.booster_.feature_importance(importance_type='gain')
+    else:
+        raise ValueError(f"Unknown importance method: {method}")
+
+    importances = pd.Series(importance, index=X_fit.columns).sort_values(ascending=False, kind='stable')
+    return importances, full_r2
+
+def select_features(X, y, method='gain', r2_tolerance=0.002, validation_size=0.2, candidates=None):
+    """
+    Smallest top-k feature set within r2_tolerance of all candidate features
+
+    Only the training rows of split_optimized_data's split are used, so the
+    test set stays unseen. Subset sizes are found by binary search over k,
+    refitting the probe on the top-k features at each step.
+
+    Args:
+        X, y: Full feature matrix and target
+        method (str): 'gain' or 'permutation', see rank_features
+        r2_tolerance (float): Largest acceptable validation R² drop
+        validation_size (float): Share of training rows used for scoring
+        candidates (list): Columns that may be selected (default: servable_features)
+
+    Returns:
+        dict: selected feature list, importances and the full/selected R²
+    """
+    print(f"\n🔄 Selecting features by {method} importance (R² tolerance {r2_tolerance})...")
+
+    candidates = servable_features(X.columns) if candidates is None else list(candidates)
+    excluded = [column for column in X.columns if column not in candidates]
+    if not candidates:
+        raise ValueError("No candidate features to select from")
+    if excluded:
+        print(f"   Not servable: {', '.join(excluded)}")
+    X = X[candidates]
+
+    # Same split as split_optimized_data, then a validation slice of the train part
+    X_train, _, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=42)
+    X_fit, X_val, y_fit, y_val = train_test_split(
+        X_train.astype(np.float32), y_train, test_size=validation_size, random_state=42
+    )
+
+    importances, full_r2 = rank_features(X_fit, y_fit, X_val, y_val, method)
+    ranked = list(importances.index)
+
+    def subset_r2(k):
+        columns = ranked[:k]
+        probe = get_probe_model().fit(X_fit[columns], y_fit)
+        return r2_score(y_val, probe.predict(X_val[columns]))
+
+    # Binary search for the smallest k that keeps R² within tolerance
+    low, high = 1, len(ranked)
+    scores = {high: full_r2}
+    while low < high:
+        k = (low + high) // 2
+        scores[k] = subset_r2(k)
+        print(f"   top {k:>2} features: R² {scores[k]:.4f}")
+        if full_r2 - scores[k] <= r2_tolerance:
+            high = k
+        else:
+            low = k + 1
+
+    # Keep the original column order for the model file
+    kept = set(ranked[:high])
+    selected = [column for column in X.columns if column in kept]
+    print(f"✅ Kept {len(selected)}/{len(ranked)} features "
+          f"(R² {scores[high]:.4f} vs {full_r2:.4f} with all features)")
+    print(f"   Dropped: {', '.join(ranked[high:]) or 'none'}")
+
+    return {
+        'selected': selected,
+        'importances': importances,
+        'full_r2': full_r2,
+        'selected_r2': scores[high]
+    }
@@ -0,0 +1,360 @@
+"""
+Quantized, memory-mappable model artifact format.
+Stores the model file contents ('model', 'scaler', 'surrogate', 'quantile_model'
+and metadata) as flat, 64-byte aligned numpy arrays behind a JSON header with
+a schema version and a SHA-256 checksum of header and payload. Tree ensembles (random forest, gradient
+boosting, single trees) are flattened into one node table with float32
+thresholds, float32 or float16 leaf values and node/feature indices in the
+smallest integer type that fits. The file is loaded with mmap, so arrays are
+read-only views of the page cache instead of unpickled copies. sklearn and the
+boosters are imported only to encode, or to decode entries that need them, so
+serving a quantized tree model loads numpy alone.
+"""
+
+import io
+import json
+import mmap
+import zlib
+import pickle
+import hashlib
+import numpy as np
+from native_boosters import NativeBoosterRegressor
+
+ARTIFACT_MAGIC = b'SOLARART'
+SCHEMA_VERSION = 2
+
+# Stands in for the checksum while the header is hashed
+CHECKSUM_PLACEHOLDER = '0' * 64
+ALIGNMENT = 64
+
+LINEAR_MODELS = ('LinearRegression', 'Ridge', 'Lasso', 'ElasticNet')
+SCALERS = ('RobustScaler', 'StandardScaler')
+
+class QuantizedTreeEnsemble:
+    """Additive tree ensemble evaluated from a flat node table"""
+
+    def __init__(self, feature, threshold, left, right, value, roots, max_depth, bias=0.0, scale=1.0,
+                 ensemble=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.bias = bias
+        self.scale = scale
+        # 'forest', 'boosting' or 'tree'; None for artifacts written before it was stored
+        self.ensemble = ensemble
+
+    def arrays(self):
+        return {name: getattr(self, name) for name in ['feature', 'threshold', 'left', 'right', 'value', 'roots']}
+
+    def leaf_values(self, X):
+        """Yield (row slice, per-tree leaf values) for row chunks of X, one traversal"""
+        X = np.ascontiguousarray(np.asarray(X, dtype=np.float32))
+        n_trees = len(self.roots)
+
+        # Bound the (rows x trees) node index matrix to a few MB per chunk
+        chunk_rows = max(1, 2 ** 20 // n_trees)
+        roots = self.roots.astype(np.intp)
+        for start in range(0, len(X), chunk_rows):
+            X_chunk = X[start:start + chunk_rows]
+            rows = np.arange(len(X_chunk))[:, None]
+            node = np.broadcast_to(roots, (len(X_chunk), n_trees))
+
+            # Leaves point to themselves, so every row can take max_depth steps
+            for _ in range(self.max_depth):
+                go_left = X_chunk[rows, self.feature[node]] <= self.threshold[node]
+                node = np.where(go_left, self.left[node], self.right[node]).astype(np.intp)
+
+            yield slice(start, start + len(X_chunk)), self.value[node]
+
+    def predict(self, X):
+        predictions = np.empty(len(X))
+        for rows, values in self.leaf_values(X):
+            predictions[rows] = values.sum(axis=1, dtype=np.float64)
+        return self.bias + self.scale * predictions
+
+class QuantizedLinearModel:
+    """Linear model reduced to its coefficients"""
+
+    def __init__(self, coef, intercept):
+        self.coef = coef
+        self.intercept = intercept
+
+    def predict(self, X):
+        return np.asarray(X, dtype=np.float64) @ self.coef + self.intercept
+
+def _index_dtype(n):
+    """Smallest unsigned integer type that can hold 0..n-1"""
+    return np.min_scalar_type(max(n - 1, 0))
+
+def _float32_floor(threshold):
+    """
+    Largest float32 not above each float64 threshold
+
+    For float32 inputs x, x <= threshold64 exactly when x <= floor32(threshold64),
+    so rounding this way keeps every split decision identical.
+    """
+    rounded = threshold.astype(np.float32)
+    above = rounded.astype(np.float64) > threshold
+    rounded[above] = np.nextafter(rounded[above], np.float32(-np.inf))
+    return rounded
+
+def quantize_trees(trees, n_features, bias=0.0, scale=1.0, value_dtype=np.float32, ensemble=None):
+    """Flatten fitted sklearn regression trees into a QuantizedTreeEnsemble"""
+    sizes = [tree.tree_.node_count for tree in trees]
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    total = int(np.sum(sizes))
+    index_dtype = _index_dtype(total)
+
+    feature = np.zeros(total, dtype=_index_dtype(n_features))
+    threshold = np.zeros(total, dtype=np.float32)
+    left = np.empty(total, dtype=index_dtype)
+    right = np.empty(total, dtype=index_dtype)
+    value = np.empty(total, dtype=value_dtype)
+
+    for tree, offset, size in zip(trees, offsets, sizes):
+        t = tree.tree_
+        nodes = np.arange(size)
+        leaf = t.children_left == -1
+        block = slice(offset, offset + size)
+        feature[block] = np.where(leaf, 0, t.feature)
+        threshold[block] = np.where(leaf, 0, _float32_floor(t.threshold))
+        left[block] = offset + np.where(leaf, nodes, t.children_left)
+        right[block] = offset + np.where(leaf, nodes, t.children_right)
+        value[block] = t.value[:, 0, 0]
+
+    return QuantizedTreeEnsemble(
+        feature, threshold, left, right, value, offsets.astype(index_dtype),
+        max(tree.tree_.max_depth for tree in trees), float(bias), float(scale), ensemble
+    )
+
+def _bytes_array(data):
+    return np.frombuffer(data, dtype=np.uint8)
+
+def _tree_meta(ensemble):
+    return {'bias': ensemble.bias, 'scale': ensemble.scale, 'max_depth': ensemble.max_depth,
+            'ensemble': ensemble.ensemble}
+
+def _encode(obj, value_dtype):
+    """
+    Split one object into (kind, meta, arrays)
+
+    Tree ensembles, linear models, scalers and boosters get compact native
+    encodings; anything else is stored as a compressed pickle.
+    """
+    from sklearn import linear_model
+    from sklearn.tree import DecisionTreeRegressor
+    from sklearn.ensemble import RandomForestRegressor, ExtraTreesRegressor, GradientBoostingRegressor
+    from sklearn.dummy import DummyRegressor
+
+    if isinstance(obj, (RandomForestRegressor, ExtraTreesRegressor)):
+        ensemble = quantize_trees(obj.estimators_, obj.n_features_in_, scale=1 / len(obj.estimators_),
+                                  value_dtype=value_dtype, ensemble='forest')
+        return 'trees', _tree_meta(ensemble), ensemble.arrays()
+
+    if isinstance(obj, GradientBoostingRegressor) and isinstance(obj.init_, DummyRegressor) \
+            and obj.loss == 'squared_error':
+        ensemble = quantize_trees(obj.estimators_[:, 0], obj.n_features_in_, bias=obj.init_.constant_.ravel()[0],
+                                  scale=obj.learning_rate, value_dtype=value_dtype, ensemble='boosting')
+        return 'trees', _tree_meta(ensemble), ensemble.arrays()
+
+    if isinstance(obj, DecisionTreeRegressor):
+        ensemble = quantize_trees([obj], obj.n_features_in_, value_dtype=value_dtype, ensemble='tree')
+        return 'trees', _tree_meta(ensemble), ensemble.arrays()
+
+    if isinstance(obj, tuple(getattr(linear_model, name) for name in LINEAR_MODELS)):
+        return 'linear', {'intercept': float(obj.intercept_)}, {'coef': np.asarray(obj.coef_, dtype=np.float64)}
+
+    if type(obj).__name__ in SCALERS:
+        arrays = {k: v for k, v in vars(obj).items() if k.endswith('_') and isinstance(v, np.ndarray) and v.dtype.kind == 'f'}
+        meta = {
+            'class': type(obj).__name__,
+            'params': obj.get_params(),
+            'attributes': {k: v for k, v in vars(obj).items() if k.endswith('_') and isinstance(v, (int, float))},
+            'feature_names': [str(name) for name in getattr(obj, 'feature_names_in_', [])]
+        }
+        return 'scaler', meta, arrays
+
+    if isinstance(obj, NativeBoosterRegressor):
+        params = {k: v for k, v in obj.params.items() if isinstance(v, (int, float, str))}
+        if obj.model_name == 'XGBoost':
+            return 'xgboost', {'params': params}, {'model': _bytes_array(bytes(obj.booster.save_raw('ubj')))}
+        model = obj.booster.model_to_string(num_iteration=obj.best_iteration)
+        return 'lightgbm', {'params': params}, {'model': _bytes_array(model.encode())}
+
+    # Booster packages are imported only for their own estimators
+    package = type(obj).__module__.split('.')[0]
+    if package == 'xgboost':
+        import xgboost as xgb
+        if isinstance(obj, xgb.XGBRegressor):
+            return 'xgboost', {'params': {}}, {'model': _bytes_array(bytes(obj.get_booster().save_raw('ubj')))}
+
+    if package == 'lightgbm':
+        import lightgbm as lgb
+        if isinstance(obj, lgb.LGBMRegressor):
+            return 'lightgbm', {'params': {}}, {'model': _bytes_array(obj.booster_.model_to_string().encode())}
+
+    return 'pickle', {'class': type(obj).__name__}, {'pickle': _bytes_array(zlib.compress(pickle.dumps(obj)))}
+
+def _decode(kind, meta, arrays):
+    """Rebuild a predict-ready object from _encode output"""
+    if kind == 'trees':
+        return QuantizedTreeEnsemble(max_depth=meta['max_depth'], bias=meta['bias'], scale=meta['scale'],
+                                     ensemble=meta.get('ensemble'), **arrays)
+
+    if kind == 'linear':
+        return QuantizedLinearModel(arrays['coef'], meta['intercept'])
+
+    if kind == 'scaler':
+        from sklearn import preprocessing
+        scaler = getattr(preprocessing, meta['class'])(**meta['params'])
+        for name, value in {**arrays, **meta['attributes']}.items():
+            setattr(scaler, name, value)
+        if meta['feature_names']:
+            scaler.feature_names_in_ = np.array(meta['feature_names'], dtype=object)
+        return scaler
+
+    if kind == 'xgboost':
+        import xgboost as xgb
+        booster = xgb.Booster()
+        booster.load_model(bytearray(arrays['model']))
+        return NativeBoosterRegressor('XGBoost', booster, meta['params'])
+
+    if kind == 'lightgbm':
+        import lightgbm as lgb
+        booster = lgb.Booster(model_str=bytes(arrays['model']).decode())
+        return NativeBoosterRegressor('LightGBM', booster, meta['params'])
+
+    return pickle.loads(zlib.decompress(arrays['pickle']))
+
+def _build_payload(model_data, value_dtype):
+    """Header and aligned payload bytes for one value dtype"""
+    entries = {}
+    payload = io.BytesIO()
+    metadata = {}
+
+    for name, obj in model_data.items():
+        if obj is None:
+            continue
+        if name == 'surrogate':
+            metadata['surrogate_info'] = {k: v for k, v in obj.items() if k != 'model'}
+            obj = obj['model']
+        elif name not in ('model', 'scaler', 'quantile_model'):
+            metadata[name] = obj
+            continue
+
+        kind, meta, arrays = _encode(obj, value_dtype)
+        table = {}
+        for key, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            payload.write(b'\0' * (-payload.tell() % ALIGNMENT))
+            table[key] = {'offset': payload.tell(), 'dtype': array.dtype.str, 'shape': list(array.shape)}
+            payload.write(array.tobytes())
+        entries[name] = {'kind': kind, 'meta': meta, 'arrays': table}
+
+    payload = payload.getvalue()
+    header = {
+        'schema_version': SCHEMA_VERSION,
+        'checksum': CHECKSUM_PLACEHOLDER,
+        'value_dtype': np.dtype(value_dtype).name,
+        'entries': entries,
+        'metadata': metadata
+    }
+    header = json.dumps(header, default=lambda v: v.item() if isinstance(v, np.generic) else repr(v)).encode()
+    checksum = _checksum(header, payload)
+    return header.replace(_checksum_field(CHECKSUM_PLACEHOLDER), _checksum_field(checksum), 1), payload
+
+def _checksum_field(checksum):
+    return f'"checksum": "{checksum}"'.encode()
+
+def _checksum(header, payload):
+    """SHA-256 of the header (checksum field blanked) followed by the payload"""
+    digest = hashlib.sha256(header)
+    digest.update(payload)
+    return digest.hexdigest()
+
+def save_artifact(model_data, path, value_dtype=np.float32, max_bytes=None):
+    """
+    Write a model file dict (as saved by save_optimized_model_and_results) as an artifact
+
+    Args:
+        model_data (dict): 'model', 'scaler', optional 'surrogate' and
+            'quantile_model', and metadata
+        path (str): Output file
+        value_dtype: Leaf value precision, np.float32 or np.float16
+        max_bytes (int): Size bound; leaf values fall back to float16 to meet
+            it and a ValueError is raised if that is still too large
+
+    Returns:
+        int: Artifact size in bytes
+    """
+    header, payload = _build_payload(model_data, value_dtype)
+    prefix_size = len(ARTIFACT_MAGIC) + 4 + len(header)
+    size = prefix_size + (-prefix_size % ALIGNMENT) + len(payload)
+
+    if max_bytes is not None and size > max_bytes:
+        if np.dtype(value_dtype) != np.float16:
+            print(f"⚠️ Artifact is {size / 1e6:.1f} MB, over the {max_bytes / 1e6:.1f} MB bound; using float16 leaf values")
+            return save_artifact(model_data, path, np.float16, max_bytes)
+        raise ValueError(f"Artifact is {size} bytes, over the {max_bytes} byte bound even with float16 values")
+
+    with open(path, 'wb') as f:
+        f.write(ARTIFACT_MAGIC)
+        f.write(len(header).to_bytes(4, 'little'))
+        f.write(header)
+        f.write(b'\0' * (-prefix_size % ALIGNMENT))
+        f.write(payload)
+    return size
+
+def load_artifact(path, verify=True):
+    """
+    Memory-map an artifact and rebuild the model file dict
+
+    Raises:
+        ValueError: Not an artifact, newer schema version or checksum mismatch
+    """
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if buffer[:len(ARTIFACT_MAGIC)] != ARTIFACT_MAGIC:
+        raise ValueError(f"{path} is not a model artifact")
+    header_size = int.from_bytes(buffer[len(ARTIFACT_MAGIC):len(ARTIFACT_MAGIC) + 4], 'little')
+    header_end = len(ARTIFACT_MAGIC) + 4 + header_size
+    header_bytes = buffer[len(ARTIFACT_MAGIC) + 4:header_end]
+    header = json.loads(header_bytes)
+
+    if header['schema_version'] > SCHEMA_VERSION:
+        raise ValueError(f"{path} uses artifact schema {header['schema_version']}, "
+                         f"this code reads up to {SCHEMA_VERSION}")
+
+    payload_start = header_end + (-header_end % ALIGNMENT)
+    if verify:
+        with memoryview(buffer)[payload_start:] as payload:
+            if header['schema_version'] < 2:
+                # Schema 1 checksums cover the payload only
+                checksum = hashlib.sha256(payload).hexdigest()
+            else:
+                blanked = header_bytes.replace(_checksum_field(header['checksum']),
+                                               _checksum_field(CHECKSUM_PLACEHOLDER), 1)
+                checksum = _checksum(blanked, payload)
+        if checksum != header['checksum']:
+            raise ValueError(f"{path} checksum mismatch, the file is corrupt")
+
+    model_data = dict(header['metadata'])
+    surrogate_info = model_data.pop('surrogate_info', None)
+    for name, entry in header['entries'].items():
+        arrays = {
+            key: np.frombuffer(buffer, dtype=np.dtype(spec['dtype']), count=int(np.prod(spec['shape'])),
+                               offset=payload_start + spec['offset']).reshape(spec['shape'])
+            for key, spec in entry['arrays'].items()
+        }
+        model_data[name] = _decode(entry['kind'], entry['meta'], arrays)
+
+    if 'surrogate' in model_data:
+        surrogate_info['latency_ms'] = {int(k): v for k, v in surrogate_info.get('latency_ms', {}).items()}
+        model_data['surrogate'] = {**surrogate_info, 'model': model_data['surrogate']}
+    model_data.setdefault('scaler', None)
+    return model_data
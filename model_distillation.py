@@ -0,0 +1,127 @@
+"""
+Model distillation into compact low-latency surrogates.
+Trains small students (a shallow LightGBM, a piecewise-linear spline model and
+a single decision tree) on the teacher model's predictions, reports the
+accuracy/latency trade-off of each and picks the fastest student that stays
+within an R² tolerance of the teacher.
+"""
+
+import time
+import pickle
+import numpy as np
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import SplineTransformer
+from sklearn.linear_model import Ridge
+from sklearn.tree import DecisionTreeRegressor
+from sklearn.metrics import r2_score
+
+class _ScaledTeacher:
+    """Teacher model that expects its inputs through a scaler"""
+
+    def __init__(self, model, scaler=None):
+        self.model = model
+        self.scaler = scaler
+
+    def predict(self, X):
+        return self.model.predict(self.scaler.transform(X) if self.scaler is not None else X)
+
+def get_surrogate_candidates():
+    """Compact student models, all trained on raw (unscaled) features"""
+    import lightgbm as lgb
+    return {
+        'Shallow LightGBM': lgb.LGBMRegressor(
+            n_estimators=40, num_leaves=15, max_depth=4, learning_rate=0.2,
+            random_state=42, n_jobs=1, verbose=-1
+        ),
+        'Piecewise Linear': make_pipeline(
+            SplineTransformer(n_knots=8, degree=1), Ridge(alpha=1e-3)
+        ),
+        'Small Tree': DecisionTreeRegressor(max_depth=8, min_samples_leaf=20, random_state=42)
+    }
+
+def measure_latency(model, X, batch_sizes=(1, 1000), repeats=50):
+    """Median predict latency in milliseconds per batch size"""
+    latencies = {}
+    for batch_size in batch_sizes:
+        batch = X[:batch_size]
+        timings = []
+        for _ in range(repeats if batch_size == 1 else max(3, repeats // 10)):
+            start = time.perf_counter()
+            model.predict(batch)
+            timings.append(time.perf_counter() - start)
+        latencies[batch_size] = np.median(timings) * 1000
+    return latencies
+
+def distill_model(teacher, X_train, X_test, y_test, teacher_scaler=None, r2_tolerance=0.005):
+    """
+    Distill a teacher model into compact surrogates
+
+    Args:
+        teacher: Fitted model to imitate
+        X_train, X_test: Raw feature frames
+        y_test: True test targets
+        teacher_scaler: Scaler the teacher expects its inputs through, if any
+        r2_tolerance (float): Largest acceptable test R² drop versus the teacher
+
+    Returns:
+        tuple: (chosen surrogate info dict or None, trade-off report per model)
+    """
+    print("\n🔄 Distilling the best model into compact surrogates...")
+
+    X_train = np.asarray(X_train, dtype=np.float32)
+    X_test = np.asarray(X_test, dtype=np.float32)
+
+    scaled_teacher = _ScaledTeacher(teacher, teacher_scaler)
+
+    # Students learn the teacher's function, not the noisy targets
+    soft_targets = scaled_teacher.predict(X_train)
+    teacher_test = scaled_teacher.predict(X_test)
+    teacher_r2 = r2_score(y_test, teacher_test)
+
+    report = {
+        'Teacher': {
+            'r2': teacher_r2,
+            'fidelity_r2': 1.0,
+            'latency_ms': measure_latency(scaled_teacher, X_test),
+            'size_kb': len(pickle.dumps(teacher)) / 1024
+        }
+    }
+
+    for name, model in get_surrogate_candidates().items():
+        model.fit(X_train, soft_targets)
+        y_pred = model.predict(X_test)
+        report[name] = {
+            'model': model,
+            'r2': r2_score(y_test, y_pred),
+            'fidelity_r2': r2_score(teacher_test, y_pred),
+            'latency_ms': measure_latency(model, X_test),
+            'size_kb': len(pickle.dumps(model)) / 1024
+        }
+
+    print(f"{'Model':<18} {'R²':>8} {'Fidelity':>9} {'1-row ms':>9} {'1k-row ms':>10} {'Size KB':>9}")
+    for name, entry in report.items():
+        print(f"{name:<18} {entry['r2']:>8.4f} {entry['fidelity_r2']:>9.4f} "
+              f"{entry['latency_ms'][1]:>9.3f} {entry['latency_ms'][1000]:>10.3f} {entry['size_kb']:>9.0f}")
+
+    # Fastest single-row student within tolerance of the teacher
+    acceptable = [
+        name for name, entry in report.items()
+        if name != 'Teacher' and teacher_r2 - entry['r2'] <= r2_tolerance
+    ]
+    if not acceptable:
+        print(f"⚠️ No surrogate within R² tolerance {r2_tolerance} of the teacher")
+        return None, report
+
+    best_name = min(acceptable, key=lambda name: report[name]['latency_ms'][1])
+    best = report[best_name]
+    print(f"✅ Selected surrogate: {best_name} (R² {best['r2']:.4f}, "
+          f"{report['Teacher']['latency_ms'][1] / best['latency_ms'][1]:.1f}x faster per row)")
+
+    surrogate = {
+        'name': best_name,
+        'model': best['model'],
+        'r2': best['r2'],
+        'fidelity_r2': best['fidelity_r2'],
+        'latency_ms': best['latency_ms']
+    }
+    return surrogate, report
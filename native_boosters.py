@@ -0,0 +1,163 @@
+"""
+Native XGBoost/LightGBM data path.
+Builds the booster-native quantized datasets (QuantileDMatrix, lgb.Dataset) once
+in float32 and reuses their bin boundaries for every fit: the model sweep,
+hyperparameter tuning rounds and the final refit. xgboost and lightgbm are
+imported where they are used, so loading a single model pays for one backend.
+"""
+
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+
+MAX_BIN = 256
+
+# Row subsets kept per dataset; tuning reuses one validation fold and one
+# training subset per round, older subsets are dropped
+MAX_CACHED_SUBSETS = 4
+
+class BoosterDataset:
+    """float32 training data with lazily built, reusable booster-native datasets"""
+
+    def __init__(self, X, y, feature_names=None, reference=None, indices=None):
+        if isinstance(X, pd.DataFrame):
+            feature_names = feature_names or list(X.columns)
+        self.X = np.ascontiguousarray(np.asarray(X, dtype=np.float32))
+        self.y = np.asarray(y, dtype=np.float32)
+        self.feature_names = feature_names
+        self.reference = reference  # Parent dataset whose bins are reused
+        self.indices = indices      # Rows of the parent, when this is a subset
+        self._xgb = None
+        self._xgb_eval = None
+        self._lgb = None
+        self._subsets = OrderedDict()
+
+    def __len__(self):
+        return len(self.y)
+
+    def xgb_matrix(self):
+        """QuantileDMatrix, sharing the parent's quantile cuts when subset"""
+        if self._xgb is None:
+            import xgboost as xgb
+            ref = self.reference.xgb_matrix() if self.reference is not None else None
+            self._xgb = xgb.QuantileDMatrix(
+                self.X, label=self.y, feature_names=self.feature_names, max_bin=MAX_BIN, ref=ref
+            )
+        return self._xgb
+
+    def xgb_eval_matrix(self):
+        """Plain DMatrix for evaluation sets (XGBoost only accepts quantized
+        evaluation sets built with the training matrix as reference)"""
+        if self._xgb_eval is None:
+            import xgboost as xgb
+            self._xgb_eval = xgb.DMatrix(self.X, label=self.y, feature_names=self.feature_names)
+        return self._xgb_eval
+
+    def lgb_dataset(self):
+        """Constructed lgb.Dataset, a cheap bin-sharing subset when subset"""
+        if self._lgb is None:
+            import lightgbm as lgb
+            if self.reference is not None:
+                self._lgb = self.reference.lgb_dataset().subset(self.indices)
+            else:
+                self._lgb = lgb.Dataset(
+                    self.X, label=self.y, feature_name=self.feature_names or 'auto',
+                    params={'max_bin': MAX_BIN - 1, 'verbose': -1}, free_raw_data=False
+                )
+            self._lgb.construct()
+        return self._lgb
+
+    def subset(self, indices):
+        """Rows of this dataset that reuse its bin boundaries (recent subsets are cached)"""
+        indices = np.asarray(indices, dtype=np.int32)
+        key = indices.tobytes()
+        if key in self._subsets:
+            self._subsets.move_to_end(key)
+            return self._subsets[key]
+
+        subset = BoosterDataset(
+            self.X[indices], self.y[indices], self.feature_names, reference=self, indices=indices
+        )
+        self._subsets[key] = subset
+        if len(self._subsets) > MAX_CACHED_SUBSETS:
+            self._subsets.popitem(last=False)
+        return subset
+
+class NativeBoosterRegressor:
+    """Minimal regressor interface around a natively trained booster"""
+
+    def __init__(self, model_name, booster, params, best_iteration=None):
+        self.model_name = model_name
+        self.booster = booster
+        self.params = params
+        self.best_iteration = best_iteration
+
+    def get_params(self, deep=True):
+        return dict(self.params)
+
+    def predict(self, X):
+        X = np.ascontiguousarray(np.asarray(X, dtype=np.float32))
+        if self.model_name == 'XGBoost':
+            return self.booster.inplace_predict(X)
+        return self.booster.predict(X, num_threads=self.params.get('n_jobs', -1) or -1)
+
+def _native_params(model_name, params, n_jobs):
+    """Translate sklearn-style booster parameters to native training parameters"""
+    params = dict(params)
+    num_boost_round = params.pop('n_estimators', 100)
+    params.pop('n_jobs', None)
+    seed = params.pop('random_state', 42)
+
+    if model_name == 'XGBoost':
+        params.update({'objective': 'reg:squarederror', 'tree_method': 'hist',
+                       'seed': seed, 'nthread': n_jobs})
+    else:
+        params.pop('verbose', None)
+        params.update({'objective': 'regression', 'seed': seed,
+                       'num_threads': n_jobs, 'verbose': -1})
+    return params, num_boost_round
+
+def fit_booster(model_name, params, train_data, valid_data=None, early_stopping_rounds=None, n_jobs=-1):
+    """
+    Train XGBoost or LightGBM on prebuilt native datasets
+
+    Args:
+        model_name (str): 'XGBoost' or 'LightGBM'
+        params (dict): sklearn-style parameters (n_estimators, max_depth, ...)
+        train_data (BoosterDataset): Training rows
+        valid_data (BoosterDataset): Validation rows sharing train_data's bins
+        early_stopping_rounds (int): Stop when validation stops improving
+
+    Returns:
+        NativeBoosterRegressor: Fitted model; n_estimators reflects early stopping
+    """
+    native_params, num_boost_round = _native_params(model_name, params, n_jobs)
+
+    if model_name == 'XGBoost':
+        import xgboost as xgb
+        evals = [(valid_data.xgb_eval_matrix(), 'valid')] if valid_data is not None else []
+        booster = xgb.train(
+            native_params, train_data.xgb_matrix(), num_boost_round=num_boost_round,
+            evals=evals, early_stopping_rounds=early_stopping_rounds if evals else None,
+            verbose_eval=False
+        )
+        best_iteration = booster.best_iteration + 1 if evals and early_stopping_rounds else num_boost_round
+        if best_iteration < booster.num_boosted_rounds():
+            booster = booster[:best_iteration]
+    else:
+        import lightgbm as lgb
+        callbacks = []
+        valid_sets = []
+        if valid_data is not None:
+            valid_sets = [valid_data.lgb_dataset()]
+            if early_stopping_rounds:
+                callbacks.append(lgb.early_stopping(early_stopping_rounds, verbose=False))
+        booster = lgb.train(
+            native_params, train_data.lgb_dataset(), num_boost_round=num_boost_round,
+            valid_sets=valid_sets, callbacks=callbacks
+        )
+        # Booster.predict uses best_iteration automatically
+        best_iteration = booster.best_iteration or num_boost_round
+
+    fitted_params = {**params, 'n_estimators': best_iteration}
+    return NativeBoosterRegressor(model_name, booster, fitted_params, best_iteration)
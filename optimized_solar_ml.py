@@ -1,444 +1,888 @@
-import pandas as pd
-import numpy as np
-from sklearn.model_selection import train_test_split, cross_val_score, RandomizedSearchCV
-from sklearn.preprocessing import StandardScaler, RobustScaler
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor, VotingRegressor
-from sklearn.linear_model import Ridge, ElasticNet
-from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
-import xgboost as xgb
-import lightgbm as lgb
-import pickle
-import warnings
-warnings.filterwarnings('ignore')
-
-def advanced_feature_engineering(df):
-    """Create advanced features for better model performance"""
-    print("🔧 Creating advanced features...")
-    
-    # Convert to datetime
-    df['DATE_TIME'] = pd.to_datetime(df['DATE_TIME'])
-    
-    # Basic time features
-    df['HOUR'] = df['DATE_TIME'].dt.hour
-    df['DAY'] = df['DATE_TIME'].dt.day
-    df['MONTH'] = df['DATE_TIME'].dt.month
-    df['WEEKDAY'] = df['DATE_TIME'].dt.weekday
-    df['DAYOFYEAR'] = df['DATE_TIME'].dt.dayofyear
-    
-    # Cyclical encoding for time features
-    df['HOUR_SIN'] = np.sin(2 * np.pi * df['HOUR'] / 24)
-    df['HOUR_COS'] = np.cos(2 * np.pi * df['HOUR'] / 24)
-    df['DAY_SIN'] = np.sin(2 * np.pi * df['DAY'] / 31)
-    df['DAY_COS'] = np.cos(2 * np.pi * df['DAY'] / 31)
-    df['MONTH_SIN'] = np.sin(2 * np.pi * df['MONTH'] / 12)
-    df['MONTH_COS'] = np.cos(2 * np.pi * df['MONTH'] / 12)
-    
-    # Temperature features
-    df['TEMP_DIFF'] = df['MODULE_TEMPERATURE'] - df['AMBIENT_TEMPERATURE']
-    df['TEMP_RATIO'] = df['MODULE_TEMPERATURE'] / (df['AMBIENT_TEMPERATURE'] + 1e-8)
-    df['TEMP_SQUARE'] = df['AMBIENT_TEMPERATURE'] ** 2
-    df['MODULE_TEMP_SQUARE'] = df['MODULE_TEMPERATURE'] ** 2
-    
-    # Irradiation features
-    df['IRRADIATION_SQUARE'] = df['IRRADIATION'] ** 2
-    df['IRRADIATION_SQRT'] = np.sqrt(df['IRRADIATION'] + 1e-8)
-    df['IRRADIATION_LOG'] = np.log1p(df['IRRADIATION'])
-    
-    # Interaction features
-    df['IRR_TEMP_INTERACTION'] = df['IRRADIATION'] * df['AMBIENT_TEMPERATURE']
-    df['IRR_MODULE_TEMP_INTERACTION'] = df['IRRADIATION'] * df['MODULE_TEMPERATURE']
-    df['TEMP_INTERACTION'] = df['AMBIENT_TEMPERATURE'] * df['MODULE_TEMPERATURE']
-    
-    # Power efficiency features
-    df['EFFICIENCY'] = df['AC_POWER'] / (df['IRRADIATION'] + 1e-8)
-    df['DC_EFFICIENCY'] = df['DC_POWER'] / (df['IRRADIATION'] + 1e-8)
-    
-    # Rolling features (if we have time series data)
-    df = df.sort_values('DATE_TIME')
-    df['IRRADIATION_MA_3'] = df['IRRADIATION'].rolling(window=3, min_periods=1).mean()
-    df['TEMP_MA_3'] = df['AMBIENT_TEMPERATURE'].rolling(window=3, min_periods=1).mean()
-    
-    # Lag features
-    df['IRRADIATION_LAG1'] = df['IRRADIATION'].shift(1)
-    df['TEMP_LAG1'] = df['AMBIENT_TEMPERATURE'].shift(1)
-    df['AC_POWER_LAG1'] = df['AC_POWER'].shift(1)
-    
-    # Fill NaN values from lag features
-    df['IRRADIATION_LAG1'].fillna(df['IRRADIATION'], inplace=True)
-    df['TEMP_LAG1'].fillna(df['AMBIENT_TEMPERATURE'], inplace=True)
-    df['AC_POWER_LAG1'].fillna(df['AC_POWER'], inplace=True)
-    
-    # Weather conditions
-    df['IS_DAYLIGHT'] = (df['IRRADIATION'] > 0).astype(int)
-    df['IS_HIGH_IRRADIATION'] = (df['IRRADIATION'] > df['IRRADIATION'].quantile(0.8)).astype(int)
-    df['IS_HOT'] = (df['AMBIENT_TEMPERATURE'] > df['AMBIENT_TEMPERATURE'].quantile(0.8)).astype(int)
-    
-    # Seasonal features
-    df['IS_SUMMER'] = df['MONTH'].isin([6, 7, 8]).astype(int)
-    df['IS_WINTER'] = df['MONTH'].isin([12, 1, 2]).astype(int)
-    df['IS_WEEKEND'] = df['WEEKDAY'].isin([5, 6]).astype(int)
-    
-    print(f"✅ Created {len(df.columns)} features")
-    return df
-
-def load_and_prepare_optimized_data():
-    """Load and prepare optimized solar data"""
-    print("🔄 Loading and preparing optimized data...")
-    
-    # Load datasets
-    df1 = pd.read_csv('solar_merged_1.csv')
-    df2 = pd.read_csv('solar_merged_2.csv')
-    df = pd.concat([df1, df2], ignore_index=True)
-    
-    print(f"📊 Original dataset shape: {df.shape}")
-    
-    # Advanced feature engineering
-    df = advanced_feature_engineering(df)
-    
-    # Select features for modeling
-    feature_columns = [
-        # Original features
-        'IRRADIATION', 'AMBIENT_TEMPERATURE', 'MODULE_TEMPERATURE',
-        'HOUR', 'DAY', 'MONTH', 'WEEKDAY', 'DAYOFYEAR',
-        
-        # Cyclical features
-        'HOUR_SIN', 'HOUR_COS', 'DAY_SIN', 'DAY_COS', 'MONTH_SIN', 'MONTH_COS',
-        
-        # Temperature features
-        'TEMP_DIFF', 'TEMP_RATIO', 'TEMP_SQUARE', 'MODULE_TEMP_SQUARE',
-        
-        # Irradiation features
-        'IRRADIATION_SQUARE', 'IRRADIATION_SQRT', 'IRRADIATION_LOG',
-        
-        # Interaction features
-        'IRR_TEMP_INTERACTION', 'IRR_MODULE_TEMP_INTERACTION', 'TEMP_INTERACTION',
-        
-        # Efficiency features
-        'EFFICIENCY', 'DC_EFFICIENCY',
-        
-        # Rolling features
-        'IRRADIATION_MA_3', 'TEMP_MA_3',
-        
-        # Lag features
-        'IRRADIATION_LAG1', 'TEMP_LAG1', 'AC_POWER_LAG1',
-        
-        # Weather conditions
-        'IS_DAYLIGHT', 'IS_HIGH_IRRADIATION', 'IS_HOT',
-        
-        # Seasonal features
-        'IS_SUMMER', 'IS_WINTER', 'IS_WEEKEND'
-    ]
-    
-    # Target variable
-    target_column = 'AC_POWER'
-    
-    # Prepare features and target
-    X = df[feature_columns].copy()
-    y = df[target_column].copy()
-    
-    # Remove any missing values
-    mask = ~(X.isnull().any(axis=1) | y.isnull())
-    X = X[mask]
-    y = y[mask]
-    
-    print(f"📊 Optimized dataset shape: X={X.shape}, y={y.shape}")
-    print(f"🎯 Features used: {len(feature_columns)}")
-    
-    return X, y, feature_columns, target_column
-
-def train_optimized_models(X, y):
-    """Train optimized models with memory efficiency"""
-    print("\n🔄 Training optimized models...")
-    
-    # Split the data
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-    
-    # Use RobustScaler for better outlier handling
-    scaler = RobustScaler()
-    X_train_scaled = scaler.fit_transform(X_train)
-    X_test_scaled = scaler.transform(X_test)
-    
-    # Define optimized models (memory efficient)
-    models = {
-        'XGBoost': xgb.XGBRegressor(
-            n_estimators=1000,
-            max_depth=6,
-            learning_rate=0.1,
-            subsample=0.8,
-            colsample_bytree=0.8,
-            random_state=42,
-            n_jobs=-1
-        ),
-        'LightGBM': lgb.LGBMRegressor(
-            n_estimators=1000,
-            max_depth=6,
-            learning_rate=0.1,
-            subsample=0.8,
-            colsample_bytree=0.8,
-            random_state=42,
-            n_jobs=-1,
-            verbose=-1
-        ),
-        'Random Forest': RandomForestRegressor(
-            n_estimators=300,  # Reduced for memory efficiency
-            max_depth=15,
-            min_samples_split=5,
-            min_samples_leaf=2,
-            random_state=42,
-            n_jobs=-1
-        ),
-        'Gradient Boosting': GradientBoostingRegressor(
-            n_estimators=300,  # Reduced for memory efficiency
-            max_depth=6,
-            learning_rate=0.1,
-            subsample=0.8,
-            random_state=42
-        ),
-        'Elastic Net': ElasticNet(
-            alpha=0.1,
-            l1_ratio=0.5,
-            random_state=42,
-            max_iter=2000
-        )
-    }
-    
-    results = {}
-    
-    for name, model in models.items():
-        print(f"\n🔄 Training {name}...")
-        
-        # Use scaled data for linear models
-        if name in ['Elastic Net']:
-            model.fit(X_train_scaled, y_train)
-            y_pred = model.predict(X_test_scaled)
-        else:
-            model.fit(X_train, y_train)
-            y_pred = model.predict(X_test)
-        
-        # Calculate metrics
-        mse = mean_squared_error(y_test, y_pred)
-        rmse = np.sqrt(mse)
-        mae = mean_absolute_error(y_test, y_pred)
-        r2 = r2_score(y_test, y_pred)
-        
-        # Calculate accuracy (percentage of predictions within 5% of actual value)
-        accuracy = np.mean(np.abs((y_test - y_pred) / (y_test + 1e-8)) <= 0.05) * 100
-        
-        results[name] = {
-            'model': model,
-            'mse': mse,
-            'rmse': rmse,
-            'mae': mae,
-            'r2': r2,
-            'accuracy': accuracy,
-            'y_pred': y_pred
-        }
-        
-        print(f"✅ {name} - R²: {r2:.4f}, RMSE: {rmse:.2f}, MAE: {mae:.2f}, Accuracy: {accuracy:.2f}%")
-    
-    return results, X_test, y_test, scaler
-
-def create_ensemble_models(X_train, y_train, X_test, y_test, scaler):
-    """Create ensemble models for better performance"""
-    print("\n🔄 Creating ensemble models...")
-    
-    # Individual models for ensemble (memory efficient)
-    rf = RandomForestRegressor(n_estimators=200, max_depth=15, random_state=42, n_jobs=-1)
-    xgb_model = xgb.XGBRegressor(n_estimators=500, max_depth=6, learning_rate=0.1, random_state=42, n_jobs=-1)
-    lgb_model = lgb.LGBMRegressor(n_estimators=500, max_depth=6, learning_rate=0.1, random_state=42, n_jobs=-1, verbose=-1)
-    gb = GradientBoostingRegressor(n_estimators=200, max_depth=6, learning_rate=0.1, random_state=42)
-    
-    # Voting Regressor
-    voting_regressor = VotingRegressor([
-        ('rf', rf),
-        ('xgb', xgb_model),
-        ('lgb', lgb_model),
-        ('gb', gb)
-    ])
-    
-    ensemble_models = {
-        'Voting Ensemble': voting_regressor
-    }
-    
-    results = {}
-    
-    for name, model in ensemble_models.items():
-        print(f"\n🔄 Training {name}...")
-        
-        model.fit(X_train, y_train)
-        y_pred = model.predict(X_test)
-        
-        # Calculate metrics
-        mse = mean_squared_error(y_test, y_pred)
-        rmse = np.sqrt(mse)
-        mae = mean_absolute_error(y_test, y_pred)
-        r2 = r2_score(y_test, y_pred)
-        accuracy = np.mean(np.abs((y_test - y_pred) / (y_test + 1e-8)) <= 0.05) * 100
-        
-        results[name] = {
-            'model': model,
-            'mse': mse,
-            'rmse': rmse,
-            'mae': mae,
-            'r2': r2,
-            'accuracy': accuracy,
-            'y_pred': y_pred
-        }
-        
-        print(f"✅ {name} - R²: {r2:.4f}, RMSE: {rmse:.2f}, MAE: {mae:.2f}, Accuracy: {accuracy:.2f}%")
-    
-    return results
-
-def hyperparameter_tuning_optimized(best_model_name, X_train, y_train):
-    """Optimized hyperparameter tuning"""
-    print(f"\n🔄 Optimized hyperparameter tuning for {best_model_name}...")
-    
-    if best_model_name == 'XGBoost':
-        param_grid = {
-            'n_estimators': [500, 1000],
-            'max_depth': [4, 6, 8],
-            'learning_rate': [0.05, 0.1, 0.15],
-            'subsample': [0.8, 0.9],
-            'colsample_bytree': [0.8, 0.9]
-        }
-        model = xgb.XGBRegressor(random_state=42, n_jobs=-1)
-    elif best_model_name == 'LightGBM':
-        param_grid = {
-            'n_estimators': [500, 1000],
-            'max_depth': [4, 6, 8],
-            'learning_rate': [0.05, 0.1, 0.15],
-            'subsample': [0.8, 0.9],
-            'colsample_bytree': [0.8, 0.9]
-        }
-        model = lgb.LGBMRegressor(random_state=42, n_jobs=-1, verbose=-1)
-    elif best_model_name == 'Random Forest':
-        param_grid = {
-            'n_estimators': [200, 300, 400],
-            'max_depth': [10, 15, 20],
-            'min_samples_split': [2, 5],
-            'min_samples_leaf': [1, 2]
-        }
-        model = RandomForestRegressor(random_state=42, n_jobs=-1)
-    else:
-        print("⚠️ Hyperparameter tuning not implemented for this model")
-        return None
-    
-    # Use RandomizedSearchCV for faster tuning
-    random_search = RandomizedSearchCV(
-        model, param_grid, n_iter=10, cv=3, scoring='r2', 
-        n_jobs=-1, random_state=42, verbose=1
-    )
-    random_search.fit(X_train, y_train)
-    
-    print(f"✅ Best parameters: {random_search.best_params_}")
-    print(f"✅ Best cross-validation R²: {random_search.best_score_:.4f}")
-    
-    return random_search.best_estimator_
-
-def save_optimized_model_and_results(best_model, scaler, feature_columns, target_column, all_results, X_test, y_test):
-    """Save the optimized model and results"""
-    print(f"\n💾 Saving optimized model and results...")
-    
-    # Save the best model
-    model_data = {
-        'model': best_model,
-        'scaler': scaler,
-        'feature_columns': feature_columns,
-        'target_column': target_column,
-        'model_type': 'optimized_solar_prediction'
-    }
-    
-    with open('optimized_solar_power_model.pkl', 'wb') as f:
-        pickle.dump(model_data, f)
-    
-    print("✅ Optimized model saved as 'optimized_solar_power_model.pkl'")
-    
-    # Save results summary
-    results_df = pd.DataFrame({
-        'Model': list(all_results.keys()),
-        'R² Score': [all_results[model]['r2'] for model in all_results.keys()],
-        'RMSE': [all_results[model]['rmse'] for model in all_results.keys()],
-        'MAE': [all_results[model]['mae'] for model in all_results.keys()],
-        'Accuracy (%)': [all_results[model]['accuracy'] for model in all_results.keys()]
-    }).sort_values('R² Score', ascending=False)
-    
-    results_df.to_csv('optimized_model_evaluation_results.csv', index=False)
-    print("✅ Optimized results saved as 'optimized_model_evaluation_results.csv'")
-    
-    return results_df
-
-def main():
-    """Main function for optimized ML pipeline"""
-    print("🚀 Starting Optimized Solar Power Prediction ML Pipeline")
-    print("=" * 60)
-    
-    # Load and prepare optimized data
-    X, y, feature_columns, target_column = load_and_prepare_optimized_data()
-    
-    # Train optimized models
-    results, X_test, y_test, scaler = train_optimized_models(X, y)
-    
-    # Create ensemble models
-    X_train, X_test_split, y_train, y_test_split = train_test_split(X, y, test_size=0.2, random_state=42)
-    ensemble_results = create_ensemble_models(X_train, y_train, X_test_split, y_test_split, scaler)
-    
-    # Combine all results
-    all_results = {**results, **ensemble_results}
-    
-    # Find the best model
-    best_model_name = max(all_results.keys(), key=lambda x: all_results[x]['r2'])
-    best_model = all_results[best_model_name]['model']
-    best_r2 = all_results[best_model_name]['r2']
-    best_accuracy = all_results[best_model_name]['accuracy']
-    
-    print(f"\n🏆 Best Model: {best_model_name}")
-    print(f"🏆 Best R² Score: {best_r2:.4f}")
-    print(f"🏆 Best Accuracy: {best_accuracy:.2f}%")
-    
-    # Hyperparameter tuning for the best model if accuracy is below 90%
-    if best_accuracy < 90:
-        print(f"\n🎯 Current accuracy ({best_accuracy:.2f}%) is below target (90%), tuning hyperparameters...")
-        tuned_model = hyperparameter_tuning_optimized(best_model_name, X_train, y_train)
-        
-        if tuned_model is not None:
-            # Evaluate tuned model
-            if best_model_name in ['Elastic Net']:
-                X_train_scaled = scaler.fit_transform(X_train)
-                X_test_scaled = scaler.transform(X_test_split)
-                y_pred_tuned = tuned_model.predict(X_test_scaled)
-            else:
-                y_pred_tuned = tuned_model.predict(X_test_split)
-            
-            tuned_r2 = r2_score(y_test_split, y_pred_tuned)
-            tuned_accuracy = np.mean(np.abs((y_test_split - y_pred_tuned) / (y_test_split + 1e-8)) <= 0.05) * 100
-            
-            print(f"🎯 Tuned Model R²: {tuned_r2:.4f}")
-            print(f"🎯 Tuned Model Accuracy: {tuned_accuracy:.2f}%")
-            
-            # Use tuned model if it's better
-            if tuned_r2 > best_r2:
-                best_model = tuned_model
-                best_accuracy = tuned_accuracy
-                print("✅ Using tuned model as the final model")
-    else:
-        print(f"\n🎉 Target accuracy achieved! ({best_accuracy:.2f}% >= 90%)")
-    
-    # Save model and results
-    results_df = save_optimized_model_and_results(best_model, scaler, feature_columns, target_column, all_results, X_test, y_test)
-    
-    print("\n📊 Optimized Results Summary:")
-    print(results_df.to_string(index=False))
-    
-    print(f"\n🎉 Optimized pipeline completed successfully!")
-    print(f"📁 Files created:")
-    print(f"   - optimized_solar_power_model.pkl (optimized trained model)")
-    print(f"   - optimized_model_evaluation_results.csv (optimized evaluation results)")
-    
-    # Final accuracy check
-    if best_accuracy >= 80:
-        print(f"\n🎯 SUCCESS: Achieved target accuracy of {best_accuracy:.2f}% (target: 80-90%)")
-    else:
-        print(f"\n⚠️ WARNING: Accuracy {best_accuracy:.2f}% is below target (80-90%)")
-
-if __name__ == "__main__":
-    main()
+import pandas as pd
+import numpy as np
+from sklearn.model_selection import train_test_split, RandomizedSearchCV, ParameterSampler
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingRandomSearchCV
+from sklearn.preprocessing import RobustScaler
+from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from sklearn.linear_model import ElasticNet
+from sklearn.pipeline import make_pipeline
+from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
+import pickle
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from threadpoolctl import threadpool_limits
+from solar_ensembles import build_voting_ensemble
+from native_boosters import BoosterDataset, NativeBoosterRegressor, fit_booster
+from time_series_cv import time_series_cross_validate
+from model_distillation import distill_model
+from feature_selection import select_features
+from model_artifact import save_artifact
+from prediction_intervals import INTERVAL_QUANTILES, fit_quantile_booster, residual_quantiles
+warnings.filterwarnings('ignore')
+
+# Models trained on RobustScaler output instead of raw features
+SCALED_MODELS = ['Elastic Net']
+
+# Models that cannot use more than one core
+SINGLE_THREADED_MODELS = ['Gradient Boosting', 'Elastic Net']
+
+# Merged generation + weather datasets
+DATA_FILES = ['solar_merged_1.csv', 'solar_merged_2.csv']
+
+# Features used for modeling
+FEATURE_COLUMNS = [
+    # Original features
+    'IRRADIATION', 'AMBIENT_TEMPERATURE', 'MODULE_TEMPERATURE',
+    'HOUR', 'DAY', 'MONTH', 'WEEKDAY', 'DAYOFYEAR',
+    
+    # Cyclical features
+    'HOUR_SIN', 'HOUR_COS', 'DAY_SIN', 'DAY_COS', 'MONTH_SIN', 'MONTH_COS',
+    
+    # Temperature features
+    'TEMP_DIFF', 'TEMP_RATIO', 'TEMP_SQUARE', 'MODULE_TEMP_SQUARE',
+    
+    # Irradiation features
+    'IRRADIATION_SQUARE', 'IRRADIATION_SQRT', 'IRRADIATION_LOG',
+    
+    # Interaction features
+    'IRR_TEMP_INTERACTION', 'IRR_MODULE_TEMP_INTERACTION', 'TEMP_INTERACTION',
+    
+    # Efficiency features
+    'EFFICIENCY', 'DC_EFFICIENCY',
+    
+    # Rolling features
+    'IRRADIATION_MA_3', 'TEMP_MA_3',
+    
+    # Lag features
+    'IRRADIATION_LAG1', 'TEMP_LAG1', 'AC_POWER_LAG1',
+    
+    # Weather conditions
+    'IS_DAYLIGHT', 'IS_HIGH_IRRADIATION', 'IS_HOT',
+    
+    # Seasonal features
+    'IS_SUMMER', 'IS_WINTER', 'IS_WEEKEND'
+]
+
+# Target variable
+TARGET_COLUMN = 'AC_POWER'
+
+# Features computed from the target or the DC power measured with it; they
+# are unknown at prediction time, so feature selection never considers them
+TARGET_DERIVED_FEATURES = ['EFFICIENCY', 'DC_EFFICIENCY', 'AC_POWER_LAG1']
+
+# Booster parameters, shared by the sklearn wrappers and the native data path
+BOOSTER_PARAMS = {
+    'XGBoost': {
+        'n_estimators': 1000,
+        'max_depth': 6,
+        'learning_rate': 0.1,
+        'subsample': 0.8,
+        'colsample_bytree': 0.8,
+        'random_state': 42,
+        'n_jobs': -1
+    },
+    'LightGBM': {
+        'n_estimators': 1000,
+        'max_depth': 6,
+        'learning_rate': 0.1,
+        'subsample': 0.8,
+        'colsample_bytree': 0.8,
+        'random_state': 42,
+        'n_jobs': -1,
+        'verbose': -1
+    }
+}
+
+# Boosters trained on prebuilt float32 native datasets (see native_boosters.py)
+NATIVE_BOOSTERS = ['XGBoost', 'LightGBM']
+
+# Relative training cost, used to split cores between concurrent fits
+MODEL_COST_WEIGHTS = {
+    'XGBoost': 3,
+    'LightGBM': 2,
+    'Random Forest': 4,
+    'Gradient Boosting': 3,
+    'Elastic Net': 1
+}
+
+def advanced_feature_engineering(df):
+    """Create advanced features for better model performance"""
+    print("🔧 Creating advanced features...")
+    
+    # Convert to datetime
+    df['DATE_TIME'] = pd.to_datetime(df['DATE_TIME'])
+    
+    # Basic time features
+    df['HOUR'] = df['DATE_TIME'].dt.hour
+    df['DAY'] = df['DATE_TIME'].dt.day
+    df['MONTH'] = df['DATE_TIME'].dt.month
+    df['WEEKDAY'] = df['DATE_TIME'].dt.weekday
+    df['DAYOFYEAR'] = df['DATE_TIME'].dt.dayofyear
+    
+    # Cyclical encoding for time features
+    df['HOUR_SIN'] = np.sin(2 * np.pi * df['HOUR'] / 24)
+    df['HOUR_COS'] = np.cos(2 * np.pi * df['HOUR'] / 24)
+    df['DAY_SIN'] = np.sin(2 * np.pi * df['DAY'] / 31)
+    df['DAY_COS'] = np.cos(2 * np.pi * df['DAY'] / 31)
+    df['MONTH_SIN'] = np.sin(2 * np.pi * df['MONTH'] / 12)
+    df['MONTH_COS'] = np.cos(2 * np.pi * df['MONTH'] / 12)
+    
+    # Temperature features
+    df['TEMP_DIFF'] = df['MODULE_TEMPERATURE'] - df['AMBIENT_TEMPERATURE']
+    df['TEMP_RATIO'] = df['MODULE_TEMPERATURE'] / (df['AMBIENT_TEMPERATURE'] + 1e-8)
+    df['TEMP_SQUARE'] = df['AMBIENT_TEMPERATURE'] ** 2
+    df['MODULE_TEMP_SQUARE'] = df['MODULE_TEMPERATURE'] ** 2
+    
+    # Irradiation features
+    df['IRRADIATION_SQUARE'] = df['IRRADIATION'] ** 2
+    df['IRRADIATION_SQRT'] = np.sqrt(df['IRRADIATION'] + 1e-8)
+    df['IRRADIATION_LOG'] = np.log1p(df['IRRADIATION'])
+    
+    # Interaction features
+    df['IRR_TEMP_INTERACTION'] = df['IRRADIATION'] * df['AMBIENT_TEMPERATURE']
+    df['IRR_MODULE_TEMP_INTERACTION'] = df['IRRADIATION'] * df['MODULE_TEMPERATURE']
+    df['TEMP_INTERACTION'] = df['AMBIENT_TEMPERATURE'] * df['MODULE_TEMPERATURE']
+    
+    # Power efficiency features
+    df['EFFICIENCY'] = df['AC_POWER'] / (df['IRRADIATION'] + 1e-8)
+    df['DC_EFFICIENCY'] = df['DC_POWER'] / (df['IRRADIATION'] + 1e-8)
+    
+    # Rolling features (if we have time series data)
+    df = df.sort_values('DATE_TIME')
+    df['IRRADIATION_MA_3'] = df['IRRADIATION'].rolling(window=3, min_periods=1).mean()
+    df['TEMP_MA_3'] = df['AMBIENT_TEMPERATURE'].rolling(window=3, min_periods=1).mean()
+    
+    # Lag features
+    df['IRRADIATION_LAG1'] = df['IRRADIATION'].shift(1)
+    df['TEMP_LAG1'] = df['AMBIENT_TEMPERATURE'].shift(1)
+    df['AC_POWER_LAG1'] = df['AC_POWER'].shift(1)
+    
+    # Fill NaN values from lag features
+    df['IRRADIATION_LAG1'].fillna(df['IRRADIATION'], inplace=True)
+    df['TEMP_LAG1'].fillna(df['AMBIENT_TEMPERATURE'], inplace=True)
+    df['AC_POWER_LAG1'].fillna(df['AC_POWER'], inplace=True)
+    
+    # Weather conditions
+    df['IS_DAYLIGHT'] = (df['IRRADIATION'] > 0).astype(int)
+    df['IS_HIGH_IRRADIATION'] = (df['IRRADIATION'] > df['IRRADIATION'].quantile(0.8)).astype(int)
+    df['IS_HOT'] = (df['AMBIENT_TEMPERATURE'] > df['AMBIENT_TEMPERATURE'].quantile(0.8)).astype(int)
+    
+    # Seasonal features
+    df['IS_SUMMER'] = df['MONTH'].isin([6, 7, 8]).astype(int)
+    df['IS_WINTER'] = df['MONTH'].isin([12, 1, 2]).astype(int)
+    df['IS_WEEKEND'] = df['WEEKDAY'].isin([5, 6]).astype(int)
+    
+    print(f"✅ Created {len(df.columns)} features")
+    return df
+
+def load_raw_optimized_data(data_files=None):
+    """Load and concatenate the merged solar datasets"""
+    data_files = data_files or DATA_FILES
+    df = pd.concat([pd.read_csv(path) for path in data_files], ignore_index=True)
+    
+    print(f"📊 Original dataset shape: {df.shape}")
+    return df
+
+def prepare_optimized_features(df):
+    """Engineer features and return the model matrix and target"""
+    # Advanced feature engineering
+    df = advanced_feature_engineering(df)
+    
+    # Prepare features and target
+    X = df[FEATURE_COLUMNS].copy()
+    y = df[TARGET_COLUMN].copy()
+    
+    # Remove any missing values
+    mask = ~(X.isnull().any(axis=1) | y.isnull())
+    X = X[mask]
+    y = y[mask]
+    
+    print(f"📊 Optimized dataset shape: X={X.shape}, y={y.shape}")
+    print(f"🎯 Features used: {len(FEATURE_COLUMNS)}")
+    
+    return X, y
+
+def load_and_prepare_optimized_data():
+    """Load and prepare optimized solar data"""
+    print("🔄 Loading and preparing optimized data...")
+    
+    # Load datasets
+    df = load_raw_optimized_data()
+    
+    X, y = prepare_optimized_features(df)
+    
+    return X, y, list(FEATURE_COLUMNS), TARGET_COLUMN
+
+def get_optimized_models():
+    """Define optimized models (memory efficient)"""
+    # Booster libraries are imported on first use, not at module import
+    import xgboost as xgb
+    import lightgbm as lgb
+    return {
+        'XGBoost': xgb.XGBRegressor(**BOOSTER_PARAMS['XGBoost']),
+        'LightGBM': lgb.LGBMRegressor(**BOOSTER_PARAMS['LightGBM']),
+        'Random Forest': RandomForestRegressor(
+            n_estimators=300,  # Reduced for memory efficiency
+            max_depth=15,
+            min_samples_split=5,
+            min_samples_leaf=2,
+            random_state=42,
+            n_jobs=-1
+        ),
+        'Gradient Boosting': GradientBoostingRegressor(
+            n_estimators=300,  # Reduced for memory efficiency
+            max_depth=6,
+            learning_rate=0.1,
+            subsample=0.8,
+            random_state=42
+        ),
+        'Elastic Net': ElasticNet(
+            alpha=0.1,
+            l1_ratio=0.5,
+            random_state=42,
+            max_iter=2000
+        )
+    }
+
+def calculate_metrics(y_test, y_pred):
+    """Calculate regression metrics for a set of predictions"""
+    mse = mean_squared_error(y_test, y_pred)
+    
+    return {
+        'mse': mse,
+        'rmse': np.sqrt(mse),
+        'mae': mean_absolute_error(y_test, y_pred),
+        'r2': r2_score(y_test, y_pred),
+        # Accuracy: percentage of predictions within 5% of actual value
+        'accuracy': np.mean(np.abs((y_test - y_pred) / (y_test + 1e-8)) <= 0.05) * 100
+    }
+
+def split_optimized_data(X, y, shuffle=True):
+    """
+    Train/test split plus RobustScaler-scaled copies for linear models
+    
+    Args:
+        shuffle (bool): False keeps time order, so the test set is the last
+            20% of rows (X and y sorted by time)
+    """
+    # Split the data
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42 if shuffle else None, shuffle=shuffle
+    )
+    
+    # Use RobustScaler for better outlier handling
+    scaler = RobustScaler()
+    
+    return {
+        'X_train': X_train,
+        'X_test': X_test,
+        'y_train': y_train,
+        'y_test': y_test,
+        'X_train_scaled': scaler.fit_transform(X_train),
+        'X_test_scaled': scaler.transform(X_test),
+        'scaler': scaler
+    }
+
+def fit_optimized_model(name, model, split, booster_data=None, booster_params=None):
+    """
+    Fit one candidate model on a split from split_optimized_data
+    
+    Boosters are trained natively on booster_data when it is given.
+    
+    Returns:
+        tuple: (fitted model, test-set predictions)
+    """
+    if booster_data is not None and name in NATIVE_BOOSTERS:
+        model = fit_booster(name, booster_params or BOOSTER_PARAMS[name], booster_data)
+        return model, model.predict(split['X_test'])
+    
+    # Use scaled data for linear models
+    if name in SCALED_MODELS:
+        model.fit(split['X_train_scaled'], split['y_train'])
+        return model, model.predict(split['X_test_scaled'])
+    
+    model.fit(split['X_train'], split['y_train'])
+    return model, model.predict(split['X_test'])
+
+def train_optimized_models(X, y, native_boosters=True, shuffle=True):
+    """
+    Train optimized models with memory efficiency
+    
+    Args:
+        native_boosters (bool): Train XGBoost/LightGBM on one float32 native
+            dataset built once and shared by both boosters
+        shuffle (bool): Shuffled test split, or the last 20% of rows when False
+    """
+    print("\n🔄 Training optimized models...")
+    
+    split = split_optimized_data(X, y, shuffle)
+    y_test = split['y_test']
+    
+    models = get_optimized_models()
+    booster_data = BoosterDataset(split['X_train'], split['y_train']) if native_boosters else None
+    
+    results = {}
+    
+    for name, model in models.items():
+        print(f"\n🔄 Training {name}...")
+        
+        model, y_pred = fit_optimized_model(name, model, split, booster_data)
+        
+        # Calculate metrics
+        metrics = calculate_metrics(y_test, y_pred)
+        results[name] = {'model': model, **metrics, 'y_pred': y_pred}
+        
+        print(f"✅ {name} - R²: {metrics['r2']:.4f}, RMSE: {metrics['rmse']:.2f}, MAE: {metrics['mae']:.2f}, Accuracy: {metrics['accuracy']:.2f}%")
+    
+    return results, split['X_train'], split['X_test'], split['y_train'], y_test, split['scaler']
+
+def allocate_cores(model_names, n_cores=None):
+    """
+    Split CPU cores between models in proportion to their expected training cost
+    
+    Single-threaded models always get one core. When there are fewer cores than
+    models every model gets one core and the pool runs them in waves.
+    
+    Returns:
+        dict: Model name -> number of threads
+    """
+    n_cores = n_cores or os.cpu_count() or 1
+    allocation = {name: 1 for name in model_names}
+    
+    spare_cores = n_cores - len(model_names)
+    threaded = [name for name in model_names if name not in SINGLE_THREADED_MODELS]
+    if spare_cores <= 0 or not threaded:
+        return allocation
+    
+    total_cost = sum(MODEL_COST_WEIGHTS.get(name, 1) for name in threaded)
+    for name in threaded:
+        allocation[name] += int(spare_cores * MODEL_COST_WEIGHTS.get(name, 1) / total_cost)
+    
+    # Hand out cores lost to rounding, most expensive models first
+    leftover = n_cores - sum(allocation.values())
+    for name in sorted(threaded, key=lambda n: -MODEL_COST_WEIGHTS.get(n, 1))[:leftover]:
+        allocation[name] += 1
+    
+    return allocation
+
+def _to_shared_memory(array):
+    """Copy an array into a new shared memory block"""
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+def _attach_shared_array(spec):
+    """Attach to a shared memory block created by _to_shared_memory (no copy)"""
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+def _fit_model_worker(name, model, n_threads, shared_specs, feature_columns, native_boosters):
+    """Worker: fit one model on the shared training matrix and score it"""
+    start = time.perf_counter()
+    handles = []
+    arrays = {}
+    X_fit = X_eval = booster_data = None
+    try:
+        for key, spec in shared_specs.items():
+            shm, arrays[key] = _attach_shared_array(spec)
+            handles.append(shm)
+        
+        if native_boosters and name in NATIVE_BOOSTERS:
+            # Bin the shared float32 matrix directly into the booster-native format
+            booster_data = BoosterDataset(arrays['X_train_f32'], arrays['y_train'], feature_columns)
+            model = fit_booster(name, BOOSTER_PARAMS[name], booster_data, n_jobs=n_threads)
+            return name, model, model.predict(arrays['X_test']), time.perf_counter() - start
+        
+        if name in SCALED_MODELS:
+            X_fit, X_eval = arrays['X_train_scaled'], arrays['X_test_scaled']
+        else:
+            # Wrap the shared buffers without copying to keep feature names on the model
+            X_fit = pd.DataFrame(arrays['X_train'], columns=feature_columns, copy=False)
+            X_eval = pd.DataFrame(arrays['X_test'], columns=feature_columns, copy=False)
+        
+        n_jobs = model.get_params().get('n_jobs')
+        if n_jobs is not None:
+            model.set_params(n_jobs=n_threads)
+        
+        with threadpool_limits(limits=n_threads):
+            model.fit(X_fit, arrays['y_train'])
+            y_pred = model.predict(X_eval)
+        
+        # Restore the configured thread count for later reuse and serving
+        if n_jobs is not None:
+            model.set_params(n_jobs=n_jobs)
+    finally:
+        # Drop every view on the shared buffers before detaching from them
+        arrays.clear()
+        X_fit = X_eval = booster_data = None
+        for shm in handles:
+            shm.close()
+    
+    return name, model, y_pred, time.perf_counter() - start
+
+def train_optimized_models_parallel(X, y, n_cores=None, native_boosters=True, shuffle=True):
+    """
+    Train the optimized models concurrently in a process pool
+    
+    The training and test matrices are placed in shared memory once so that no
+    worker copies them, and cores are split between models by expected cost so
+    the sweep never runs more threads than there are cores.
+    
+    Args:
+        shuffle (bool): Shuffled test split, or the last 20% of rows when False
+    
+    Returns:
+        Same as train_optimized_models: (results, X_train, X_test, y_train, y_test, scaler)
+    """
+    print("\n🔄 Training optimized models in parallel...")
+    
+    split = split_optimized_data(X, y, shuffle)
+    X_train, X_test, y_train, y_test = split['X_train'], split['X_test'], split['y_train'], split['y_test']
+    X_train_scaled, X_test_scaled, scaler = split['X_train_scaled'], split['X_test_scaled'], split['scaler']
+    
+    models = get_optimized_models()
+    n_cores = n_cores or os.cpu_count() or 1
+    allocation = allocate_cores(list(models.keys()), n_cores)
+    print(f"🧮 Core allocation ({n_cores} cores): {allocation}")
+    
+    shared_blocks = []
+    shared_specs = {}
+    try:
+        for key, array in {
+            'X_train': X_train.to_numpy(dtype=np.float64),
+            'X_test': X_test.to_numpy(dtype=np.float64),
+            'X_train_f32': X_train.to_numpy(dtype=np.float32),
+            'X_train_scaled': X_train_scaled,
+            'X_test_scaled': X_test_scaled,
+            'y_train': y_train.to_numpy(dtype=np.float64)
+        }.items():
+            shm, shared_specs[key] = _to_shared_memory(array)
+            shared_blocks.append(shm)
+        
+        # Launch the most expensive models first so cheap ones fill the gaps
+        order = sorted(models.keys(), key=lambda n: -MODEL_COST_WEIGHTS.get(n, 1))
+        max_workers = min(len(models), n_cores)
+        
+        results = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_fit_model_worker, name, models[name], allocation[name],
+                                shared_specs, list(X.columns), native_boosters)
+                for name in order
+            ]
+            for future in as_completed(futures):
+                name, model, y_pred, seconds = future.result()
+                metrics = calculate_metrics(y_test, y_pred)
+                results[name] = {'model': model, **metrics, 'y_pred': y_pred}
+                print(f"✅ {name} ({allocation[name]} threads, {seconds:.1f}s) - R²: {metrics['r2']:.4f}, RMSE: {metrics['rmse']:.2f}, MAE: {metrics['mae']:.2f}, Accuracy: {metrics['accuracy']:.2f}%")
+    finally:
+        for shm in shared_blocks:
+            shm.close()
+            shm.unlink()
+    
+    # Keep the same model order as the sequential trainer
+    results = {name: results[name] for name in models.keys()}
+    
+    return results, X_train, X_test, y_train, y_test, scaler
+
+def evaluate_models_time_series(X, y, n_splits=5, mode='expanding'):
+    """
+    Rank the candidate models by rolling-origin time-series CV
+    
+    X and y must be in time order (load_and_prepare_optimized_data sorts by
+    DATE_TIME). Folds run in parallel and reuse the same cached fold matrices
+    for every model.
+    """
+    print("\n🔄 Time-series cross-validation of candidate models...")
+    
+    cv_results = {}
+    for name, model in get_optimized_models().items():
+        if name in SCALED_MODELS:
+            model = make_pipeline(RobustScaler(), model)
+        cv_results[name] = time_series_cross_validate(model, X, y, n_splits=n_splits, mode=mode, name=name)
+    
+    return cv_results
+
+def create_ensemble_models(results, X_test, y_test):
+    """Create ensemble models from the already-fitted base models"""
+    print("\n🔄 Creating ensemble models...")
+    
+    fitted_models = {name: result['model'] for name, result in results.items()}
+    
+    # Voting Regressor over the fitted base models (no retraining)
+    ensemble_models = {
+        'Voting Ensemble': build_voting_ensemble(
+            fitted_models, ['Random Forest', 'XGBoost', 'LightGBM', 'Gradient Boosting']
+        )
+    }
+    
+    ensemble_results = {}
+    
+    for name, model in ensemble_models.items():
+        print(f"\n🔄 Evaluating {name}...")
+        
+        y_pred = model.predict(X_test)
+        
+        # Calculate metrics
+        metrics = calculate_metrics(y_test, y_pred)
+        ensemble_results[name] = {'model': model, **metrics, 'y_pred': y_pred}
+        
+        print(f"✅ {name} - R²: {metrics['r2']:.4f}, RMSE: {metrics['rmse']:.2f}, MAE: {metrics['mae']:.2f}, Accuracy: {metrics['accuracy']:.2f}%")
+    
+    return ensemble_results
+
+def hyperparameter_tuning_optimized(best_model_name, X_train, y_train, mode='random', booster_data=None):
+    """
+    Optimized hyperparameter tuning
+    
+    Args:
+        mode (str): 'random' for RandomizedSearchCV, 'halving' for successive
+            halving with early stopping (see hyperparameter_tuning_halving)
+    """
+    if mode == 'halving':
+        return hyperparameter_tuning_halving(best_model_name, X_train, y_train, booster_data=booster_data)
+    
+    print(f"\n🔄 Optimized hyperparameter tuning for {best_model_name}...")
+    
+    if best_model_name == 'XGBoost':
+        param_grid = {
+            'n_estimators': [500, 1000],
+            'max_depth': [4, 6, 8],
+            'learning_rate': [0.05, 0.1, 0.15],
+            'subsample': [0.8, 0.9],
+            'colsample_bytree': [0.8, 0.9]
+        }
+        import xgboost as xgb
+        model = xgb.XGBRegressor(random_state=42, n_jobs=-1)
+    elif best_model_name == 'LightGBM':
+        param_grid = {
+            'n_estimators': [500, 1000],
+            'max_depth': [4, 6, 8],
+            'learning_rate': [0.05, 0.1, 0.15],
+            'subsample': [0.8, 0.9],
+            'colsample_bytree': [0.8, 0.9]
+        }
+        import lightgbm as lgb
+        model = lgb.LGBMRegressor(random_state=42, n_jobs=-1, verbose=-1)
+    elif best_model_name == 'Random Forest':
+        param_grid = {
+            'n_estimators': [200, 300, 400],
+            'max_depth': [10, 15, 20],
+            'min_samples_split': [2, 5],
+            'min_samples_leaf': [1, 2]
+        }
+        model = RandomForestRegressor(random_state=42, n_jobs=-1)
+    else:
+        print("⚠️ Hyperparameter tuning not implemented for this model")
+        return None
+    
+    # Use RandomizedSearchCV for faster tuning
+    random_search = RandomizedSearchCV(
+        model, param_grid, n_iter=10, cv=3, scoring='r2', 
+        n_jobs=-1, random_state=42, verbose=1
+    )
+    random_search.fit(X_train, y_train)
+    
+    print(f"✅ Best parameters: {random_search.best_params_}")
+    print(f"✅ Best cross-validation R²: {random_search.best_score_:.4f}")
+    
+    return random_search.best_estimator_
+
+def hyperparameter_tuning_halving(best_model_name, X_train, y_train, n_candidates=27, 
+                                  min_rows=500, eta=3, early_stopping_rounds=50, booster_data=None):
+    """
+    Successive-halving hyperparameter tuning with early stopping
+    
+    Every candidate starts on min_rows training rows; after each round only the
+    best 1/eta candidates survive and get eta times more rows. Boosters stop
+    adding trees once the validation fold stops improving, so weak
+    configurations are dropped after a few hundred rows and trees.
+    
+    Boosters train on booster_data (a BoosterDataset of X_train/y_train); every
+    round and the final refit reuse its bins instead of re-quantizing.
+    """
+    print(f"\n🔄 Successive-halving hyperparameter tuning for {best_model_name}...")
+    
+    if best_model_name == 'Random Forest':
+        # No early stopping for forests, let sklearn halve over samples
+        param_grid = {
+            'n_estimators': [200, 300, 400],
+            'max_depth': [10, 15, 20],
+            'min_samples_split': [2, 5],
+            'min_samples_leaf': [1, 2]
+        }
+        halving_search = HalvingRandomSearchCV(
+            RandomForestRegressor(random_state=42, n_jobs=-1), param_grid,
+            n_candidates=n_candidates, factor=eta, resource='n_samples',
+            min_resources=min_rows, cv=3, scoring='r2', random_state=42, verbose=1
+        )
+        halving_search.fit(X_train, y_train)
+        
+        print(f"✅ Best parameters: {halving_search.best_params_}")
+        print(f"✅ Best cross-validation R²: {halving_search.best_score_:.4f}")
+        return halving_search.best_estimator_
+    
+    if best_model_name not in ['XGBoost', 'LightGBM']:
+        print("⚠️ Hyperparameter tuning not implemented for this model")
+        return None
+    
+    param_grid = {
+        'n_estimators': [1000],  # Upper bound, early stopping picks the real count
+        'max_depth': [4, 6, 8],
+        'learning_rate': [0.05, 0.1, 0.15],
+        'subsample': [0.8, 0.9],
+        'colsample_bytree': [0.8, 0.9]
+    }
+    candidates = list(ParameterSampler(param_grid, n_iter=n_candidates, random_state=42))
+    
+    if booster_data is None:
+        booster_data = BoosterDataset(X_train, y_train)
+    
+    # Hold out a validation fold for early stopping and ranking
+    fit_idx, val_idx = train_test_split(np.arange(len(booster_data)), test_size=0.2, random_state=42)
+    valid_data = booster_data.subset(val_idx)
+    
+    n_rows = min(min_rows, len(fit_idx))
+    round_number = 0
+    while True:
+        round_number += 1
+        print(f"🔄 Round {round_number}: {len(candidates)} candidates on {n_rows} rows")
+        
+        round_data = booster_data.subset(fit_idx[:n_rows])
+        scored = []
+        for params in candidates:
+            model = fit_booster(
+                best_model_name, params, round_data, valid_data, early_stopping_rounds
+            )
+            score = r2_score(valid_data.y, model.predict(valid_data.X))
+            scored.append((score, model.best_iteration, params))
+        
+        scored.sort(key=lambda item: item[0], reverse=True)
+        
+        # Keep the best 1/eta candidates and give them eta times more rows
+        n_survivors = max(1, len(scored) // eta)
+        if n_survivors == 1 or n_rows >= len(fit_idx):
+            break
+        candidates = [params for _, _, params in scored[:n_survivors]]
+        n_rows = min(n_rows * eta, len(fit_idx))
+    
+    best_score, best_iteration, best_params = scored[0]
+    if n_rows < len(fit_idx):
+        # The last round ran on a subset; early-stop the winner once more on
+        # all fit rows so the tree count matches the size of the refit
+        print(f"🔄 Final round: 1 candidate on {len(fit_idx)} rows")
+        model = fit_booster(
+            best_model_name, best_params, booster_data.subset(fit_idx), valid_data, early_stopping_rounds
+        )
+        best_score = r2_score(valid_data.y, model.predict(valid_data.X))
+        best_iteration = model.best_iteration
+    best_params = {**best_params, 'n_estimators': best_iteration}
+    
+    print(f"✅ Best parameters: {best_params}")
+    print(f"✅ Best validation R²: {best_score:.4f}")
+    
+    # Refit on the full training set with the early-stopped tree count
+    return fit_booster(best_model_name, best_params, booster_data)
+
+def fit_interval_models(best_model, best_model_name, scaler, X_train, y_train, X_test, y_test,
+                        surrogate=None, booster_data=None):
+    """
+    Interval models for the final model and its surrogate
+    
+    Held-out residual quantiles for any model (and separately for the
+    surrogate, which has its own errors), plus native quantile models with
+    the final model's fitted parameters when it is a booster.
+    
+    Returns:
+        dict: Entries merged into the saved model file
+    """
+    X_test_final = scaler.transform(X_test) if best_model_name in SCALED_MODELS else X_test
+    intervals = {
+        'interval_quantiles': list(INTERVAL_QUANTILES),
+        'residual_quantiles': residual_quantiles(y_test, best_model.predict(X_test_final))
+    }
+    if surrogate is not None:
+        # Surrogates are trained on raw features
+        intervals['surrogate_residual_quantiles'] = residual_quantiles(
+            y_test, surrogate['model'].predict(np.asarray(X_test, dtype=np.float32))
+        )
+    if best_model_name in NATIVE_BOOSTERS:
+        # Tuned boosters keep their own (early-stopped) parameters
+        params = best_model.params if isinstance(best_model, NativeBoosterRegressor) else BOOSTER_PARAMS[best_model_name]
+        intervals['quantile_model'] = fit_quantile_booster(
+            best_model_name, params, booster_data if booster_data is not None else BoosterDataset(X_train, y_train)
+        )
+    return intervals
+
+def save_optimized_model_and_results(best_model, scaler, feature_columns, target_column, all_results, X_test, y_test,
+                                     surrogate=None, intervals=None):
+    """Save the optimized model (with its distilled surrogate and interval models, if any) and results"""
+    print(f"\n💾 Saving optimized model and results...")
+    
+    # Save the best model
+    model_data = {
+        'model': best_model,
+        'scaler': scaler,
+        'feature_columns': feature_columns,
+        'target_column': target_column,
+        'model_type': 'optimized_solar_prediction'
+    }
+    
+    # Compact model for latency-critical serving, trained on raw features
+    if surrogate is not None:
+        model_data['surrogate'] = surrogate
+    
+    # Quantile model and residual quantiles for prediction intervals
+    if intervals is not None:
+        model_data.update(intervals)
+    
+    with open('optimized_solar_power_model.pkl', 'wb') as f:
+        pickle.dump(model_data, f)
+    
+    print("✅ Optimized model saved as 'optimized_solar_power_model.pkl'")
+    
+    # Quantized, memory-mappable copy for serving
+    artifact_size = save_artifact(model_data, 'optimized_solar_power_model.artifact')
+    print(f"✅ Quantized artifact saved as 'optimized_solar_power_model.artifact' "
+          f"({artifact_size / 1e6:.1f} MB vs {os.path.getsize('optimized_solar_power_model.pkl') / 1e6:.1f} MB pickle)")
+    
+    # Save results summary
+    results_df = pd.DataFrame({
+        'Model': list(all_results.keys()),
+        'R² Score': [all_results[model]['r2'] for model in all_results.keys()],
+        'RMSE': [all_results[model]['rmse'] for model in all_results.keys()],
+        'MAE': [all_results[model]['mae'] for model in all_results.keys()],
+        'Accuracy (%)': [all_results[model]['accuracy'] for model in all_results.keys()]
+    }).sort_values('R² Score', ascending=False)
+    
+    results_df.to_csv('optimized_model_evaluation_results.csv', index=False)
+    print("✅ Optimized results saved as 'optimized_model_evaluation_results.csv'")
+    
+    return results_df
+
+def main(model_selection='holdout', prune_features=False):
+    """
+    Main function for optimized ML pipeline
+    
+    Args:
+        model_selection (str): 'holdout' picks the best model by test-split R²,
+            'time_series' by rolling-origin cross-validation R² and fits the
+            final model on a time-ordered split
+        prune_features (bool): Train on the smallest importance-ranked set of
+            servable features within R² tolerance of them (see feature_selection.py)
+    """
+    print("🚀 Starting Optimized Solar Power Prediction ML Pipeline")
+    print("=" * 60)
+    
+    # Load and prepare optimized data
+    X, y, feature_columns, target_column = load_and_prepare_optimized_data()
+    
+    # Drop features that do not pay for their inference cost
+    if prune_features:
+        feature_columns = select_features(X, y)['selected']
+        X = X[feature_columns]
+    
+    # Time-series selection also keeps the final test split in time order
+    time_ordered = model_selection == 'time_series'
+    
+    # Train optimized models concurrently
+    results, X_train, X_test, y_train, y_test, scaler = train_optimized_models_parallel(
+        X, y, shuffle=not time_ordered
+    )
+    
+    # Create ensemble models from the fitted base models
+    ensemble_results = create_ensemble_models(results, X_test, y_test)
+    
+    # Combine all results
+    all_results = {**results, **ensemble_results}
+    
+    # Find the best model, reporting the metrics it was selected by
+    if time_ordered:
+        cv_results = evaluate_models_time_series(X, y)
+        best_model_name = max(cv_results.keys(), key=lambda x: cv_results[x]['r2_mean'])
+        best_r2 = cv_results[best_model_name]['r2_mean']
+        best_accuracy = cv_results[best_model_name]['accuracy_mean']
+        metric_source = "time-series CV"
+    else:
+        best_model_name = max(all_results.keys(), key=lambda x: all_results[x]['r2'])
+        best_r2 = all_results[best_model_name]['r2']
+        best_accuracy = all_results[best_model_name]['accuracy']
+        metric_source = "holdout"
+    best_model = all_results[best_model_name]['model']
+    holdout_r2 = all_results[best_model_name]['r2']
+    
+    print(f"\n🏆 Best Model: {best_model_name}")
+    print(f"🏆 Best R² Score ({metric_source}): {best_r2:.4f}")
+    print(f"🏆 Best Accuracy ({metric_source}): {best_accuracy:.2f}%")
+    
+    # Native booster dataset is binned once and reused by every tuning round, the
+    # refit and the quantile models (the sweep's copies live in its worker processes)
+    booster_data = BoosterDataset(X_train, y_train) if best_model_name in NATIVE_BOOSTERS else None
+    
+    # Hyperparameter tuning for the best model if accuracy is below 90%
+    if best_accuracy < 90:
+        print(f"\n🎯 Current accuracy ({best_accuracy:.2f}%) is below target (90%), tuning hyperparameters...")
+        tuned_model = hyperparameter_tuning_optimized(
+            best_model_name, X_train, y_train, mode='halving', booster_data=booster_data
+        )
+        
+        if tuned_model is not None:
+            # Evaluate tuned model
+            if best_model_name in ['Elastic Net']:
+                X_train_scaled = scaler.fit_transform(X_train)
+                X_test_scaled = scaler.transform(X_test)
+                y_pred_tuned = tuned_model.predict(X_test_scaled)
+            else:
+                y_pred_tuned = tuned_model.predict(X_test)
+            
+            tuned_r2 = r2_score(y_test, y_pred_tuned)
+            tuned_accuracy = np.mean(np.abs((y_test - y_pred_tuned) / (y_test + 1e-8)) <= 0.05) * 100
+            
+            print(f"🎯 Tuned Model R²: {tuned_r2:.4f}")
+            print(f"🎯 Tuned Model Accuracy: {tuned_accuracy:.2f}%")
+            
+            # Use tuned model if it's better on the same test split
+            if tuned_r2 > holdout_r2:
+                best_model = tuned_model
+                best_accuracy = tuned_accuracy
+                print("✅ Using tuned model as the final model")
+    else:
+        print(f"\n🎉 Target accuracy achieved! ({best_accuracy:.2f}% >= 90%)")
+    
+    # Distill the final model into a compact surrogate for low-latency serving
+    surrogate, _ = distill_model(
+        best_model, X_train, X_test, y_test,
+        teacher_scaler=scaler if best_model_name in SCALED_MODELS else None
+    )
+    
+    # Interval bounds: held-out residual quantiles for any model, native quantile models for boosters
+    intervals = fit_interval_models(best_model, best_model_name, scaler, X_train, y_train, X_test, y_test,
+                                    surrogate=surrogate, booster_data=booster_data)
+    
+    # Save model and results
+    results_df = save_optimized_model_and_results(best_model, scaler, feature_columns, target_column, all_results, X_test, y_test,
+                                                  surrogate=surrogate, intervals=intervals)
+    
+    print("\n📊 Optimized Results Summary:")
+    print(results_df.to_string(index=False))
+    
+    print(f"\n🎉 Optimized pipeline completed successfully!")
+    print(f"📁 Files created:")
+    print(f"   - optimized_solar_power_model.pkl (optimized trained model)")
+    print(f"   - optimized_solar_power_model.artifact (quantized model for serving)")
+    print(f"   - optimized_model_evaluation_results.csv (optimized evaluation results)")
+    
+    # Final accuracy check
+    if best_accuracy >= 80:
+        print(f"\n🎯 SUCCESS: Achieved target accuracy of {best_accuracy:.2f}% (target: 80-90%)")
+    else:
+        print(f"\n⚠️ WARNING: Accuracy {best_accuracy:.2f}% is below target (80-90%)")
+
+if __name__ == "__main__":
+    main()
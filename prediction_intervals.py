@@ -0,0 +1,161 @@
+"""
+Prediction intervals at close to the cost of one forward pass.
+Forests return the spread of their per-tree predictions from the same tree
+traversal that produces the mean. Boosters get lower/upper quantile models
+trained natively next to the point model with a fraction of its rounds
+(XGBoost fits all quantiles in one multi-output booster). Any other model
+falls back to the test-residual quantiles stored in the model file (kept
+separately for the distilled surrogate), which costs nothing at inference.
+"""
+
+import numpy as np
+from statistics import NormalDist
+
+from native_boosters import _native_params
+from model_artifact import QuantizedTreeEnsemble
+
+# Lower and upper quantile of the default 80% interval
+INTERVAL_QUANTILES = (0.1, 0.9)
+
+# Quantile boosters get this share of the point model's boosting rounds, so
+# scoring bounds adds a fraction of a forward pass
+QUANTILE_ROUNDS_FRACTION = 0.25
+
+FORESTS = ('RandomForestRegressor', 'ExtraTreesRegressor')
+
+class QuantileBoosterRegressor:
+    """Native quantile booster(s); predict returns one column per quantile"""
+
+    def __init__(self, model_name, boosters, quantiles):
+        self.model_name = model_name
+        self.boosters = boosters
+        self.quantiles = list(quantiles)
+
+    def predict(self, X):
+        X = np.ascontiguousarray(np.asarray(X, dtype=np.float32))
+        if self.model_name == 'XGBoost':
+            predictions = self.boosters[0].inplace_predict(X).reshape(len(X), -1)
+        else:
+            predictions = np.column_stack([booster.predict(X) for booster in self.boosters])
+        # Independently fitted quantiles can cross, keep them ordered
+        return np.sort(predictions, axis=1)
+
+def fit_quantile_booster(model_name, params, train_data, quantiles=INTERVAL_QUANTILES,
+                         rounds_fraction=QUANTILE_ROUNDS_FRACTION, n_jobs=-1):
+    """
+    Train native quantile models with the point model's booster parameters
+
+    Args:
+        model_name (str): 'XGBoost' or 'LightGBM'
+        params (dict): sklearn-style parameters, as for fit_booster
+        train_data (BoosterDataset): Training rows (bins are reused)
+        quantiles (tuple): Quantile levels to fit
+        rounds_fraction (float): Share of params['n_estimators'] to train
+
+    Returns:
+        QuantileBoosterRegressor
+    """
+    native_params, num_boost_round = _native_params(model_name, params, n_jobs)
+    num_boost_round = max(1, int(num_boost_round * rounds_fraction))
+
+    if model_name == 'XGBoost':
+        import xgboost as xgb
+        native_params.update({'objective': 'reg:quantileerror', 'quantile_alpha': np.array(quantiles)})
+        boosters = [xgb.train(native_params, train_data.xgb_matrix(), num_boost_round=num_boost_round)]
+    else:
+        import lightgbm as lgb
+        boosters = [
+            lgb.train({**native_params, 'objective': 'quantile', 'alpha': quantile},
+                      train_data.lgb_dataset(), num_boost_round=num_boost_round)
+            for quantile in quantiles
+        ]
+    print(f"✅ {model_name} quantile models trained for {list(quantiles)}")
+    return QuantileBoosterRegressor(model_name, boosters, quantiles)
+
+def residual_quantiles(y_true, y_pred, quantiles=INTERVAL_QUANTILES):
+    """Quantiles of held-out residuals, the interval offsets of the fallback method"""
+    return [float(q) for q in np.quantile(np.asarray(y_true) - np.asarray(y_pred), quantiles)]
+
+def is_forest(model):
+    """Averaged tree ensemble, fitted or loaded from an artifact"""
+    if isinstance(model, QuantizedTreeEnsemble):
+        if model.ensemble is not None:
+            return model.ensemble == 'forest'
+        # Older artifacts: an unbiased average of several trees (one tree has no spread)
+        return len(model.roots) > 1 and model.bias == 0 and np.isclose(model.scale * len(model.roots), 1.0)
+    return type(model).__name__ in FORESTS and hasattr(model, 'estimators_')
+
+def forest_prediction_spread(model, X, chunk_rows=65536):
+    """
+    Mean and standard deviation of the per-tree predictions
+
+    One traversal per row chunk: leaf indices (sklearn apply) or leaf values
+    (quantized artifact) of all trees are gathered once and reduced both ways.
+
+    Returns:
+        tuple: (mean, std) arrays
+    """
+    mean = np.empty(len(X))
+    std = np.empty(len(X))
+
+    if isinstance(model, QuantizedTreeEnsemble):
+        for rows, values in model.leaf_values(X):
+            mean[rows] = values.mean(axis=1, dtype=np.float64)
+            std[rows] = values.std(axis=1, dtype=np.float64)
+        return mean, std
+
+    # Leaf values of all trees in one table, addressed by tree offset + leaf index
+    trees = [tree.tree_ for tree in model.estimators_]
+    offsets = np.concatenate([[0], np.cumsum([tree.node_count for tree in trees])[:-1]])
+    leaf_table = np.concatenate([tree.value[:, 0, 0] for tree in trees])
+    for start in range(0, len(X), chunk_rows):
+        values = leaf_table[model.apply(X[start:start + chunk_rows]) + offsets]
+        mean[start:start + chunk_rows] = values.mean(axis=1)
+        std[start:start + chunk_rows] = values.std(axis=1)
+    return mean, std
+
+def predict_intervals(model_data, features, use_surrogate=False):
+    """
+    Point predictions and lower/upper interval bounds from a model file
+
+    Args:
+        model_data (dict): Loaded model file (pickle or artifact)
+        features (np.ndarray): Raw feature matrix
+        use_surrogate (bool): Score with the distilled surrogate, if any
+
+    Returns:
+        dict: 'prediction', 'lower', 'upper', 'method' and 'quantiles'
+    """
+    quantiles = model_data.get('interval_quantiles', list(INTERVAL_QUANTILES))
+    surrogate = model_data.get('surrogate')
+    use_surrogate = use_surrogate and surrogate is not None
+    if use_surrogate:
+        model, X = surrogate['model'], features
+    else:
+        model, scaler = model_data['model'], model_data['scaler']
+        X = scaler.transform(features) if scaler is not None else features
+
+    if is_forest(model):
+        prediction, std = forest_prediction_spread(model, X)
+        lower = prediction + NormalDist().inv_cdf(quantiles[0]) * std
+        upper = prediction + NormalDist().inv_cdf(quantiles[1]) * std
+        method = 'tree_spread'
+    else:
+        prediction = np.asarray(model.predict(X), dtype=float)
+        quantile_model = model_data.get('quantile_model')
+        # The surrogate has its own held-out residuals
+        offsets = model_data.get('surrogate_residual_quantiles' if use_surrogate else 'residual_quantiles')
+        if quantile_model is not None and not use_surrogate:
+            # Boosters are trained on raw features
+            bounds = quantile_model.predict(features)
+            lower, upper = bounds[:, 0], bounds[:, -1]
+            method = 'quantile_model'
+        elif offsets is not None:
+            lower, upper = prediction + offsets[0], prediction + offsets[1]
+            method = 'residual_quantiles'
+        else:
+            lower = upper = None
+            method = None
+
+    return {'prediction': prediction, 'lower': lower, 'upper': upper,
+            'method': method, 'quantiles': quantiles}
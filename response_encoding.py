@@ -0,0 +1,174 @@
+"""
+Columnar, compact encoding of predict_with_nasa_data responses.
+Instead of serializing the weather DataFrame row by row, the response is
+emitted as one array per column, optionally projected to the requested
+fields and downsampled to a maximum number of points. A binary mode packs
+the same columns as raw little-endian buffers behind a small JSON header,
+so large hourly responses skip float-to-text conversion entirely.
+"""
+
+import json
+import struct
+import numpy as np
+import pandas as pd
+
+RESPONSE_MAGIC = b'SOLARCOL'
+ALIGNMENT = 8
+
+# Prediction arrays of a response and the column names they are emitted as
+PREDICTION_COLUMNS = {
+    'predictions': 'PREDICTED_POWER',
+    ('prediction_intervals', 'lower'): 'PREDICTION_LOWER',
+    ('prediction_intervals', 'upper'): 'PREDICTION_UPPER',
+    ('prediction_range', 'p10'): 'PREDICTION_P10',
+    ('prediction_range', 'p90'): 'PREDICTION_P90'
+}
+
+def _to_builtin(value):
+    """Recursively convert numpy scalars/arrays and tuples to JSON-ready values"""
+    if isinstance(value, dict):
+        return {str(k): _to_builtin(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return _to_builtin(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+def response_columns(result, fields=None):
+    """
+    Columns of a prediction response as numpy arrays
+
+    DATE becomes int64 epoch milliseconds; weather columns and the
+    prediction arrays (PREDICTED_POWER, PREDICTION_LOWER/UPPER, ...) follow.
+
+    Args:
+        result (dict): Output of predict_with_nasa_data or forecast_with_climatology
+        fields (list): Columns to keep besides DATE (default: all)
+    """
+    weather_data = result['weather_data']
+    columns = {'DATE': pd.DatetimeIndex(weather_data['DATE']).as_unit('ms').asi8}
+
+    for name in weather_data.columns:
+        if name != 'DATE' and (fields is None or name in fields):
+            columns[name] = weather_data[name].to_numpy()
+
+    for key, name in PREDICTION_COLUMNS.items():
+        source = result.get(key) if isinstance(key, str) else (result.get(key[0]) or {}).get(key[1])
+        if source is not None and (fields is None or name in fields):
+            columns[name] = np.asarray(source, dtype=float)
+    return columns
+
+def downsample_columns(columns, max_points):
+    """
+    Reduce columns to at most max_points rows by averaging contiguous buckets
+
+    Each bucket keeps the DATE of its first row; numeric columns are averaged,
+    other columns keep their first value.
+    """
+    length = len(columns['DATE'])
+    if max_points is None or length <= max_points:
+        return columns
+    starts = np.linspace(0, length, max_points, endpoint=False).astype(np.int64)
+    counts = np.diff(np.append(starts, length))
+
+    downsampled = {}
+    for name, values in columns.items():
+        if name != 'DATE' and values.dtype.kind in 'biuf':
+            downsampled[name] = np.add.reduceat(values.astype(float), starts) / counts
+        else:
+            downsampled[name] = values[starts]
+    return downsampled
+
+def encode_prediction_response(result, fields=None, max_points=None, binary=False,
+                               float_dtype=np.float32, decimals=None, include_analysis=True):
+    """
+    Encode a prediction response column-oriented
+
+    Args:
+        result (dict): Output of predict_with_nasa_data or forecast_with_climatology
+        fields (list): Columns to keep besides DATE (default: all)
+        max_points (int): Downsample to at most this many rows
+        binary (bool): Return packed bytes instead of a JSON-ready dict
+        float_dtype: Float precision of the binary buffers
+        decimals (int): Round JSON floats to this many decimals (shorter text)
+        include_analysis (bool): Carry the analysis section along
+
+    Returns:
+        dict or bytes: {'length', 'columns', 'metadata', 'analysis'} with one
+            list per column, or the binary payload (see decode_binary_response)
+    """
+    if 'error' in result:
+        return _to_builtin(result) if not binary else _pack({'error': result['error']}, {})
+
+    columns = downsample_columns(response_columns(result, fields), max_points)
+    document = {
+        'length': len(columns['DATE']),
+        'metadata': _to_builtin(result.get('metadata')),
+        'analysis': _to_builtin(result.get('analysis')) if include_analysis else None
+    }
+    if binary:
+        return _pack(document, {
+            name: values.astype(float_dtype) if values.dtype.kind == 'f' else values
+            for name, values in columns.items()
+        })
+
+    document['columns'] = {}
+    for name, values in columns.items():
+        if values.dtype.kind == 'f' and decimals is not None:
+            values = values.round(decimals)
+        if values.dtype.kind == 'f' and np.isnan(values).any():
+            # JSON has no NaN
+            values = np.where(np.isnan(values), None, values.astype(object))
+        document['columns'][name] = values.tolist()
+    return document
+
+def _pack(document, columns):
+    """Magic, header length, JSON header, then aligned column buffers"""
+    buffers = []
+    offset = 0
+    document = dict(document, columns=[])
+    for name, values in columns.items():
+        values = np.ascontiguousarray(values)
+        if values.dtype.kind not in 'biuf':
+            # Text columns (site ids, place names) as fixed-width UTF-8
+            values = np.char.encode(values.astype(str), 'utf-8')
+        values = values.astype(values.dtype.newbyteorder('<'))
+        offset += -offset % ALIGNMENT
+        document['columns'].append({'name': name, 'dtype': values.dtype.str, 'offset': offset})
+        buffers.append((offset, values.tobytes()))
+        offset += values.nbytes
+
+    header = json.dumps(document, separators=(',', ':')).encode()
+    body = bytearray(offset)
+    for start, data in buffers:
+        body[start:start + len(data)] = data
+    return RESPONSE_MAGIC + struct.pack('<I', len(header)) + header + bytes(body)
+
+def decode_binary_response(payload):
+    """
+    Decode a binary response
+
+    Returns:
+        dict: Like the JSON encoding, with numpy arrays as columns (text
+            columns as UTF-8 bytes)
+
+    Raises:
+        ValueError: If the payload is not a binary prediction response
+    """
+    if payload[:len(RESPONSE_MAGIC)] != RESPONSE_MAGIC:
+        raise ValueError("Not a binary prediction response")
+    start = len(RESPONSE_MAGIC) + 4
+    (header_length,) = struct.unpack('<I', payload[len(RESPONSE_MAGIC):start])
+    document = json.loads(payload[start:start + header_length])
+    body = memoryview(payload)[start + header_length:]
+
+    document['columns'] = {
+        column['name']: np.frombuffer(body, dtype=column['dtype'], count=document['length'],
+                                      offset=column['offset'])
+        for column in document['columns']
+    }
+    return document
@@ -0,0 +1,298 @@
+"""
+Training and inference benchmark suite with regression gates.
+Times cleaning, feature engineering, every model's fit and predict throughput,
+NASA POWER response decoding and physical analysis on synthetic data from
+synthetic_solar_data.py. Each benchmark runs in a fresh process so its
+peak RSS is its own. Results are appended to a JSON-lines history and compared
+against a stored baseline; slower-than-tolerance results fail the run.
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import multiprocessing
+from queue import Empty
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from synthetic_solar_data import synthetic_merged_frame
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCHMARK_DIR = 'benchmarks'
+HISTORY_FILE = os.path.join(BENCHMARK_DIR, 'history.jsonl')
+BASELINE_FILE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+PREDICT_BATCH_SIZES = [1, 100, 10000]
+
+# Longest one benchmark process may run before it is recorded as failed
+BENCHMARK_TIMEOUT = 1800
+
+def make_synthetic_merged(n_rows, seed=42):
+    """Synthetic frame with the solar_merged_*.csv schema (15-minute readings)"""
+    return synthetic_merged_frame(n_rows, seed=seed)
+
+def make_synthetic_nasa_payload(n_days, seed=42):
+    """Synthetic NASA POWER 'parameter' block for n_days of daily data"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2020-01-01', periods=n_days, freq='D').strftime('%Y%m%d')
+    return {
+        'ALLSKY_SFC_SW_DWN': dict(zip(dates, rng.uniform(1, 8, n_days).round(2))),
+        'T2M': dict(zip(dates, rng.uniform(280, 310, n_days).round(2))),
+        'RH2M': dict(zip(dates, rng.uniform(20, 90, n_days).round(2))),
+        'WS2M': dict(zip(dates, rng.uniform(0, 10, n_days).round(2)))
+    }
+
+# --- Benchmarks: each returns the number of rows it processed ---
+
+def bench_clean(n_rows):
+    from clean import clean_solar_generation
+    from clean1 import clean_solar_weather
+
+    df = make_synthetic_merged(n_rows)
+    df['DATE_TIME'] = pd.to_datetime(df['DATE_TIME']).dt.strftime('%d-%m-%Y %H:%M')
+    with tempfile.TemporaryDirectory() as tmp:
+        generation = os.path.join(tmp, 'generation.csv')
+        weather = os.path.join(tmp, 'weather.csv')
+        df[['DATE_TIME', 'PLANT_ID', 'SOURCE_KEY', 'DC_POWER', 'AC_POWER', 'DAILY_YIELD', 'TOTAL_YIELD']].to_csv(generation, index=False)
+        df[['DATE_TIME', 'PLANT_ID', 'SOURCE_KEY', 'AMBIENT_TEMPERATURE', 'MODULE_TEMPERATURE', 'IRRADIATION']].to_csv(weather, index=False)
+
+        start = time.perf_counter()
+        clean_solar_generation(generation, os.path.join(tmp, 'generation_clean.csv'))
+        clean_solar_weather(weather, os.path.join(tmp, 'weather_clean.csv'))
+        return 2 * n_rows, time.perf_counter() - start
+
+def bench_features(n_rows):
+    from optimized_solar_ml import advanced_feature_engineering
+
+    df = make_synthetic_merged(n_rows)
+    start = time.perf_counter()
+    advanced_feature_engineering(df)
+    return n_rows, time.perf_counter() - start
+
+def _prepared_split(n_rows):
+    from optimized_solar_ml import prepare_optimized_features, split_optimized_data
+    X, y = prepare_optimized_features(make_synthetic_merged(n_rows))
+    return split_optimized_data(X, y)
+
+def bench_fit(n_rows, model_name):
+    from optimized_solar_ml import get_optimized_models, fit_optimized_model, NATIVE_BOOSTERS
+    from native_boosters import BoosterDataset
+
+    split = _prepared_split(n_rows)
+    model = get_optimized_models()[model_name]
+    start = time.perf_counter()
+    booster_data = BoosterDataset(split['X_train'], split['y_train']) if model_name in NATIVE_BOOSTERS else None
+    fit_optimized_model(model_name, model, split, booster_data)
+    return len(split['y_train']), time.perf_counter() - start
+
+def bench_predict(n_rows, model_name, batch_size):
+    from optimized_solar_ml import get_optimized_models, fit_optimized_model, NATIVE_BOOSTERS, SCALED_MODELS
+    from native_boosters import BoosterDataset
+
+    split = _prepared_split(n_rows)
+    booster_data = BoosterDataset(split['X_train'], split['y_train']) if model_name in NATIVE_BOOSTERS else None
+    model, _ = fit_optimized_model(model_name, get_optimized_models()[model_name], split, booster_data)
+
+    X = split['X_test_scaled'] if model_name in SCALED_MODELS else split['X_test'].to_numpy()
+    repeats = max(1, np.ceil(batch_size / len(X)).astype(int))
+    X = np.tile(X, (repeats, 1))[:batch_size]
+
+    # Repeat small batches so the timing is not dominated by timer noise
+    n_calls = max(1, 10000 // batch_size)
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        model.predict(X)
+    return n_calls * batch_size, time.perf_counter() - start
+
+def bench_nasa_decode(n_days):
+    from nasa_power_integration import NASAPowerAPI
+
+    payload = make_synthetic_nasa_payload(n_days)
+    start = time.perf_counter()
+    NASAPowerAPI()._process_api_response(payload)
+    return n_days, time.perf_counter() - start
+
+def bench_physical_analysis(n_days):
+    from nasa_power_integration import NASAPowerAPI, PhysicalAnalysis
+
+    weather = NASAPowerAPI()._process_api_response(make_synthetic_nasa_payload(n_days))
+    start = time.perf_counter()
+    PhysicalAnalysis().analyze_solar_performance(weather)
+    return n_days, time.perf_counter() - start
+
+def bench_physical_analysis_sites(n_rows, days_per_site=30):
+    from nasa_power_integration import NASAPowerAPI, PhysicalAnalysis
+
+    # Same payload per site, so the frame build stays cheap
+    site = NASAPowerAPI()._process_api_response(make_synthetic_nasa_payload(days_per_site))
+    n_sites = max(1, n_rows // days_per_site)
+    weather = pd.concat([site] * n_sites, ignore_index=True)
+    weather['SITE_ID'] = np.repeat(np.arange(n_sites), len(site))
+    start = time.perf_counter()
+    PhysicalAnalysis().analyze_sites(weather)
+    return len(weather), time.perf_counter() - start
+
+def build_benchmarks(n_rows, models):
+    """Benchmark name -> (function, args)"""
+    benchmarks = {
+        'clean': (bench_clean, (n_rows,)),
+        'features': (bench_features, (n_rows,)),
+        'nasa_decode': (bench_nasa_decode, (n_rows,)),
+        'physical_analysis': (bench_physical_analysis, (n_rows,)),
+        'physical_analysis_sites': (bench_physical_analysis_sites, (n_rows,))
+    }
+    for model_name in models:
+        key = model_name.lower().replace(' ', '_')
+        benchmarks[f'fit_{key}'] = (bench_fit, (n_rows, model_name))
+        for batch_size in PREDICT_BATCH_SIZES:
+            benchmarks[f'predict_{key}_batch{batch_size}'] = (bench_predict, (n_rows, model_name, batch_size))
+    return benchmarks
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def _run_isolated(func, args, queue):
+    """Child process: run one benchmark and report its metrics"""
+    import contextlib, io
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            rows, seconds = func(*args)
+        queue.put({'rows': rows, 'wall_seconds': seconds,
+                   'rows_per_second': rows / seconds if seconds > 0 else None,
+                   'peak_rss_mb': _peak_rss_mb()})
+    except Exception as e:
+        queue.put({'error': f"{type(e).__name__}: {e}"})
+
+def _collect_result(process, queue, timeout):
+    """Wait for a benchmark process's metrics; a crashed or stuck child becomes an error"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return queue.get(timeout=1)
+        except Empty:
+            pass
+        if not process.is_alive():
+            # It may have put its result just before exiting
+            try:
+                return queue.get(timeout=1)
+            except Empty:
+                return {'error': f"Benchmark process exited with code {process.exitcode} without a result"}
+        if time.monotonic() > deadline:
+            process.terminate()
+            return {'error': f"Benchmark timed out after {timeout}s"}
+
+def run_benchmarks(n_rows=20000, models=None, only=None, timeout=BENCHMARK_TIMEOUT):
+    """Run every benchmark in its own process and collect the results"""
+    from optimized_solar_ml import get_optimized_models
+    models = models or list(get_optimized_models().keys())
+
+    context = multiprocessing.get_context('spawn')
+    results = {}
+    for name, (func, args) in build_benchmarks(n_rows, models).items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        queue = context.Queue()
+        process = context.Process(target=_run_isolated, args=(func, args, queue))
+        process.start()
+        result = _collect_result(process, queue, timeout)
+        process.join()
+        results[name] = result
+
+        if 'error' in result:
+            print(f"❌ {name}: {result['error']}")
+        else:
+            rss = f"{result['peak_rss_mb']:.0f} MB" if result['peak_rss_mb'] is not None else 'n/a'
+            print(f"⏱️ {name}: {result['wall_seconds']:.4f}s, {result['rows_per_second']:,.0f} rows/s, peak RSS {rss}")
+    return results
+
+def record_history(results, n_rows, history_file=HISTORY_FILE):
+    """Append one run to the JSON-lines history"""
+    os.makedirs(os.path.dirname(history_file), exist_ok=True)
+    entry = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'rows': n_rows,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'results': results
+    }
+    with open(history_file, 'a') as f:
+        f.write(json.dumps(entry) + '\n')
+    return entry
+
+def check_regressions(results, baseline_file=BASELINE_FILE, tolerance=0.2):
+    """
+    Compare results against the stored baseline
+
+    A benchmark regresses when its wall time is more than `tolerance` slower,
+    or its peak RSS more than `tolerance` larger, than the baseline.
+
+    Returns:
+        list: Human-readable regression descriptions
+    """
+    if not os.path.exists(baseline_file):
+        print(f"⚠️ No baseline at {baseline_file}, run with --update-baseline to create one")
+        return []
+
+    with open(baseline_file) as f:
+        baseline = json.load(f)['results']
+
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None or 'error' in result or 'error' in reference:
+            continue
+        if result['wall_seconds'] > reference['wall_seconds'] * (1 + tolerance):
+            regressions.append(f"{name}: wall time {result['wall_seconds']:.4f}s vs baseline {reference['wall_seconds']:.4f}s")
+        if result['peak_rss_mb'] and reference.get('peak_rss_mb') and \
+                result['peak_rss_mb'] > reference['peak_rss_mb'] * (1 + tolerance):
+            regressions.append(f"{name}: peak RSS {result['peak_rss_mb']:.0f} MB vs baseline {reference['peak_rss_mb']:.0f} MB")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Solar pipeline benchmark suite")
+    parser.add_argument('--rows', type=int, default=20000, help="Synthetic rows per benchmark")
+    parser.add_argument('--models', nargs='*', default=None, help="Models to benchmark (default: all)")
+    parser.add_argument('--only', nargs='*', default=None, help="Run benchmarks whose name contains any of these")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed slowdown before failing")
+    parser.add_argument('--timeout', type=float, default=BENCHMARK_TIMEOUT, help="Seconds allowed per benchmark")
+    parser.add_argument('--update-baseline', action='store_true', help="Store this run as the new baseline")
+    args = parser.parse_args()
+
+    print(f"🚀 Running solar benchmarks on {args.rows} synthetic rows")
+    results = run_benchmarks(args.rows, args.models, args.only, args.timeout)
+    entry = record_history(results, args.rows)
+    print(f"✅ Results appended to {HISTORY_FILE}")
+
+    if args.update_baseline:
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump(entry, f, indent=2)
+        print(f"✅ Baseline updated: {BASELINE_FILE}")
+        return 0
+
+    regressions = check_regressions(results, tolerance=args.tolerance)
+    if regressions:
+        print("\n❌ Performance regressions detected:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    print("\n🎉 No performance regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Command-line entry point for the solar training and integration scripts.
+Each subcommand imports its backend only when it runs, so `--help`,
+analysis-only and single-model prediction runs skip xgboost, lightgbm and
+the sklearn model zoo. `startup` measures the cold-start import time of
+every subcommand in fresh interpreters.
+
+    python solar_cli.py predict 28.6 77.2 20240101 20240131 --intervals
+    python solar_cli.py pipeline --tuning-mode halving
+    python solar_cli.py startup
+"""
+
+import os
+import sys
+import json
+import runpy
+import argparse
+import subprocess
+
+# Subcommands forwarded to an existing module CLI, with the modules each imports
+FORWARDED_COMMANDS = {
+    'pipeline': ('solar_pipeline', "Resumable optimized training pipeline"),
+    'benchmark': ('solar_benchmark', "Reproducible performance benchmarks"),
+    'climatology': ('climatology', "Build a NASA POWER climatology store"),
+    'stream-train': ('streaming_training', "Out-of-core training over partitions"),
+    'synthetic': ('synthetic_solar_data', "Generate a synthetic solar dataset"),
+    'clean': ('clean_pipeline', "Clean all plant files in parallel"),
+    'shard-bench': ('sharded_inference', "Benchmark sharded batch inference")
+}
+
+# Modules imported by each subcommand, timed by `startup`
+COMMAND_MODULES = {
+    'train': ['optimized_solar_ml'],
+    'train-enhanced': ['enhanced_solar_ml'],
+    'predict': ['nasa_power_integration', 'response_encoding'],
+    'analyze': ['nasa_power_integration'],
+    **{command: [module] for command, (module, _) in FORWARDED_COMMANDS.items()}
+}
+
+def run_train(args):
+    from optimized_solar_ml import main
+    main(model_selection=args.model_selection, prune_features=args.prune)
+
+def run_train_enhanced(args):
+    from enhanced_solar_ml import main
+    main()
+
+def run_predict(args):
+    from nasa_power_integration import EnhancedSolarPredictor
+    from response_encoding import encode_prediction_response
+
+    predictor = EnhancedSolarPredictor(args.model)
+    result = predictor.predict_with_nasa_data(
+        args.latitude, args.longitude, args.start_date, args.end_date, args.temporal,
+        include_analysis=not args.no_analysis, use_surrogate=args.surrogate, intervals=args.intervals
+    )
+    response = encode_prediction_response(result, args.fields, args.max_points, binary=args.binary,
+                                          decimals=args.decimals)
+    if args.binary:
+        with open(args.output, 'wb') as f:
+            f.write(response)
+        print(f"✅ Binary response ({len(response) / 1e3:.1f} KB) saved to {args.output}")
+    elif args.output:
+        with open(args.output, 'w') as f:
+            json.dump(response, f)
+        print(f"✅ Response saved to {args.output}")
+    else:
+        print(json.dumps(response))
+
+def run_analyze(args):
+    import pandas as pd
+    from nasa_power_integration import PhysicalAnalysis
+
+    weather_data = pd.read_csv(args.weather_csv)
+    predicted_power = weather_data[args.power_column] if args.power_column else None
+    analysis = PhysicalAnalysis().analyze_solar_performance(weather_data, predicted_power)
+    print(json.dumps(analysis, indent=2, default=float))
+
+def run_forwarded(module, argv):
+    """Run a module's own __main__ CLI with the remaining arguments"""
+    sys.argv = [f"{module}.py", *argv]
+    runpy.run_module(module, run_name='__main__', alter_sys=True)
+
+def measure_import_seconds(modules, repeats=3):
+    """Best-of-repeats import time of modules in fresh interpreters"""
+    code = ("import time; start = time.perf_counter(); "
+            + "; ".join(f"import {module}" for module in modules)
+            + "; print(time.perf_counter() - start)")
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    return min(
+        float(subprocess.run([sys.executable, '-c', code], cwd=cwd, capture_output=True,
+                             text=True, check=True).stdout.split()[-1])
+        for _ in range(repeats)
+    )
+
+def run_startup(args):
+    print("⏱️ Cold-start import time per subcommand (best of "
+          f"{args.repeats} fresh interpreters):")
+    for command in args.commands or ['cli', *COMMAND_MODULES]:
+        modules = ['solar_cli'] if command == 'cli' else COMMAND_MODULES[command]
+        seconds = measure_import_seconds(modules, args.repeats)
+        print(f"   {command:<15} {seconds * 1000:8.1f} ms  ({', '.join(modules)})")
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Solar power prediction toolkit")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    train = commands.add_parser('train', help="Train the optimized model (optimized_solar_ml)")
+    train.add_argument('--model-selection', default='holdout', choices=['holdout', 'time_series'])
+    train.add_argument('--prune', action='store_true', help="Keep only the servable features that pay for their cost")
+    train.set_defaults(handler=run_train)
+
+    train_enhanced = commands.add_parser('train-enhanced', help="Train the enhanced model (enhanced_solar_ml)")
+    train_enhanced.set_defaults(handler=run_train_enhanced)
+
+    predict = commands.add_parser('predict', help="Predict with NASA POWER weather")
+    predict.add_argument('latitude', type=float)
+    predict.add_argument('longitude', type=float)
+    predict.add_argument('start_date', help="YYYYMMDD")
+    predict.add_argument('end_date', help="YYYYMMDD")
+    predict.add_argument('--temporal', default='daily', choices=['hourly', 'daily', 'monthly'])
+    predict.add_argument('--model', default='optimized_solar_power_model.pkl')
+    predict.add_argument('--surrogate', action='store_true', help="Use the distilled surrogate")
+    predict.add_argument('--intervals', action='store_true', help="Add prediction intervals")
+    predict.add_argument('--no-analysis', action='store_true')
+    predict.add_argument('--fields', nargs='+', default=None, help="Columns to return besides DATE")
+    predict.add_argument('--max-points', type=int, default=None)
+    predict.add_argument('--decimals', type=int, default=None)
+    predict.add_argument('--binary', action='store_true', help="Binary columnar output (needs --output)")
+    predict.add_argument('--output', default=None)
+    predict.set_defaults(handler=run_predict)
+
+    analyze = commands.add_parser('analyze', help="Physical analysis of a processed weather CSV")
+    analyze.add_argument('weather_csv')
+    analyze.add_argument('--power-column', default=None, help="Column with predicted power")
+    analyze.set_defaults(handler=run_analyze)
+
+    for command, (module, description) in FORWARDED_COMMANDS.items():
+        forwarded = commands.add_parser(command, help=f"{description} ({module})", add_help=False)
+        forwarded.set_defaults(module=module)
+
+    startup = commands.add_parser('startup', help="Measure cold-start import time per subcommand")
+    startup.add_argument('commands', nargs='*', help="Subcommands to time (default: all, plus 'cli')")
+    startup.add_argument('--repeats', type=int, default=3)
+    startup.set_defaults(handler=run_startup)
+    return parser
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = build_parser()
+    args, remaining = parser.parse_known_args(argv)
+
+    if getattr(args, 'module', None):
+        return run_forwarded(args.module, remaining)
+    if remaining:
+        parser.error(f"unrecognized arguments: {' '.join(remaining)}")
+    if args.command == 'predict' and args.binary and not args.output:
+        parser.error("--binary needs --output")
+    if args.command == 'startup' and not set(args.commands) <= {'cli', *COMMAND_MODULES}:
+        parser.error(f"startup can time: cli, {', '.join(COMMAND_MODULES)}")
+    return args.handler(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Ensembles assembled from already-fitted base models.
+Voting ensembles average the fitted models directly and stacking ensembles only
+fit a meta-learner on the fitted models' predictions for a held-out blend
+slice, so building an ensemble never retrains the base models.
+"""
+
+import numpy as np
+from sklearn.base import clone
+
+class PrefittedVotingRegressor:
+    """Average the predictions of already-fitted regressors"""
+
+    def __init__(self, estimators, weights=None):
+        self.estimators = estimators  # list of (name, fitted_model)
+        self.weights = weights
+
+    @property
+    def named_estimators_(self):
+        return dict(self.estimators)
+
+    def predict(self, X):
+        predictions = np.column_stack([model.predict(X) for _, model in self.estimators])
+        return np.average(predictions, axis=1, weights=self.weights)
+
+class PrefittedStackingRegressor:
+    """Meta-learner over the predictions of already-fitted regressors"""
+
+    def __init__(self, estimators, final_estimator):
+        self.estimators = estimators  # list of (name, fitted_model)
+        self.final_estimator = final_estimator
+
+    @property
+    def named_estimators_(self):
+        return dict(self.estimators)
+
+    def fit_meta(self, X_blend, y_blend):
+        """Fit only the meta-learner on base predictions for rows the base models never saw"""
+        base_predictions = np.column_stack([model.predict(X_blend) for _, model in self.estimators])
+        self.final_estimator_ = clone(self.final_estimator).fit(base_predictions, y_blend)
+        return self
+
+    def predict(self, X):
+        base_predictions = np.column_stack([model.predict(X) for _, model in self.estimators])
+        return self.final_estimator_.predict(base_predictions)
+
+def build_voting_ensemble(fitted_models, names, weights=None):
+    """Voting ensemble from fitted models, no training required"""
+    return PrefittedVotingRegressor([(name, fitted_models[name]) for name in names], weights)
+
+def build_stacking_ensemble(fitted_models, names, final_estimator, X_blend, y_blend):
+    """
+    Stacking ensemble from fitted models, fitting only the meta-learner
+
+    Args:
+        X_blend, y_blend: Rows held out from base-model training; one
+            predict per base model on them is all the extra work
+    """
+    stacking = PrefittedStackingRegressor([(name, fitted_models[name]) for name in names], final_estimator)
+    return stacking.fit_meta(X_blend, y_blend)
@@ -0,0 +1,108 @@
+"""
+Vectorized solar-geometry and module-temperature feature engine.
+Computes solar zenith/azimuth from latitude, longitude and timestamps
+(Spencer 1971 declination and equation of time), the cyclical time
+encodings used in training, and a NOCT cell-temperature model, all over
+whole arrays so hourly NASA POWER data gets the trained features at
+array speed.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Nominal operating cell temperature conditions
+NOCT = 45.0                 # °C, typical crystalline silicon module
+NOCT_IRRADIANCE = 800.0     # W/m²
+NOCT_AMBIENT = 20.0         # °C
+
+def solar_position(times, latitude, longitude, time_standard='LST'):
+    """
+    Solar zenith and azimuth angles
+
+    Args:
+        times (pd.DatetimeIndex or Series): Timestamps
+        latitude, longitude (float or array): Site coordinates in degrees
+        time_standard (str): 'LST' when times are local solar time (the NASA
+            POWER hourly default), 'UTC' when they are UTC
+
+    Returns:
+        tuple: (zenith, azimuth) in degrees; azimuth clockwise from north
+    """
+    times = pd.DatetimeIndex(times)
+    day_of_year = times.dayofyear.to_numpy()
+    hour = times.hour.to_numpy() + times.minute.to_numpy() / 60
+
+    gamma = 2 * np.pi / 365 * (day_of_year - 1 + (hour - 12) / 24)
+    declination = (0.006918 - 0.399912 * np.cos(gamma) + 0.070257 * np.sin(gamma)
+                   - 0.006758 * np.cos(2 * gamma) + 0.000907 * np.sin(2 * gamma)
+                   - 0.002697 * np.cos(3 * gamma) + 0.00148 * np.sin(3 * gamma))
+
+    if time_standard == 'UTC':
+        # Equation of time in minutes
+        equation_of_time = 229.18 * (0.000075 + 0.001868 * np.cos(gamma) - 0.032077 * np.sin(gamma)
+                                     - 0.014615 * np.cos(2 * gamma) - 0.040849 * np.sin(2 * gamma))
+        solar_hour = hour + (4 * np.asarray(longitude) + equation_of_time) / 60
+    else:
+        solar_hour = hour
+
+    hour_angle = np.radians(15 * (solar_hour - 12))
+    lat = np.radians(latitude)
+
+    cos_zenith = np.sin(lat) * np.sin(declination) + np.cos(lat) * np.cos(declination) * np.cos(hour_angle)
+    zenith = np.degrees(np.arccos(np.clip(cos_zenith, -1, 1)))
+    azimuth = (np.degrees(np.arctan2(
+        np.sin(hour_angle), np.cos(hour_angle) * np.sin(lat) - np.tan(declination) * np.cos(lat)
+    )) + 180) % 360
+    return zenith, azimuth
+
+def module_temperature(ambient_temperature, irradiance, wind_speed=None, noct=NOCT):
+    """
+    NOCT cell-temperature model
+
+    T_cell = T_ambient + (NOCT - 20) / 800 * G, with the Duffie-Beckman
+    wind correction 9.5 / (5.7 + 3.8 * v) when wind speed (m/s) is given.
+
+    Args:
+        ambient_temperature (array): °C
+        irradiance (array): Plane irradiance in W/m²
+    """
+    heating = (noct - NOCT_AMBIENT) / NOCT_IRRADIANCE * np.asarray(irradiance)
+    if wind_speed is not None:
+        heating = heating * 9.5 / (5.7 + 3.8 * np.asarray(wind_speed))
+    return np.asarray(ambient_temperature) + heating
+
+def add_solar_geometry_features(df, latitude=None, longitude=None, time_standard='LST'):
+    """
+    Add solar-geometry, cyclical time and module-temperature columns
+
+    Hourly frames (with an HOUR column) get HOUR_SIN/HOUR_COS, a NOCT
+    MODULE_TEMPERATURE_C and, when the coordinates are known, SOLAR_ZENITH and
+    SOLAR_AZIMUTH. Other resolutions keep ambient temperature as the module
+    temperature, as before.
+    """
+    df['DAY_SIN'] = np.sin(2 * np.pi * df['DAY'] / 31)
+    df['DAY_COS'] = np.cos(2 * np.pi * df['DAY'] / 31)
+    df['MONTH_SIN'] = np.sin(2 * np.pi * df['MONTH'] / 12)
+    df['MONTH_COS'] = np.cos(2 * np.pi * df['MONTH'] / 12)
+
+    has_temperature = 'TEMPERATURE_C' in df.columns
+    if 'HOUR' in df.columns:
+        df['HOUR_SIN'] = np.sin(2 * np.pi * df['HOUR'] / 24)
+        df['HOUR_COS'] = np.cos(2 * np.pi * df['HOUR'] / 24)
+        if latitude is not None and longitude is not None:
+            df['SOLAR_ZENITH'], df['SOLAR_AZIMUTH'] = solar_position(df['DATE'], latitude, longitude, time_standard)
+
+        # Hourly ALLSKY_SFC_SW_DWN is the hour's mean irradiance in W/m²
+        if has_temperature and 'SOLAR_RADIATION' in df.columns:
+            df['MODULE_TEMPERATURE_C'] = module_temperature(
+                df['TEMPERATURE_C'], df['SOLAR_RADIATION'].clip(lower=0),
+                df['WIND_SPEED'] if 'WIND_SPEED' in df.columns else None
+            )
+
+    if has_temperature:
+        if 'MODULE_TEMPERATURE_C' not in df.columns:
+            df['MODULE_TEMPERATURE_C'] = df['TEMPERATURE_C']
+        df['TEMP_DIFF'] = df['MODULE_TEMPERATURE_C'] - df['TEMPERATURE_C']
+        df['TEMP_RATIO'] = df['MODULE_TEMPERATURE_C'] / (df['TEMPERATURE_C'] + 1e-8)
+
+    return df
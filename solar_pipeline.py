@@ -0,0 +1,212 @@
+"""
+Resumable optimized training pipeline.
+Runs the optimized_solar_ml pipeline as checkpointed stages
+(load -> features -> select -> split -> per-model fit -> ensemble -> tune ->
+distill -> intervals -> save).
+Each stage's output is stored under a key derived from its inputs' keys and
+its own configuration, so a re-run skips every completed stage and changing
+one model's parameters retrains only that model.
+"""
+
+import os
+import json
+import pickle
+import hashlib
+import argparse
+
+import optimized_solar_ml as osm
+from native_boosters import BoosterDataset
+from feature_selection import select_features
+from model_distillation import distill_model
+
+PIPELINE_CACHE_DIR = os.path.join('.cache', 'pipeline')
+
+def stage_key(*parts):
+    """Stable hash of upstream keys and stage configuration"""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(json.dumps(part, sort_keys=True, default=repr).encode())
+    return digest.hexdigest()[:16]
+
+class StageCache:
+    """Pickle checkpoints of stage outputs, one file per (stage, key)"""
+
+    def __init__(self, cache_dir=PIPELINE_CACHE_DIR, force_stages=()):
+        self.cache_dir = cache_dir
+        self.force_stages = set(force_stages)
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, stage, key):
+        return os.path.join(self.cache_dir, f"{stage.replace(' ', '_')}_{key}.pkl")
+
+    def run(self, stage, key, func):
+        """Return the checkpointed output for (stage, key), computing it if missing"""
+        path = self._path(stage, key)
+        if os.path.exists(path) and stage.split(':')[0] not in self.force_stages:
+            print(f"⏭️ {stage}: using checkpoint {key}")
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+
+        print(f"▶️ {stage}: running (key {key})")
+        output = func()
+
+        # Write atomically so a crash never leaves a truncated checkpoint
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return output
+
+def _file_fingerprint(paths):
+    """Cheap input fingerprint: path, size and modification time"""
+    return [(os.path.abspath(p), os.path.getsize(p), os.path.getmtime(p)) for p in paths]
+
+def _model_config(name, model, overrides):
+    """Configuration that identifies one model's fit"""
+    if name in osm.NATIVE_BOOSTERS:
+        return {**osm.BOOSTER_PARAMS[name], **overrides}
+    model.set_params(**overrides)
+    return {key: repr(value) for key, value in sorted(model.get_params().items())}
+
+def run_pipeline(data_files=None, model_overrides=None, tuning_mode='halving',
+                 cache_dir=PIPELINE_CACHE_DIR, force_stages=(), prune_features=False):
+    """
+    Run the optimized pipeline with per-stage checkpoints
+
+    Args:
+        data_files (list): Merged CSVs to train on (defaults to DATA_FILES)
+        model_overrides (dict): Model name -> parameter overrides
+        tuning_mode (str): 'halving' or 'random', see hyperparameter_tuning_optimized
+        cache_dir (str): Checkpoint directory
+        force_stages (iterable): Stage names to recompute even if checkpointed
+        prune_features (bool): Run the importance-based selection of servable features
+
+    Returns:
+        pd.DataFrame: Evaluation results summary
+    """
+    print("🚀 Starting resumable Solar Power Prediction ML Pipeline")
+    print("=" * 60)
+
+    data_files = data_files or osm.DATA_FILES
+    model_overrides = model_overrides or {}
+    cache = StageCache(cache_dir, force_stages)
+
+    # Load
+    load_key = stage_key('load', _file_fingerprint(data_files))
+    df = cache.run('load', load_key, lambda: osm.load_raw_optimized_data(data_files))
+
+    # Features
+    features_key = stage_key('features', load_key, osm.FEATURE_COLUMNS, osm.TARGET_COLUMN)
+    X, y = cache.run('features', features_key, lambda: osm.prepare_optimized_features(df))
+    del df
+
+    # Feature selection
+    feature_columns = list(osm.FEATURE_COLUMNS)
+    if prune_features:
+        select_key = stage_key('select', features_key, {'method': 'gain', 'r2_tolerance': 0.002,
+                                                        'candidates': 'servable'})
+        feature_columns = cache.run('select', select_key, lambda: select_features(X, y)['selected'])
+        X = X[feature_columns]
+        features_key = select_key
+
+    # Split
+    split_key = stage_key('split', features_key, {'test_size': 0.2, 'random_state': 42})
+    split = cache.run('split', split_key, lambda: osm.split_optimized_data(X, y))
+    y_test = split['y_test']
+
+    # Per-model fit, keyed by that model's own parameters only
+    booster_data = None
+    results = {}
+    model_keys = {}
+    for name, model in osm.get_optimized_models().items():
+        overrides = model_overrides.get(name, {})
+        config = _model_config(name, model, overrides)
+        model_keys[name] = stage_key('fit', split_key, name, config)
+
+        def fit(name=name, model=model, config=config):
+            nonlocal booster_data
+            if name in osm.NATIVE_BOOSTERS and booster_data is None:
+                booster_data = BoosterDataset(split['X_train'], split['y_train'])
+            fitted, y_pred = osm.fit_optimized_model(
+                name, model, split, booster_data, config if name in osm.NATIVE_BOOSTERS else None
+            )
+            return {'model': fitted, **osm.calculate_metrics(y_test, y_pred), 'y_pred': y_pred}
+
+        results[name] = cache.run(f"fit:{name}", model_keys[name], fit)
+        print(f"✅ {name} - R²: {results[name]['r2']:.4f}, Accuracy: {results[name]['accuracy']:.2f}%")
+
+    # Ensemble
+    ensemble_key = stage_key('ensemble', split_key, model_keys)
+    ensemble_results = cache.run(
+        'ensemble', ensemble_key, lambda: osm.create_ensemble_models(results, split['X_test'], y_test)
+    )
+    all_results = {**results, **ensemble_results}
+
+    best_model_name = max(all_results.keys(), key=lambda x: all_results[x]['r2'])
+    best_model = all_results[best_model_name]['model']
+    best_r2 = all_results[best_model_name]['r2']
+    print(f"\n🏆 Best Model: {best_model_name} (R² {best_r2:.4f})")
+    # Identifies the final model for the stages that depend on it
+    final_key = stage_key('final', ensemble_key, best_model_name)
+
+    # Tune
+    if all_results[best_model_name]['accuracy'] < 90:
+        tune_key = stage_key('tune', split_key, best_model_name, tuning_mode)
+
+        def tune():
+            data = booster_data
+            if best_model_name in osm.NATIVE_BOOSTERS and data is None:
+                data = BoosterDataset(split['X_train'], split['y_train'])
+            tuned_model = osm.hyperparameter_tuning_optimized(
+                best_model_name, split['X_train'], split['y_train'], mode=tuning_mode, booster_data=data
+            )
+            if tuned_model is None:
+                return None
+            return {'model': tuned_model, **osm.calculate_metrics(y_test, tuned_model.predict(split['X_test']))}
+
+        tuned = cache.run('tune', tune_key, tune)
+        if tuned is not None and tuned['r2'] > best_r2:
+            best_model = tuned['model']
+            final_key = stage_key('final', tune_key)
+            print(f"✅ Using tuned model as the final model (R² {tuned['r2']:.4f})")
+
+    # Distill the final model into a compact serving surrogate
+    teacher_scaler = split['scaler'] if best_model_name in osm.SCALED_MODELS else None
+    distill_key = stage_key('distill', final_key)
+    surrogate = cache.run('distill', distill_key, lambda: distill_model(
+        best_model, split['X_train'], split['X_test'], y_test, teacher_scaler=teacher_scaler
+    )[0])
+
+    # Interval models for the final model and its surrogate
+    intervals = cache.run('intervals', stage_key('intervals', distill_key), lambda: osm.fit_interval_models(
+        best_model, best_model_name, split['scaler'], split['X_train'], split['y_train'],
+        split['X_test'], y_test, surrogate=surrogate, booster_data=booster_data
+    ))
+
+    # Save (always cheap, so never skipped)
+    results_df = osm.save_optimized_model_and_results(
+        best_model, split['scaler'], feature_columns, osm.TARGET_COLUMN,
+        all_results, split['X_test'], y_test, surrogate=surrogate, intervals=intervals
+    )
+
+    print("\n📊 Optimized Results Summary:")
+    print(results_df.to_string(index=False))
+    return results_df
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resumable optimized solar training pipeline")
+    parser.add_argument('--data', nargs='+', default=None, help="Merged CSV files")
+    parser.add_argument('--override', action='append', default=[],
+                        help="Model parameter override as JSON, e.g. '{\"Random Forest\": {\"n_estimators\": 400}}'")
+    parser.add_argument('--tuning-mode', default='halving', choices=['halving', 'random'])
+    parser.add_argument('--force', nargs='*', default=[], help="Stages to recompute")
+    parser.add_argument('--cache-dir', default=PIPELINE_CACHE_DIR)
+    parser.add_argument('--prune', action='store_true', help="Keep only the servable features that pay for their cost")
+    args = parser.parse_args()
+
+    overrides = {}
+    for override in args.override:
+        for name, params in json.loads(override).items():
+            overrides.setdefault(name, {}).update(params)
+
+    run_pipeline(args.data, overrides, args.tuning_mode, args.cache_dir, args.force, args.prune)
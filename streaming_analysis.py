@@ -0,0 +1,235 @@
+"""
+Incremental physical analysis with online statistics.
+Keeps Welford mean/variance, running min/max and a mergeable KLL-style
+quantile sketch per analysed quantity, so each new batch of NASA POWER rows
+updates the analysis in O(new rows) without rescanning the history. States
+built on separate workers (e.g. one per year or per shard of sites) can be
+merged into one.
+"""
+
+import numpy as np
+
+from nasa_power_integration import PhysicalAnalysis, ANALYSIS_SECTIONS
+
+class RunningStats:
+    """Count, mean, variance (Welford/Chan), min and max of a stream"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        """Add a batch of values"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        batch = RunningStats()
+        batch.count = len(values)
+        batch.mean = values.mean()
+        batch.m2 = ((values - batch.mean) ** 2).sum()
+        batch.min = values.min()
+        batch.max = values.max()
+        return self.merge(batch)
+
+    def merge(self, other):
+        """Combine with another state (Chan et al. parallel update)"""
+        if other.count == 0:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def std(self):
+        """Sample standard deviation (ddof=1, like pandas)"""
+        return np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+class QuantileSketch:
+    """
+    Mergeable streaming quantile sketch (KLL-style compactors)
+
+    Level h holds items that each stand for 2**h inputs. A full level is
+    sorted and every other item (from a random offset) is promoted, so memory
+    stays O(k log n) and rank error stays around 1/k.
+    """
+
+    def __init__(self, k=200, seed=42):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """Add a batch of values"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        self.count += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Combine with another sketch"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.k:
+                items = np.sort(items)
+                # An odd item out stays at this level
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                promoted = items[self._rng.integers(2):len(items) - len(keep):2]
+                self.levels[level] = keep
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def _weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        return items[order], weights[order]
+
+    def quantile(self, q):
+        """Approximate q-quantile of everything seen so far"""
+        items, weights = self._weighted_items()
+        if len(items) == 0:
+            return np.nan
+        cumulative = np.cumsum(weights)
+        return items[min(np.searchsorted(cumulative, q * cumulative[-1], side='left'), len(items) - 1)]
+
+    def rank(self, value):
+        """Approximate number of inputs strictly below value"""
+        items, weights = self._weighted_items()
+        # Compaction preserves total weight, so weights sum to self.count
+        return weights[:np.searchsorted(items, value, side='left')].sum()
+
+class StreamingPhysicalAnalysis:
+    """Stateful PhysicalAnalysis updated one batch of rows at a time"""
+
+    def __init__(self, sketch_size=200):
+        self.radiation = RunningStats()
+        self.temperature = RunningStats()
+        self.temperature_effect = RunningStats()
+        self.irradiance_efficiency = RunningStats()
+        self.humidity_effect = RunningStats()
+        self.power = RunningStats()
+        self.radiation_sketch = QuantileSketch(sketch_size)
+        self.rows = 0
+        self.hot_days_count = 0
+        self.has_humidity = False
+
+    def update(self, weather_data, predicted_power=None):
+        """
+        Add new rows (e.g. one newly fetched day) to the running state
+
+        Args:
+            weather_data (pd.DataFrame): New NASA POWER rows
+            predicted_power (array-like): Predictions for those rows (optional)
+        """
+        self.rows += len(weather_data)
+
+        if 'SOLAR_RADIATION' in weather_data.columns:
+            radiation = weather_data['SOLAR_RADIATION'].to_numpy(dtype=float)
+            self.radiation.update(radiation)
+            self.radiation_sketch.update(radiation)
+
+        if 'TEMPERATURE_C' in weather_data.columns:
+            temperature = weather_data['TEMPERATURE_C'].to_numpy(dtype=float)
+            self.temperature.update(temperature)
+            self.hot_days_count += int((temperature > 35).sum())
+
+            if 'SOLAR_RADIATION' in weather_data.columns:
+                self.temperature_effect.update((temperature - 25) * -0.004)
+                self.irradiance_efficiency.update(np.minimum(radiation / 1000, 1.0))
+
+        if 'HUMIDITY' in weather_data.columns:
+            self.has_humidity = True
+            self.humidity_effect.update(np.maximum(0, (weather_data['HUMIDITY'].to_numpy(dtype=float) - 60) * 0.001))
+
+        if predicted_power is not None:
+            self.power.update(predicted_power)
+        return self
+
+    def merge(self, other):
+        """Combine with a state built on another worker or time range"""
+        for name in ['radiation', 'temperature', 'temperature_effect',
+                     'irradiance_efficiency', 'humidity_effect', 'power']:
+            getattr(self, name).merge(getattr(other, name))
+        self.radiation_sketch.merge(other.radiation_sketch)
+        self.rows += other.rows
+        self.hot_days_count += other.hot_days_count
+        self.has_humidity = self.has_humidity or other.has_humidity
+        return self
+
+    def summary(self):
+        """Current metrics, named like the columns of PhysicalAnalysis.summarize_sites"""
+        summary = {'rows': self.rows}
+
+        if self.radiation.count:
+            variability = self.radiation.std / self.radiation.mean
+            # Days with low solar radiation indicate cloudy conditions
+            cloudy_threshold = self.radiation_sketch.quantile(0.3)
+            cloudy_days = int(round(self.radiation_sketch.rank(cloudy_threshold)))
+            summary.update({
+                'avg_solar_radiation': self.radiation.mean,
+                'max_solar_radiation': self.radiation.max,
+                'solar_radiation_std': self.radiation.std,
+                'radiation_consistency': 1 - variability,
+                'atmospheric_efficiency': 1 - variability,
+                'radiation_variability': variability,
+                'cloudy_days_count': cloudy_days,
+                'cloudy_days_percentage': cloudy_days / self.rows * 100
+            })
+
+        if self.temperature.count:
+            summary.update({
+                'avg_temperature': self.temperature.mean,
+                'max_temperature': self.temperature.max,
+                'temperature_range': self.temperature.max - self.temperature.min,
+                'hot_days_count': self.hot_days_count,
+                'hot_days_percentage': self.hot_days_count / self.rows * 100
+            })
+
+        if self.temperature_effect.count:
+            summary['temperature_efficiency_loss'] = self.temperature_effect.mean
+            summary['irradiance_efficiency'] = self.irradiance_efficiency.mean
+
+        if self.has_humidity:
+            summary['humidity_efficiency_loss'] = self.humidity_effect.mean
+
+        if self.power.count:
+            summary.update({
+                'avg_predicted_power': self.power.mean,
+                'max_predicted_power': self.power.max,
+                'power_consistency': 1 - self.power.std / self.power.mean
+            })
+        return summary
+
+    def analysis(self):
+        """Current analysis in the analyze_solar_performance format"""
+        summary = self.summary()
+        analysis = {
+            section: {metric: summary[metric] for metric in metrics if metric in summary}
+            for section, metrics in ANALYSIS_SECTIONS.items()
+        }
+        analysis['recommendations'] = PhysicalAnalysis()._generate_recommendations(analysis) if self.rows else []
+        return analysis
@@ -0,0 +1,260 @@
+"""
+Out-of-core streaming training for solar power models.
+Iterates over partitioned data files one at a time so training scales past the
+size of RAM: SGD fits incrementally with partial_fit, LightGBM keeps adding
+trees partition by partition, and XGBoost reads the partitions through its
+external-memory data iterator. A bounded validation sample is held out from
+every partition as it streams past.
+"""
+
+import os
+import glob
+import time
+import pickle
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDRegressor
+from sklearn.preprocessing import StandardScaler
+
+from native_boosters import NativeBoosterRegressor
+from optimized_solar_ml import advanced_feature_engineering, calculate_metrics, FEATURE_COLUMNS, TARGET_COLUMN
+
+STREAMING_MODELS = ['SGD', 'LightGBM', 'XGBoost']
+
+def read_partition(file_path):
+    """Read one partition file (parquet or csv)"""
+    if file_path.endswith('.parquet'):
+        return pd.read_parquet(file_path)
+    return pd.read_csv(file_path)
+
+def iter_partitions(partition_glob, engineer_features=True):
+    """Yield (X, y) float32 chunks, one per partition file"""
+    files = sorted(glob.glob(partition_glob))
+    if not files:
+        raise FileNotFoundError(f"No partition files match {partition_glob}")
+
+    for file_path in files:
+        df = read_partition(file_path)
+        if engineer_features:
+            df = advanced_feature_engineering(df)
+
+        X = df[FEATURE_COLUMNS]
+        y = df[TARGET_COLUMN]
+        mask = ~(X.isnull().any(axis=1) | y.isnull())
+        yield (X[mask].to_numpy(dtype=np.float32), y[mask].to_numpy(dtype=np.float32))
+
+class StreamingHoldout:
+    """Split each streamed chunk into train rows and a bounded validation sample"""
+
+    def __init__(self, validation_fraction=0.1, max_validation_rows=200000, random_state=42):
+        self.validation_fraction = validation_fraction
+        self.max_validation_rows = max_validation_rows
+        self.random_state = random_state
+        self.rng = np.random.default_rng(random_state)
+        self._X_parts = []
+        self._y_parts = []
+        self.n_validation = 0
+
+    def validation_mask(self, n_rows):
+        """Rows of the next chunk that go to the validation sample; once the
+        sample is full, drawn rows stay in training"""
+        is_validation = self.rng.random(n_rows) < self.validation_fraction
+        room = max(0, self.max_validation_rows - self.n_validation)
+        is_validation[np.flatnonzero(is_validation)[room:]] = False
+        self.n_validation += int(is_validation.sum())
+        return is_validation
+
+    def split(self, X, y):
+        """Return the training rows of a chunk, keeping its validation rows"""
+        is_validation = self.validation_mask(len(y))
+        if is_validation.any():
+            self._X_parts.append(X[is_validation])
+            self._y_parts.append(y[is_validation])
+        return X[~is_validation], y[~is_validation]
+
+    def replay(self):
+        """Fresh holdout whose masks repeat this one's chunk by chunk, for
+        later passes over the partitions that must skip the validation rows"""
+        return StreamingHoldout(self.validation_fraction, self.max_validation_rows, self.random_state)
+
+    def validation_set(self):
+        if not self._X_parts:
+            return np.empty((0, len(FEATURE_COLUMNS)), dtype=np.float32), np.empty(0, dtype=np.float32)
+        return np.concatenate(self._X_parts), np.concatenate(self._y_parts)
+
+def _partition_iter(partition_glob, holdout, engineer_features, cache_dir):
+    """XGBoost external-memory iterator over the training rows of each partition
+    (defined on first use so xgboost is only imported for XGBoost runs)"""
+    import xgboost as xgb
+
+    class _PartitionIter(xgb.DataIter):
+        def __init__(self):
+            self._chunks = None
+            self._replay = None
+            super().__init__(cache_prefix=os.path.join(cache_dir, 'xgb_cache'))
+
+        def next(self, input_data):
+            if self._chunks is None:
+                self._chunks = iter_partitions(partition_glob, engineer_features)
+                self._replay = holdout.replay()
+            try:
+                X, y = next(self._chunks)
+            except StopIteration:
+                return False
+            # Same draw as the holdout so validation rows never reach training
+            is_validation = self._replay.validation_mask(len(y))
+            input_data(data=X[~is_validation], label=y[~is_validation], feature_names=FEATURE_COLUMNS)
+            return True
+
+        def reset(self):
+            self._chunks = None
+
+    return _PartitionIter()
+
+class StreamingSGDModel:
+    """SGDRegressor with an incrementally fitted StandardScaler"""
+
+    def __init__(self, scaler, model):
+        self.scaler = scaler
+        self.model = model
+
+    def predict(self, X):
+        return self.model.predict(self.scaler.transform(np.asarray(X, dtype=np.float32)))
+
+def train_streaming_sgd(partition_glob, holdout, n_epochs=3, engineer_features=True):
+    """Fit SGDRegressor chunk by chunk with partial_fit"""
+    scaler = StandardScaler()
+    model = SGDRegressor(penalty='elasticnet', alpha=1e-4, l1_ratio=0.15,
+                         learning_rate='invscaling', random_state=42)
+
+    # First pass fits the scaler and holds out the validation rows
+    train_chunks = 0
+    for X, y in iter_partitions(partition_glob, engineer_features):
+        X_train, y_train = holdout.split(X, y)
+        scaler.partial_fit(X_train)
+        train_chunks += 1
+
+    for epoch in range(n_epochs):
+        replay = holdout.replay()
+        for X, y in iter_partitions(partition_glob, engineer_features):
+            is_validation = replay.validation_mask(len(y))
+            model.partial_fit(scaler.transform(X[~is_validation]), y[~is_validation])
+        print(f"✅ SGD epoch {epoch + 1}/{n_epochs} over {train_chunks} partitions")
+
+    return StreamingSGDModel(scaler, model)
+
+def train_streaming_lightgbm(partition_glob, holdout, trees_per_partition=100, engineer_features=True):
+    """Grow a LightGBM booster by continued training on each partition"""
+    import lightgbm as lgb
+
+    params = {
+        'objective': 'regression',
+        'max_depth': 6,
+        'learning_rate': 0.1,
+        'subsample': 0.8,
+        'colsample_bytree': 0.8,
+        'seed': 42,
+        'verbose': -1
+    }
+    booster = None
+    for X, y in iter_partitions(partition_glob, engineer_features):
+        X_train, y_train = holdout.split(X, y)
+        booster = lgb.train(
+            params, lgb.Dataset(X_train, label=y_train, feature_name=FEATURE_COLUMNS),
+            num_boost_round=trees_per_partition, init_model=booster, keep_training_booster=True
+        )
+        print(f"✅ LightGBM now has {booster.current_iteration()} trees")
+    return NativeBoosterRegressor('LightGBM', booster, {**params, 'n_estimators': booster.current_iteration()})
+
+def train_streaming_xgboost(partition_glob, holdout, n_estimators=500, engineer_features=True):
+    """Train XGBoost on an external-memory DMatrix built from the partitions"""
+    import xgboost as xgb
+
+    # Collect the validation sample with one streaming pass
+    for X, y in iter_partitions(partition_glob, engineer_features):
+        holdout.split(X, y)
+
+    params = {
+        'objective': 'reg:squarederror',
+        'tree_method': 'hist',
+        'max_depth': 6,
+        'learning_rate': 0.1,
+        'subsample': 0.8,
+        'colsample_bytree': 0.8,
+        'seed': 42
+    }
+    with tempfile.TemporaryDirectory() as cache_dir:
+        data_iter = _partition_iter(partition_glob, holdout, engineer_features, cache_dir)
+        dtrain = xgb.DMatrix(data_iter)
+        booster = xgb.train(params, dtrain, num_boost_round=n_estimators)
+        del dtrain, data_iter  # Release the cache pages before the directory goes
+    return NativeBoosterRegressor('XGBoost', booster, {**params, 'n_estimators': n_estimators})
+
+def train_streaming(partition_glob, model_name='LightGBM', validation_fraction=0.1,
+                    max_validation_rows=200000, engineer_features=True, random_state=42):
+    """
+    Train a model out-of-core over partitioned data files
+
+    Args:
+        partition_glob (str): Glob matching partition files (csv or parquet)
+        model_name (str): One of STREAMING_MODELS
+        validation_fraction (float): Share of each partition held out
+        max_validation_rows (int): Cap on the held-out validation sample
+        engineer_features (bool): Apply advanced_feature_engineering per partition
+        random_state (int): Seed of the validation draw
+
+    Returns:
+        dict: Fitted model and streaming-validation metrics
+    """
+    print(f"🚀 Streaming training of {model_name} over {partition_glob}")
+    if model_name not in STREAMING_MODELS:
+        raise ValueError(f"Streaming training not supported for {model_name}")
+
+    start = time.perf_counter()
+    # Later passes (SGD epochs, XGBoost iterator) replay the same draw
+    holdout = StreamingHoldout(validation_fraction, max_validation_rows, random_state)
+
+    if model_name == 'SGD':
+        model = train_streaming_sgd(partition_glob, holdout, engineer_features=engineer_features)
+    elif model_name == 'LightGBM':
+        model = train_streaming_lightgbm(partition_glob, holdout, engineer_features=engineer_features)
+    else:
+        model = train_streaming_xgboost(partition_glob, holdout, engineer_features=engineer_features)
+
+    X_val, y_val = holdout.validation_set()
+    y_pred = model.predict(X_val)
+    metrics = calculate_metrics(y_val, y_pred)
+
+    print(f"✅ {model_name} (streamed, {time.perf_counter() - start:.1f}s) - "
+          f"R²: {metrics['r2']:.4f}, RMSE: {metrics['rmse']:.2f}, "
+          f"MAE: {metrics['mae']:.2f}, Accuracy: {metrics['accuracy']:.2f}% "
+          f"on {len(y_val)} held-out rows")
+
+    return {'model': model, **metrics}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Out-of-core training over partitioned solar data")
+    parser.add_argument('partitions', help="Glob of partition files, e.g. 'data/part-*.parquet'")
+    parser.add_argument('--model', default='LightGBM', choices=STREAMING_MODELS)
+    parser.add_argument('--validation-fraction', type=float, default=0.1)
+    parser.add_argument('--prepared-features', action='store_true',
+                        help="Partitions already contain the engineered feature columns")
+    parser.add_argument('--seed', type=int, default=42, help="Seed of the validation draw")
+    parser.add_argument('--output', default='streaming_solar_power_model.pkl')
+    args = parser.parse_args()
+
+    result = train_streaming(args.partitions, args.model, args.validation_fraction,
+                             engineer_features=not args.prepared_features, random_state=args.seed)
+
+    model_data = {
+        'model': result['model'],
+        'scaler': None,
+        'feature_columns': FEATURE_COLUMNS,
+        'target_column': TARGET_COLUMN,
+        'model_type': 'streaming_solar_prediction'
+    }
+    with open(args.output, 'wb') as f:
+        pickle.dump(model_data, f)
+    print(f"✅ Streaming model saved as '{args.output}'")
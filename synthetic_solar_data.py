@@ -0,0 +1,237 @@
+"""
+Deterministic synthetic solar dataset generator.
+Emits realistic generation and weather sensor data for N plants x M inverters
+x T timestamps in the exact Kaggle Plant_*_Generation_Data.csv and
+Plant_*_Weather_Sensor_Data.csv schema, streamed in chunks to columnar files.
+Every (plant, day) draws from its own seeded random stream, so the output is
+identical for a given seed no matter how it is chunked.
+"""
+
+import os
+import argparse
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+GENERATION_COLUMNS = ['DATE_TIME', 'PLANT_ID', 'SOURCE_KEY', 'DC_POWER', 'AC_POWER', 'DAILY_YIELD', 'TOTAL_YIELD']
+WEATHER_COLUMNS = ['DATE_TIME', 'PLANT_ID', 'SOURCE_KEY', 'AMBIENT_TEMPERATURE', 'MODULE_TEMPERATURE', 'IRRADIATION']
+MERGED_COLUMNS = ['DATE_TIME', 'PLANT_ID', 'SOURCE_KEY', 'DC_POWER', 'AC_POWER', 'DAILY_YIELD', 'TOTAL_YIELD',
+                  'AMBIENT_TEMPERATURE', 'MODULE_TEMPERATURE', 'IRRADIATION']
+
+# Kaggle datasets use different DATE_TIME formats for the two files
+GENERATION_DATE_FORMAT = '%d-%m-%Y %H:%M'
+WEATHER_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+FIRST_PLANT_ID = 4135001
+
+def _rng(seed, *keys):
+    """Independent random stream for a (seed, keys...) combination"""
+    return np.random.default_rng(np.random.SeedSequence([seed, *keys]))
+
+def _plant_profile(seed, plant, n_inverters):
+    """Static per-plant and per-inverter characteristics"""
+    rng = _rng(seed, plant)
+    return {
+        'plant_id': FIRST_PLANT_ID + plant,
+        'latitude': rng.uniform(10, 35),
+        'climate_temp': rng.uniform(22, 30),
+        'cloudiness': rng.uniform(0.1, 0.4),
+        'inverter_keys': [f"INV{plant:03d}{rng.integers(16**8):08x}{i:03d}" for i in range(n_inverters)],
+        'weather_key': f"WS{plant:03d}{rng.integers(16**8):08x}",
+        'inverter_capacity': rng.uniform(1100, 1400, n_inverters),   # kW DC at 1 kW/m²
+        'inverter_efficiency': rng.uniform(0.94, 1.0, n_inverters),
+        'initial_total_yield': rng.uniform(6e6, 7.5e6, n_inverters)  # kWh
+    }
+
+def _clear_sky_irradiation(timestamps, latitude):
+    """Clear-sky irradiation in kW/m² from a simple solar elevation model"""
+    day_of_year = timestamps.dayofyear.to_numpy()
+    hour = timestamps.hour.to_numpy() + timestamps.minute.to_numpy() / 60
+    declination = np.radians(23.45) * np.sin(2 * np.pi * (284 + day_of_year) / 365)
+    hour_angle = np.radians(15 * (hour - 12))
+    lat = np.radians(latitude)
+    sin_elevation = np.sin(lat) * np.sin(declination) + np.cos(lat) * np.cos(declination) * np.cos(hour_angle)
+    return 1.1 * np.clip(sin_elevation, 0, None) ** 1.15
+
+def _generate_day(seed, plant, day_index, timestamps, profile, step_hours):
+    """Weather and per-inverter power for one plant-day"""
+    rng = _rng(seed, plant, day_index)
+    n_steps = len(timestamps)
+    n_inverters = len(profile['inverter_keys'])
+
+    # Weather: clear-sky irradiation attenuated by smooth random cloud cover
+    cloud_level = rng.beta(2, 2 / profile['cloudiness'])
+    cloud = np.clip(cloud_level + np.cumsum(rng.normal(0, 0.03, n_steps)), 0, 0.95)
+    irradiation = _clear_sky_irradiation(timestamps, profile['latitude']) * (1 - cloud)
+
+    hour = timestamps.hour.to_numpy() + timestamps.minute.to_numpy() / 60
+    ambient = (profile['climate_temp'] + rng.normal(0, 1.5)
+               + 6 * np.sin((hour - 9) / 24 * 2 * np.pi) + rng.normal(0, 0.3, n_steps))
+    module = ambient + 30 * irradiation + rng.normal(0, 0.5, n_steps)
+
+    weather = pd.DataFrame({
+        'DATE_TIME': timestamps,
+        'PLANT_ID': profile['plant_id'],
+        'SOURCE_KEY': profile['weather_key'],
+        'AMBIENT_TEMPERATURE': ambient,
+        'MODULE_TEMPERATURE': module,
+        'IRRADIATION': irradiation
+    })
+
+    # Generation: DC from irradiation with a -0.4%/°C temperature coefficient
+    temp_factor = 1 - 0.004 * (module - 25)
+    dc = (irradiation * temp_factor)[:, None] * profile['inverter_capacity'][None, :] \
+        * profile['inverter_efficiency'][None, :] * rng.normal(1, 0.01, (n_steps, n_inverters))
+    dc = np.clip(dc, 0, None)
+    ac = np.minimum(dc * 0.975, profile['inverter_capacity'][None, :] * 0.95)
+
+    energy = ac * step_hours
+    daily_yield = np.cumsum(energy, axis=0)
+
+    return weather, dc, ac, daily_yield
+
+def generate_chunks(n_plants=2, n_inverters=22, n_timestamps=96 * 34, start='2020-05-15',
+                    freq='15min', seed=42, chunk_days=7):
+    """
+    Yield synthetic data chunk by chunk
+
+    Args:
+        n_plants (int): Number of plants
+        n_inverters (int): Inverters (generation SOURCE_KEYs) per plant
+        n_timestamps (int): Timestamps per plant
+        start (str): First timestamp
+        freq (str): Sampling interval
+        seed (int): Master seed
+        chunk_days (int): Days of data per chunk
+
+    Yields:
+        tuple: (plant_index, chunk_index, generation_df, weather_df)
+    """
+    timestamps = pd.date_range(start, periods=n_timestamps, freq=freq)
+    step_hours = pd.Timedelta(freq).total_seconds() / 3600
+    day_ids = (timestamps.normalize() - timestamps[0].normalize()).days.to_numpy()
+    day_starts = np.flatnonzero(np.r_[True, day_ids[1:] != day_ids[:-1]])
+    day_bounds = list(zip(day_starts, np.r_[day_starts[1:], n_timestamps]))
+
+    for plant in range(n_plants):
+        profile = _plant_profile(seed, plant, n_inverters)
+        total_yield = profile['initial_total_yield'].copy()
+
+        for chunk_index, chunk_start in enumerate(range(0, len(day_bounds), chunk_days)):
+            generation_parts = []
+            weather_parts = []
+            for day_start, day_end in day_bounds[chunk_start:chunk_start + chunk_days]:
+                day_timestamps = timestamps[day_start:day_end]
+                weather, dc, ac, daily_yield = _generate_day(
+                    seed, plant, int(day_ids[day_start]), day_timestamps, profile, step_hours
+                )
+                n_steps = len(day_timestamps)
+                generation_parts.append(pd.DataFrame({
+                    'DATE_TIME': np.repeat(day_timestamps.to_numpy(), n_inverters),
+                    'PLANT_ID': profile['plant_id'],
+                    'SOURCE_KEY': np.tile(profile['inverter_keys'], n_steps),
+                    'DC_POWER': dc.ravel(),
+                    'AC_POWER': ac.ravel(),
+                    'DAILY_YIELD': daily_yield.ravel(),
+                    'TOTAL_YIELD': (total_yield[None, :] + daily_yield).ravel()
+                }))
+                weather_parts.append(weather)
+                total_yield = total_yield + daily_yield[-1]
+
+            yield (plant, chunk_index,
+                   pd.concat(generation_parts, ignore_index=True),
+                   pd.concat(weather_parts, ignore_index=True))
+
+def merge_generation_weather(generation, weather):
+    """Join inverter readings with the plant's weather sensor (solar_merged schema)"""
+    merged = generation.merge(
+        weather.drop(columns=['SOURCE_KEY']), on=['DATE_TIME', 'PLANT_ID'], how='inner'
+    )
+    return merged[MERGED_COLUMNS]
+
+def _format_dates(df, date_format):
+    df = df.copy()
+    df['DATE_TIME'] = df['DATE_TIME'].dt.strftime(date_format)
+    return df
+
+def _write(df, path, file_format):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if file_format == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+def generate_solar_dataset(output_dir, n_plants=2, n_inverters=22, n_timestamps=96 * 34,
+                           start='2020-05-15', freq='15min', seed=42, chunk_days=7,
+                           file_format='parquet', kinds=('generation', 'weather', 'merged')):
+    """
+    Stream a synthetic dataset to partitioned files
+
+    Files are written as {output_dir}/{kind}/plant_{PLANT_ID}/part-{chunk:05d}.{ext}
+    one chunk at a time, so memory use is bounded by chunk_days regardless of
+    the total size. See generate_chunks for the scale arguments.
+
+    Returns:
+        dict: kind -> list of written file paths
+    """
+    if file_format == 'parquet' and not HAS_PYARROW:
+        print("⚠️ pyarrow not installed, writing CSV partitions instead")
+        file_format = 'csv'
+
+    print(f"🔧 Generating {n_plants} plants x {n_inverters} inverters x {n_timestamps} timestamps (seed={seed})")
+    written = {kind: [] for kind in kinds}
+    total_rows = 0
+
+    for plant, chunk_index, generation, weather in generate_chunks(
+            n_plants, n_inverters, n_timestamps, start, freq, seed, chunk_days):
+        plant_dir = f"plant_{FIRST_PLANT_ID + plant}"
+        frames = {}
+        if 'generation' in kinds:
+            frames['generation'] = _format_dates(generation, GENERATION_DATE_FORMAT)
+        if 'weather' in kinds:
+            frames['weather'] = _format_dates(weather, WEATHER_DATE_FORMAT)
+        if 'merged' in kinds:
+            frames['merged'] = _format_dates(merge_generation_weather(generation, weather), WEATHER_DATE_FORMAT)
+
+        for kind, frame in frames.items():
+            path = os.path.join(output_dir, kind, plant_dir, f"part-{chunk_index:05d}.{file_format}")
+            _write(frame, path, file_format)
+            written[kind].append(path)
+        total_rows += len(generation)
+
+    print(f"✅ Wrote {total_rows} generation rows to {output_dir}")
+    return written
+
+def synthetic_merged_frame(n_rows, seed=42, n_inverters=1):
+    """In-memory solar_merged-style frame with roughly n_rows rows"""
+    n_timestamps = max(1, n_rows // n_inverters)
+    merged = [
+        merge_generation_weather(generation, weather)
+        for _, _, generation, weather in generate_chunks(1, n_inverters, n_timestamps, seed=seed)
+    ]
+    df = pd.concat(merged, ignore_index=True)
+    df['DATE_TIME'] = df['DATE_TIME'].dt.strftime(WEATHER_DATE_FORMAT)
+    return df
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic solar dataset")
+    parser.add_argument('output_dir', help="Directory for the partitioned output")
+    parser.add_argument('--plants', type=int, default=2)
+    parser.add_argument('--inverters', type=int, default=22)
+    parser.add_argument('--timestamps', type=int, default=96 * 34, help="Timestamps per plant")
+    parser.add_argument('--start', default='2020-05-15')
+    parser.add_argument('--freq', default='15min')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunk-days', type=int, default=7)
+    parser.add_argument('--format', default='parquet', choices=['parquet', 'csv'])
+    parser.add_argument('--kinds', nargs='+', default=['generation', 'weather', 'merged'],
+                        choices=['generation', 'weather', 'merged'])
+    args = parser.parse_args()
+
+    generate_solar_dataset(args.output_dir, args.plants, args.inverters, args.timestamps,
+                           args.start, args.freq, args.seed, args.chunk_days, args.format, args.kinds)
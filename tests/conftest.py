@@ -0,0 +1,33 @@
+"""Shared test setup: the modules live flat at the repository root, plus a small pickled model."""
+
+import os
+import sys
+import pickle
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FEATURE_COLUMNS = ['IRRADIATION', 'AMBIENT_TEMPERATURE', 'IRRADIATION_SQUARE', 'TEMP_RATIO', 'IRRADIATION_LOG']
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    from sklearn.ensemble import RandomForestRegressor
+
+    rng = np.random.default_rng(0)
+    X = np.column_stack([rng.uniform(0, 1000, 500), rng.uniform(10, 40, 500)])
+    X = np.column_stack([X, X[:, 0] ** 2, np.ones(500), np.zeros(500)]).astype(np.float32)
+    y = X[:, 0] * (1 - 0.004 * (X[:, 1] - 25)) + rng.normal(0, 5, 500)
+    model_data = {
+        'model': RandomForestRegressor(n_estimators=20, max_depth=8, random_state=0).fit(X, y),
+        'scaler': None,
+        'feature_columns': FEATURE_COLUMNS,
+        'target_column': 'AC_POWER',
+        'model_type': 'optimized_solar_prediction'
+    }
+    path = tmp_path / 'model.pkl'
+    with open(path, 'wb') as f:
+        pickle.dump(model_data, f)
+    return str(path)
@@ -0,0 +1,47 @@
+import os
+
+import pandas as pd
+
+from clean_pipeline import clean_all_plants, discover_plant_files
+
+
+def write_generation_file(path, rows=4):
+    pd.DataFrame({
+        'DATE_TIME': pd.date_range('2020-05-15', periods=rows, freq='15min').strftime('%d-%m-%Y %H:%M'),
+        'PLANT_ID': 1,
+        'SOURCE_KEY': 'inverter',
+        'DC_POWER': 10.0,
+        'AC_POWER': 9.5,
+        'DAILY_YIELD': 1.0,
+        'TOTAL_YIELD': 100.0
+    }).to_csv(path, index=False)
+
+
+def test_discover_plant_files_maps_outputs(tmp_path):
+    write_generation_file(tmp_path / 'Plant_1_Generation_Data.csv')
+    (tmp_path / 'Plant_1_Weather_Sensor_Data.csv').write_text('x\n')
+    (tmp_path / 'unrelated.csv').write_text('x\n')
+
+    outputs = sorted(os.path.basename(output) for _, output, _ in discover_plant_files(tmp_path))
+    assert outputs == ['Plant_1_Cleaned.csv', 'Plant_1_Weather_Cleaned.csv']
+
+
+def test_failed_files_are_reported_not_counted(tmp_path, capsys):
+    write_generation_file(tmp_path / 'Plant_1_Generation_Data.csv')
+    (tmp_path / 'Plant_2_Generation_Data.csv').write_text('DATE_TIME\n01-01-2020 00:00\n')
+
+    report = clean_all_plants(tmp_path, max_workers=2)
+    statuses = {os.path.basename(path): entry['status'] for path, entry in report.items()}
+
+    assert statuses == {'Plant_1_Generation_Data.csv': 'cleaned', 'Plant_2_Generation_Data.csv': 'failed'}
+    output = capsys.readouterr().out
+    assert 'Cleaned 1 files' in output
+    assert '1 files failed: Plant_2_Generation_Data.csv' in output
+
+
+def test_up_to_date_outputs_are_skipped(tmp_path):
+    write_generation_file(tmp_path / 'Plant_1_Generation_Data.csv')
+    clean_all_plants(tmp_path, max_workers=1)
+
+    report = clean_all_plants(tmp_path, max_workers=1)
+    assert [entry['status'] for entry in report.values()] == ['skipped']
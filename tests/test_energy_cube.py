@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from energy_cube import EnergyCube
+
+
+def hours(start, periods, freq='h'):
+    return pd.date_range(start, periods=periods, freq=freq)
+
+
+def test_rollups_match_the_base_intervals():
+    cube = EnergyCube().add('a', hours('2024-01-31 22:00', 4), [1.0, 2.0, 3.0, 4.0])
+
+    assert cube.total('a', 'hour', '2024-01-31 23:00') == 2.0
+    assert cube.total('a', 'day', '2024-01-31') == 3.0
+    assert cube.total('a', 'month', '2024-02') == 7.0
+    assert cube.total('a', 'year', '2024') == 10.0
+    assert list(cube.series('a', 'day')) == [3.0, 7.0]
+
+
+def test_repredicted_intervals_replace_earlier_values():
+    cube = EnergyCube().add('a', hours('2024-06-01', 24), np.ones(24))
+    cube.add('a', hours('2024-06-01 12:00', 24), np.full(24, 2.0))
+
+    assert cube.total('a', 'day', '2024-06-01') == 12 * 1.0 + 12 * 2.0
+    assert cube.total('a', 'day', '2024-06-02') == 12 * 2.0
+    assert cube.cells['day']['a'][np.datetime64('2024-06-01', 'D')][1] == 24
+
+
+def test_readings_in_the_same_interval_are_summed():
+    quarter_hours = hours('2024-06-01 10:00', 8, freq='15min')
+    cube = EnergyCube().add('a', quarter_hours, np.full(8, 0.25))
+
+    assert cube.total('a', 'hour', '2024-06-01 10:00') == 1.0
+    assert cube.total('a', 'day', '2024-06-01') == 2.0
+    assert cube.cells['hour']['a'][np.datetime64('2024-06-01T10', 'h')][1] == 1
+
+
+def test_daily_sites_have_no_hour_level_and_reject_hourly_data():
+    days = pd.date_range('2024-06-01', periods=3, freq='D')
+    cube = EnergyCube().add('a', days, [10.0, 20.0, 30.0], resolution='day')
+
+    assert cube.resolution('a') == 'day'
+    assert 'a' not in cube.cells['hour']
+    assert cube.total('a', 'month', '2024-06') == 60.0
+    with pytest.raises(ValueError, match='day resolution'):
+        cube.add('a', hours('2024-06-01', 24), np.ones(24))
+    assert cube.total('a', 'month', '2024-06') == 60.0
+    with pytest.raises(ValueError):
+        cube.add('b', days, [1.0, 2.0, 3.0], resolution='week')
+
+
+def test_retention_bounds_the_base_and_skips_stale_readings():
+    cube = EnergyCube(retention=pd.Timedelta(days=2))
+    cube.add('a', hours('2024-06-01', 24 * 5), np.ones(24 * 5))
+
+    # Only intervals within two days of the latest stay replaceable
+    assert len(cube._base['a']['intervals']) == 2 * 24 + 1
+    cube.add('a', hours('2024-06-01', 24), np.full(24, 5.0))
+    assert cube.total('a', 'day', '2024-06-01') == 24.0
+    assert cube.total('a', 'year', '2024') == 24.0 * 5
+
+    unbounded = EnergyCube(retention=None).add('a', hours('2024-06-01', 24 * 5), np.ones(24 * 5))
+    assert len(unbounded._base['a']['intervals']) == 24 * 5
+
+
+def test_add_predictions_infers_interval_and_resolution(tmp_path):
+    cube = EnergyCube()
+    daily = pd.DataFrame({'DATE': pd.date_range('2024-06-01', periods=4, freq='D')})
+    hourly = pd.DataFrame({'DATE': hours('2024-06-01', 6)})
+    cube.add_predictions('daily', daily, [1.0, 1.0, 1.0, 1.0])
+    cube.add_predictions('hourly', hourly, np.full(6, 2.0))
+
+    assert cube.resolution('daily') == 'day'
+    assert cube.total('daily', 'month', '2024-06') == 4 * 24.0
+    assert cube.resolution('hourly') == 'hour'
+    assert cube.total('hourly', 'day', '2024-06-01') == 12.0
+
+    path = str(tmp_path / 'cube.pkl')
+    cube.save(path)
+    loaded = EnergyCube.load(path)
+    assert sorted(loaded.sites()) == ['daily', 'hourly']
+    assert loaded.total('hourly', 'day', '2024-06-01') == 12.0
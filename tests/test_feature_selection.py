@@ -0,0 +1,55 @@
+import inspect
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import feature_selection as fs
+import optimized_solar_ml as osm
+import solar_pipeline as sp
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n_rows = 2000
+    X = pd.DataFrame({
+        'IRRADIATION': rng.uniform(0, 1, n_rows),
+        'AMBIENT_TEMPERATURE': rng.uniform(20, 35, n_rows),
+        'HOUR': rng.integers(0, 24, n_rows).astype(float),
+        'IRRADIATION_LOG': rng.uniform(0, 1, n_rows)
+    })
+    y = 1000 * X['IRRADIATION'] * (1 - 0.004 * (X['AMBIENT_TEMPERATURE'] - 25))
+    # Target leaks: perfect predictors that do not exist at serving time
+    X['EFFICIENCY'] = y / (X['IRRADIATION'] + 1e-8)
+    X['AC_POWER_LAG1'] = y
+    return X, y
+
+
+def test_servable_features_drop_target_derived_and_unsourced(frame):
+    X, _ = frame
+    assert fs.servable_features(X.columns) == ['IRRADIATION', 'AMBIENT_TEMPERATURE', 'HOUR']
+    assert not set(fs.servable_features(osm.FEATURE_COLUMNS)) & set(osm.TARGET_DERIVED_FEATURES)
+
+
+def test_selection_never_keeps_leaky_features(frame):
+    X, y = frame
+    result = fs.select_features(X, y)
+
+    assert 'IRRADIATION' in result['selected']
+    assert set(result['selected']) <= {'IRRADIATION', 'AMBIENT_TEMPERATURE', 'HOUR'}
+    assert set(result['importances'].index) == {'IRRADIATION', 'AMBIENT_TEMPERATURE', 'HOUR'}
+    assert result['full_r2'] - result['selected_r2'] <= 0.002
+
+
+def test_explicit_candidates(frame):
+    X, y = frame
+    result = fs.select_features(X, y, candidates=['HOUR', 'IRRADIATION_LOG'])
+    assert set(result['selected']) <= {'HOUR', 'IRRADIATION_LOG'}
+    with pytest.raises(ValueError):
+        fs.select_features(X, y, candidates=[])
+
+
+def test_pruning_is_opt_in():
+    assert inspect.signature(osm.main).parameters['prune_features'].default is False
+    assert inspect.signature(sp.run_pipeline).parameters['prune_features'].default is False
@@ -0,0 +1,152 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from sklearn.linear_model import ElasticNet
+from sklearn.preprocessing import RobustScaler
+from sklearn.tree import DecisionTreeRegressor
+
+import model_artifact as ma
+from native_boosters import BoosterDataset, fit_booster
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.random((400, 5)).astype(np.float32)
+    y = 100 * X[:, 0] + 20 * X[:, 1] ** 2 + rng.normal(0, 1, 400)
+    return X, y
+
+
+def round_trip(tmp_path, model_data, **kwargs):
+    path = str(tmp_path / 'model.artifact')
+    size = ma.save_artifact(model_data, path, **kwargs)
+    return size, ma.load_artifact(path)
+
+
+@pytest.mark.parametrize('model', [
+    RandomForestRegressor(n_estimators=10, max_depth=6, random_state=0),
+    GradientBoostingRegressor(n_estimators=20, max_depth=3, random_state=0),
+    DecisionTreeRegressor(max_depth=6, random_state=0)
+], ids=['forest', 'boosting', 'tree'])
+def test_tree_models_predict_identically(tmp_path, data, model):
+    X, y = data
+    model.fit(X, y)
+    _, loaded = round_trip(tmp_path, {'model': model, 'scaler': None, 'feature_columns': ['a'] * 5})
+
+    assert isinstance(loaded['model'], ma.QuantizedTreeEnsemble)
+    assert loaded['scaler'] is None
+    assert loaded['feature_columns'] == ['a'] * 5
+    np.testing.assert_allclose(loaded['model'].predict(X), model.predict(X), rtol=1e-5, atol=1e-4)
+
+
+def test_linear_model_and_scaler(tmp_path, data):
+    X, y = data
+    scaler = RobustScaler().fit(X)
+    model = ElasticNet(alpha=0.01).fit(scaler.transform(X), y)
+    _, loaded = round_trip(tmp_path, {'model': model, 'scaler': scaler})
+
+    np.testing.assert_allclose(loaded['scaler'].transform(X), scaler.transform(X))
+    np.testing.assert_allclose(loaded['model'].predict(loaded['scaler'].transform(X)),
+                               model.predict(scaler.transform(X)), rtol=1e-5, atol=1e-4)
+
+
+@pytest.mark.parametrize('model_name', ['XGBoost', 'LightGBM'])
+def test_native_boosters(tmp_path, data, model_name):
+    X, y = data
+    model = fit_booster(model_name, {'n_estimators': 30, 'max_depth': 4}, BoosterDataset(X, y), n_jobs=1)
+    _, loaded = round_trip(tmp_path, {'model': model, 'scaler': None})
+
+    assert loaded['model'].model_name == model_name
+    np.testing.assert_allclose(loaded['model'].predict(X), model.predict(X), rtol=1e-5)
+
+
+def test_surrogate_info_survives(tmp_path, data):
+    X, y = data
+    tree = DecisionTreeRegressor(max_depth=4).fit(X, y)
+    surrogate = {'name': 'Small Tree', 'model': tree, 'r2': 0.9, 'latency_ms': {1: 0.1, 1000: 1.0}}
+    _, loaded = round_trip(tmp_path, {'model': tree, 'scaler': None, 'surrogate': surrogate})
+
+    assert loaded['surrogate']['name'] == 'Small Tree'
+    assert loaded['surrogate']['latency_ms'] == {1: 0.1, 1000: 1.0}
+    np.testing.assert_allclose(loaded['surrogate']['model'].predict(X), tree.predict(X), rtol=1e-6)
+
+
+def test_size_bound_falls_back_to_float16(tmp_path, data):
+    X, y = data
+    forest = RandomForestRegressor(n_estimators=20, random_state=0).fit(X, y)
+    float32_size, _ = round_trip(tmp_path, {'model': forest})
+    float16_size, loaded = round_trip(tmp_path, {'model': forest}, max_bytes=float32_size - 1)
+
+    assert float16_size < float32_size
+    assert loaded['model'].value.dtype == np.float16
+    np.testing.assert_allclose(loaded['model'].predict(X), forest.predict(X), rtol=1e-2)
+    with pytest.raises(ValueError):
+        ma.save_artifact({'model': forest}, str(tmp_path / 'tiny.artifact'), max_bytes=1000)
+
+
+def test_corrupt_and_foreign_files_are_rejected(tmp_path, data):
+    X, y = data
+    path = tmp_path / 'model.artifact'
+    ma.save_artifact({'model': DecisionTreeRegressor(max_depth=3).fit(X, y)}, str(path))
+
+    corrupt = bytearray(path.read_bytes())
+    corrupt[-1] ^= 0xFF
+    (tmp_path / 'corrupt.artifact').write_bytes(bytes(corrupt))
+    with pytest.raises(ValueError, match='checksum'):
+        ma.load_artifact(str(tmp_path / 'corrupt.artifact'))
+
+    # Same-length header edit: the leaf values would be read with the wrong dtype
+    header = path.read_bytes()
+    assert header.count(b'"<f4"') > 0
+    (tmp_path / 'header.artifact').write_bytes(header.replace(b'"<f4"', b'"<i4"', 1))
+    with pytest.raises(ValueError, match='checksum'):
+        ma.load_artifact(str(tmp_path / 'header.artifact'))
+
+    (tmp_path / 'model.pkl').write_bytes(b'not an artifact at all')
+    with pytest.raises(ValueError, match='not a model artifact'):
+        ma.load_artifact(str(tmp_path / 'model.pkl'))
+
+
+def test_float32_thresholds_keep_split_decisions():
+    thresholds = np.array([0.1, 1 / 3, 2.5, -7.3, 1e-9])
+    rounded = ma._float32_floor(thresholds)
+    assert rounded.dtype == np.float32
+    assert (rounded.astype(np.float64) <= thresholds).all()
+    assert (np.nextafter(rounded, np.float32(np.inf)).astype(np.float64) > thresholds).all()
+
+
+def test_linear_artifact_does_not_import_boosters(tmp_path):
+    code = (
+        "import sys, numpy as np; from sklearn.linear_model import ElasticNet; "
+        "from sklearn.preprocessing import RobustScaler; import model_artifact as ma; "
+        "X = np.random.default_rng(0).random((50, 3)); "
+        f"ma.save_artifact({{'model': ElasticNet().fit(X, X[:, 0]), 'scaler': RobustScaler().fit(X)}}, {str(tmp_path / 'm.artifact')!r}); "
+        "print(sorted({'xgboost', 'lightgbm'} & set(sys.modules)))"
+    )
+    output = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(ma.__file__),
+                            capture_output=True, text=True, check=True).stdout
+    assert output.strip() == '[]'
+
+
+def test_schema_1_artifacts_still_verify(tmp_path, data):
+    import hashlib
+    import json
+
+    X, y = data
+    path = tmp_path / 'model.artifact'
+    ma.save_artifact({'model': DecisionTreeRegressor(max_depth=3).fit(X, y)}, str(path))
+    raw = path.read_bytes()
+    header_end = len(ma.ARTIFACT_MAGIC) + 4 + int.from_bytes(raw[len(ma.ARTIFACT_MAGIC):len(ma.ARTIFACT_MAGIC) + 4], 'little')
+    checksum = json.loads(raw[len(ma.ARTIFACT_MAGIC) + 4:header_end])['checksum']
+    payload_checksum = hashlib.sha256(raw[header_end + (-header_end % ma.ALIGNMENT):]).hexdigest()
+
+    # Schema 1 hashed the payload only
+    legacy = raw.replace(b'"schema_version": 2', b'"schema_version": 1', 1).replace(
+        checksum.encode(), payload_checksum.encode(), 1)
+    (tmp_path / 'legacy.artifact').write_bytes(legacy)
+    loaded = ma.load_artifact(str(tmp_path / 'legacy.artifact'))
+    np.testing.assert_allclose(loaded['model'].predict(X), ma.load_artifact(str(path))['model'].predict(X))
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.tree import DecisionTreeRegressor
+
+import model_distillation as md
+
+
+class FixedTeacher:
+    """Deterministic teacher whose function differs from the noisy targets"""
+
+    def predict(self, X):
+        return 50 * X[:, 0] + 20 * X[:, 1]
+
+
+class RecordingStudent:
+    """Student that records its training targets and predicts a fixed model"""
+
+    def __init__(self, model):
+        self.model = model
+        self.fit_targets = None
+
+    def fit(self, X, y):
+        self.fit_targets = np.asarray(y).copy()
+        self.model.fit(X, y)
+        return self
+
+    def predict(self, X):
+        return self.model.predict(X)
+
+
+class ConstantStudent(RecordingStudent):
+    def __init__(self):
+        super().__init__(None)
+
+    def fit(self, X, y):
+        self.fit_targets = np.asarray(y).copy()
+        self.mean = float(np.mean(y))
+        return self
+
+    def predict(self, X):
+        return np.full(len(X), self.mean)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.random((600, 3)).astype(np.float32)
+    y = FixedTeacher().predict(X) + rng.normal(0, 2, 600)
+    return X[:500], X[500:], y[500:]
+
+
+@pytest.fixture
+def students(monkeypatch):
+    students = {'Exact Linear': RecordingStudent(LinearRegression()), 'Constant': ConstantStudent()}
+    monkeypatch.setattr(md, 'get_surrogate_candidates', lambda: students)
+    monkeypatch.setattr(md, 'measure_latency', lambda model, X: {1: 0.1, 1000: 1.0})
+    return students
+
+
+def test_students_learn_the_teacher_predictions(data, students):
+    X_train, X_test, y_test = data
+    md.distill_model(FixedTeacher(), X_train, X_test, y_test)
+
+    for student in students.values():
+        np.testing.assert_allclose(student.fit_targets, FixedTeacher().predict(X_train))
+
+
+def test_students_below_tolerance_are_rejected(data, students):
+    X_train, X_test, y_test = data
+    surrogate, report = md.distill_model(FixedTeacher(), X_train, X_test, y_test)
+
+    assert report['Constant']['fidelity_r2'] < 0.5
+    assert report['Exact Linear']['fidelity_r2'] == pytest.approx(1.0, abs=1e-6)
+    assert surrogate['name'] == 'Exact Linear'
+    assert surrogate['model'] is students['Exact Linear']
+    assert surrogate['r2'] == report['Exact Linear']['r2']
+
+
+def test_no_surrogate_when_every_student_is_rejected(data, monkeypatch):
+    X_train, X_test, y_test = data
+    monkeypatch.setattr(md, 'get_surrogate_candidates', lambda: {'Constant': ConstantStudent()})
+    surrogate, report = md.distill_model(FixedTeacher(), X_train, X_test, y_test)
+    assert surrogate is None
+    assert set(report) == {'Teacher', 'Constant'}
+
+
+def test_fastest_acceptable_student_is_chosen(data, monkeypatch):
+    X_train, X_test, y_test = data
+    students = {'Slow Tree': DecisionTreeRegressor(max_depth=12, random_state=0),
+                'Fast Linear': LinearRegression()}
+    monkeypatch.setattr(md, 'get_surrogate_candidates', lambda: students)
+    monkeypatch.setattr(md, 'measure_latency', lambda model, X: (
+        {1: 0.01, 1000: 0.1} if model is students['Fast Linear'] else {1: 1.0, 1000: 10.0}))
+
+    surrogate, _ = md.distill_model(FixedTeacher(), X_train, X_test, y_test, r2_tolerance=0.05)
+    assert surrogate['name'] == 'Fast Linear'
+    assert surrogate['model'] is students['Fast Linear']
+
+
+def test_scaled_teacher_sees_scaled_features(data, students):
+    from sklearn.preprocessing import RobustScaler
+
+    X_train, X_test, y_test = data
+    scaler = RobustScaler().fit(X_train)
+    teacher = LinearRegression().fit(scaler.transform(X_train), FixedTeacher().predict(X_train))
+    md.distill_model(teacher, X_train, X_test, y_test, teacher_scaler=scaler)
+
+    np.testing.assert_allclose(students['Exact Linear'].fit_targets, FixedTeacher().predict(X_train),
+                               rtol=1e-4, atol=1e-3)
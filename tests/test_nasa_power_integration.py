@@ -0,0 +1,273 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import nasa_power_integration as npi
+from conftest import FEATURE_COLUMNS
+
+
+def weather_frame(n_days=60, seed=0, start='2024-01-01'):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'DATE': pd.date_range(start, periods=n_days, freq='D'),
+        'SOLAR_RADIATION': rng.uniform(100, 900, n_days),
+        'TEMPERATURE_C': rng.uniform(15, 42, n_days),
+        'HUMIDITY': rng.uniform(20, 95, n_days)
+    })
+
+
+def legacy_analysis(weather, power):
+    """Metrics as each was computed per site before the grouped summary"""
+    radiation, temperature = weather['SOLAR_RADIATION'], weather['TEMPERATURE_C']
+    return {
+        'avg_solar_radiation': radiation.mean(),
+        'solar_radiation_std': radiation.std(),
+        'radiation_consistency': 1 - radiation.std() / radiation.mean(),
+        'temperature_range': temperature.max() - temperature.min(),
+        'temperature_efficiency_loss': ((temperature - 25) * -0.004).mean(),
+        'humidity_efficiency_loss': np.maximum(0, (weather['HUMIDITY'] - 60) * 0.001).mean(),
+        'cloudy_days_count': int((radiation < radiation.quantile(0.3)).sum()),
+        'hot_days_count': int((temperature > 35).sum()),
+        'power_consistency': 1 - power.std() / power.mean()
+    }
+
+
+def test_multi_site_analysis_matches_per_site_analysis():
+    sites = {f"site-{i}": weather_frame(30 + 10 * i, seed=i) for i in range(4)}
+    fleet = pd.concat([frame.assign(SITE_ID=site) for site, frame in sites.items()], ignore_index=True)
+    power = pd.Series(np.random.default_rng(9).uniform(100, 500, len(fleet)))
+
+    result = npi.PhysicalAnalysis().analyze_sites(fleet, predicted_power=power)
+    summary = result['summary']
+
+    assert list(summary.index) == list(sites)
+    for site, frame in sites.items():
+        expected = legacy_analysis(frame, power[fleet['SITE_ID'] == site])
+        for metric, value in expected.items():
+            assert summary.loc[site, metric] == pytest.approx(value), (site, metric)
+
+        single = npi.PhysicalAnalysis().analyze_solar_performance(frame)
+        triggered = result['recommendations']
+        assert sorted(triggered.loc[triggered['SITE_ID'] == site, 'category']) == \
+            sorted(r['category'] for r in single['recommendations'])
+
+
+def test_empty_weather_gives_empty_analysis():
+    analysis = npi.PhysicalAnalysis().analyze_solar_performance(pd.DataFrame())
+    assert analysis['recommendations'] == []
+    assert analysis['performance_metrics'] == {}
+
+
+@pytest.fixture
+def predictor(model_path):
+    predictor = npi.EnhancedSolarPredictor(model_path)
+    yield predictor
+    predictor.nasa_api.close()
+
+
+def test_batch_prediction_matches_per_site_prediction(predictor):
+    weather_by_site = {f"site-{i}": weather_frame(20 + i, seed=i) for i in range(5)}
+
+    batch = predictor.predict_weather_batch(weather_by_site)
+
+    assert list(batch['sites']) == list(weather_by_site)
+    assert list(batch['analysis']['summary'].index) == list(weather_by_site)
+    for site_id, weather in weather_by_site.items():
+        expected = npi.predict_with_model_data(predictor.model_data, predictor._prepare_ml_features(weather))
+        np.testing.assert_allclose(batch['sites'][site_id]['predictions'], expected)
+    assert set(predictor.energy_cube.sites()) == set(weather_by_site)
+
+
+def test_failed_site_fetches_are_reported(predictor, monkeypatch):
+    def fetch(latitude, longitude, *args):
+        return pd.DataFrame() if latitude < 0 else weather_frame(10, seed=int(latitude))
+
+    monkeypatch.setattr(predictor.nasa_api, 'fetch_weather_data', fetch)
+    result = predictor.predict_sites_with_nasa_data({'a': (10, 70), 'b': (-5, 70), 'c': (20, 70)},
+                                                    '20240101', '20240110', max_workers=2)
+
+    assert result['failed_sites'] == ['b']
+    assert list(result['sites']) == ['a', 'c']
+    assert result['metadata']['coordinates'] == {'a': (10, 70), 'c': (20, 70)}
+
+
+def test_feature_plan_matches_per_feature_mapping(predictor):
+    weather = weather_frame(15).drop(columns=['HUMIDITY'])
+    features = predictor._prepare_ml_features(weather)
+
+    assert features.dtype == np.float32
+    assert features.shape == (15, len(FEATURE_COLUMNS))
+    for index, feature in enumerate(FEATURE_COLUMNS):
+        if feature in npi.NASA_FEATURE_SOURCES:
+            source, transform = npi.NASA_FEATURE_SOURCES[feature]
+            if source in weather.columns:
+                values = weather[source].to_numpy(dtype=np.float32)
+                expected = transform(values) if transform is not None else values
+            else:
+                expected = npi.NASA_FEATURE_CONSTANTS.get(feature, 0.0)
+        else:
+            expected = npi.NASA_FEATURE_CONSTANTS.get(feature, 0.0)
+        np.testing.assert_array_equal(features[:, index], np.broadcast_to(np.float32(expected), 15), feature)
+
+    # TEMP_RATIO has no source column here, so it falls back to its default
+    assert (features[:, FEATURE_COLUMNS.index('TEMP_RATIO')] == 1.0).all()
+
+
+def test_feature_plan_is_compiled_once(predictor):
+    plan = predictor._feature_plan
+    assert [index for index, *_ in plan['sourced']] == [0, 1, 2, 3]
+    np.testing.assert_array_equal(plan['constant_index'], [4])
+    predictor._prepare_ml_features(weather_frame(5))
+    assert predictor._feature_plan is plan
+
+
+@pytest.fixture
+def climatology():
+    from climatology import ClimatologyStore
+
+    rng = np.random.default_rng(1)
+    n_days = 3 * 366
+    history = pd.DataFrame({
+        'DATE': pd.date_range('2020-01-01', periods=n_days, freq='D'),
+        'SOLAR_RADIATION': rng.uniform(100, 900, n_days),
+        'TEMPERATURE': rng.uniform(15, 42, n_days),
+        'HUMIDITY': rng.uniform(20, 95, n_days),
+        'WIND_SPEED': rng.uniform(0, 8, n_days)
+    })
+    return ClimatologyStore.build({(28.6, 77.2): history})
+
+
+def test_climatology_forecast_brackets_mean_scenario(predictor, climatology):
+    result = predictor.forecast_with_climatology(28.6, 77.2, '20300101', '20300131', climatology,
+                                                 include_analysis=False)
+
+    assert len(result['predictions']) == 31
+    assert result['prediction_intervals'] is None
+    assert result['metadata']['source'] == 'climatology'
+    assert set(result['prediction_range']) == {'p10', 'p90'}
+    # Irradiance dominates the toy model, so the p10 scenario predicts below p90
+    assert (result['prediction_range']['p10'] < result['prediction_range']['p90']).all()
+
+
+def test_climatology_forecast_intervals_cover_mean_scenario(predictor, climatology):
+    plain = predictor.forecast_with_climatology(28.6, 77.2, '20300101', '20300131', climatology,
+                                                include_analysis=False)
+    result = predictor.forecast_with_climatology(28.6, 77.2, '20300101', '20300131', climatology,
+                                                 include_analysis=False, intervals=True)
+
+    bounds = result['prediction_intervals']
+    assert bounds['method'] == 'tree_spread'
+    np.testing.assert_allclose(result['predictions'], plain['predictions'])
+    assert (bounds['lower'] <= result['predictions']).all()
+    assert (result['predictions'] <= bounds['upper']).all()
+    for scenario in ('p10', 'p90'):
+        np.testing.assert_allclose(result['prediction_range'][scenario], plain['prediction_range'][scenario])
+
+
+def test_off_grid_sites_get_no_climatology(predictor, climatology):
+    cells, distances = climatology.nearest_cells([28.6, 28.9, 51.5], [77.2, 77.6, -0.1])
+    assert (cells == 0).all()
+    assert distances[0] < climatology.resolution and distances[1] < climatology.resolution
+    assert distances[2] > 50
+
+    with pytest.raises(ValueError, match='No climatology'):
+        climatology.forecast_weather(51.5, -0.1, '20300101', '20300110')
+    result = predictor.forecast_with_climatology(51.5, -0.1, '20300101', '20300110', climatology)
+    assert 'No climatology' in result['error']
+
+
+def test_future_prediction_uses_climatology_daily_only(predictor, climatology):
+    predictor.climatology = climatology
+
+    result = predictor.predict_with_nasa_data(28.6, 77.2, '20300101', '20300110', intervals=True,
+                                              include_analysis=False)
+    assert result['metadata']['source'] == 'climatology'
+    assert result['prediction_intervals']['lower'].shape == (10,)
+
+    result = predictor.predict_with_nasa_data(28.6, 77.2, '20300101', '20300110', temporal='hourly')
+    assert 'daily only' in result['error']
+
+
+DAYS = ['20240101', '20240102', '20240103']
+
+
+class PowerHandler(BaseHTTPRequestHandler):
+    """Minimal NASA POWER point endpoint with keep-alive"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        parameters = {name: {day: 5.0 + i for i, day in enumerate(DAYS)}
+                      for name in ('ALLSKY_SFC_SW_DWN', 'T2M', 'RH2M', 'WS2M')}
+        body = json.dumps({'properties': {'parameter': parameters}}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PowerHandler)
+    server.daemon_threads = True
+    server.connections = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def api(server):
+    api = npi.NASAPowerAPI()
+    api.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield api
+    api.close()
+
+
+def test_sequential_fetches_reuse_one_connection(api, server):
+    for _ in range(5):
+        weather = api.fetch_weather_data(28.6, 77.2, DAYS[0], DAYS[-1])
+        assert len(weather) == len(DAYS)
+    assert len(server.connections) == 1
+
+
+def test_threads_have_own_sessions_on_a_shared_pool(api, server):
+    def fetch(_):
+        return api.session, len(api.fetch_weather_data(28.6, 77.2, DAYS[0], DAYS[-1]))
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(fetch, range(12)))
+
+    assert all(length == len(DAYS) for _, length in results)
+    sessions = {id(session) for session, _ in results}
+    assert 1 <= len(sessions) <= 3
+    adapters = {id(session.get_adapter(api.base_url)) for session, _ in results}
+    assert adapters == {id(api._adapter)}
+    assert len(server.connections) <= 3
+
+
+def test_close_drops_pooled_connections(api, server):
+    api.fetch_weather_data(28.6, 77.2, DAYS[0], DAYS[-1])
+    api.close()
+    api.fetch_weather_data(28.6, 77.2, DAYS[0], DAYS[-1])
+    assert len(server.connections) == 2
+
+
+def test_session_is_created_lazily():
+    api = npi.NASAPowerAPI()
+    assert api._adapter is None
+    api.close()
+    assert api.session is api.session
+    assert api.session.headers['Connection'] == 'keep-alive'
+    api.close()
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+import native_boosters as nb
+
+
+@pytest.fixture
+def dataset():
+    rng = np.random.default_rng(0)
+    X = rng.random((300, 3))
+    return nb.BoosterDataset(X, X @ np.array([1.0, 2.0, 3.0]), ['a', 'b', 'c'])
+
+
+def test_subset_is_cached_by_exact_rows(dataset):
+    first = dataset.subset(np.arange(100))
+    assert dataset.subset(list(range(100))) is first
+    assert dataset.subset(np.arange(1, 101)) is not first
+    np.testing.assert_array_equal(first.X, dataset.X[:100])
+    np.testing.assert_array_equal(first.indices, np.arange(100))
+
+
+def test_subset_cache_is_bounded(dataset):
+    oldest = dataset.subset(np.arange(10))
+    for start in range(1, nb.MAX_CACHED_SUBSETS + 1):
+        dataset.subset(np.arange(start, start + 10))
+
+    assert len(dataset._subsets) == nb.MAX_CACHED_SUBSETS
+    assert dataset.subset(np.arange(10)) is not oldest
+
+
+def test_recently_used_subset_survives_eviction(dataset):
+    kept = dataset.subset(np.arange(10))
+    for start in range(1, nb.MAX_CACHED_SUBSETS + 2):
+        dataset.subset(np.arange(start, start + 10))
+        assert dataset.subset(np.arange(10)) is kept
+
+
+@pytest.mark.parametrize('model_name', ['XGBoost', 'LightGBM'])
+def test_fit_booster_on_subsets_early_stops(dataset, model_name):
+    train = dataset.subset(np.arange(200))
+    valid = dataset.subset(np.arange(200, 300))
+    model = nb.fit_booster(model_name, {'n_estimators': 500, 'learning_rate': 0.3, 'max_depth': 3},
+                           train, valid, early_stopping_rounds=10, n_jobs=1)
+
+    assert 1 <= model.best_iteration <= 500
+    assert model.params['n_estimators'] == model.best_iteration
+    assert model.predict(valid.X).shape == (100,)
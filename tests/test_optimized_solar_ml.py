@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+
+import optimized_solar_ml as osm
+
+
+@pytest.mark.parametrize('n_cores', [1, 3, 5, 8, 32])
+def test_allocate_cores_never_oversubscribes(n_cores):
+    names = list(osm.MODEL_COST_WEIGHTS)
+    allocation = osm.allocate_cores(names, n_cores)
+
+    assert set(allocation) == set(names)
+    assert sum(allocation.values()) == max(n_cores, len(names))
+    for name in osm.SINGLE_THREADED_MODELS:
+        assert allocation[name] == 1
+
+
+def test_shared_memory_round_trip():
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    shm, spec = osm._to_shared_memory(array)
+    try:
+        attached, view = osm._attach_shared_array(spec)
+        np.testing.assert_array_equal(view, array)
+        del view
+        attached.close()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_fit_worker_matches_in_process_fit():
+    rng = np.random.default_rng(0)
+    X = rng.random((200, 3))
+    y = X @ np.array([1.0, 2.0, 3.0])
+    columns = ['a', 'b', 'c']
+    model = RandomForestRegressor(n_estimators=5, random_state=0)
+
+    blocks = []
+    specs = {}
+    try:
+        for key, array in {'X_train': X[:150], 'X_test': X[150:], 'y_train': y[:150]}.items():
+            shm, specs[key] = osm._to_shared_memory(array)
+            blocks.append(shm)
+        name, fitted, y_pred, _ = osm._fit_model_worker('Random Forest', model, 1, specs, columns, False)
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+    expected = RandomForestRegressor(n_estimators=5, random_state=0).fit(
+        pd.DataFrame(X[:150], columns=columns), y[:150]
+    ).predict(pd.DataFrame(X[150:], columns=columns))
+    assert name == 'Random Forest'
+    np.testing.assert_allclose(y_pred, expected)
+
+
+def test_halving_takes_tree_count_from_a_round_on_all_fit_rows(monkeypatch):
+    rng = np.random.default_rng(0)
+    X = rng.random((1000, 4))
+    y = X @ np.array([1.0, 2.0, 3.0, 4.0]) + rng.normal(0, 0.1, 1000)
+
+    rounds = []
+    fit_booster = osm.fit_booster
+
+    def recording_fit_booster(model_name, params, train_data, valid_data=None, early_stopping_rounds=None):
+        model = fit_booster(model_name, params, train_data, valid_data, early_stopping_rounds)
+        rounds.append((len(train_data), valid_data is not None, model.best_iteration))
+        return model
+
+    monkeypatch.setattr(osm, 'fit_booster', recording_fit_booster)
+    model = osm.hyperparameter_tuning_halving('LightGBM', X, y, n_candidates=9, min_rows=50, eta=3)
+
+    # 9 candidates on 50 rows, 3 on 150, then the winner on all 800 fit rows
+    assert [size for size, _, _ in rounds[:12]] == [50] * 9 + [150] * 3
+    fit_rows, early_stopped, best_iteration = rounds[12]
+    assert (fit_rows, early_stopped) == (800, True)
+    assert rounds[-1][:2] == (1000, False)
+    assert model.params['n_estimators'] == best_iteration
+
+
+def test_unshuffled_split_tests_on_the_last_rows():
+    X = pd.DataFrame({'a': np.arange(100.0), 'b': np.arange(100.0) ** 2})
+    y = pd.Series(np.arange(100.0))
+
+    split = osm.split_optimized_data(X, y, shuffle=False)
+
+    np.testing.assert_array_equal(split['X_train'].index, np.arange(80))
+    np.testing.assert_array_equal(split['y_test'].index, np.arange(80, 100))
+    assert split['X_test_scaled'].shape == (20, 2)
+
+    shuffled = osm.split_optimized_data(X, y)
+    assert not (np.diff(shuffled['X_test'].index) > 0).all()
+
+
+def test_main_bins_the_booster_dataset_once(monkeypatch):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((200, 3)), columns=['a', 'b', 'c'])
+    y = pd.Series(100 * X['a'] + rng.normal(0, 10, 200))
+    X_train, X_test, y_train, y_test = X[:160], X[160:], y[:160], y[160:]
+    model = osm.fit_booster('XGBoost', {'n_estimators': 10}, osm.BoosterDataset(X_train, y_train), n_jobs=1)
+    results = {'XGBoost': {'model': model, **osm.calculate_metrics(y_test, model.predict(X_test))}}
+
+    built, seen = [], []
+    booster_dataset = osm.BoosterDataset
+    monkeypatch.setattr(osm, 'BoosterDataset', lambda *args: built.append(1) or booster_dataset(*args))
+    monkeypatch.setattr(osm, 'load_and_prepare_optimized_data', lambda: (X, y, list(X.columns), 'AC_POWER'))
+    monkeypatch.setattr(osm, 'train_optimized_models_parallel',
+                        lambda *args, **kwargs: (results, X_train, X_test, y_train, y_test, None))
+    monkeypatch.setattr(osm, 'create_ensemble_models', lambda *args: {})
+    monkeypatch.setattr(osm, 'hyperparameter_tuning_optimized',
+                        lambda *args, booster_data=None, **kwargs: seen.append(booster_data))
+    monkeypatch.setattr(osm, 'distill_model', lambda *args, **kwargs: (None, {}))
+    monkeypatch.setattr(osm, 'fit_interval_models',
+                        lambda *args, booster_data=None, **kwargs: seen.append(booster_data) or {})
+    monkeypatch.setattr(osm, 'save_optimized_model_and_results', lambda *args, **kwargs: pd.DataFrame())
+
+    osm.main()
+
+    assert len(built) == 1
+    assert len(seen) == 2 and seen[0] is seen[1] is not None
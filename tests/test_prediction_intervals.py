@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge
+from sklearn.tree import DecisionTreeRegressor
+
+import model_artifact as ma
+import optimized_solar_ml as osm
+import prediction_intervals as pi
+from native_boosters import BoosterDataset, fit_booster
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.random((600, 4)).astype(np.float32)
+    y = 100 * X[:, 0] + 20 * X[:, 1] ** 2 + rng.normal(0, 3, 600)
+    return X[:500], y[:500], X[500:], y[500:]
+
+
+@pytest.fixture(scope='module')
+def model_data(data):
+    X_train, y_train, X_test, y_test = data
+    model = RandomForestRegressor(n_estimators=20, max_depth=6, random_state=0).fit(X_train, y_train)
+    surrogate = DecisionTreeRegressor(max_depth=4, random_state=0).fit(X_train, model.predict(X_train))
+    return {
+        'model': model,
+        'scaler': None,
+        'surrogate': {'name': 'Small Tree', 'model': surrogate},
+        'interval_quantiles': list(pi.INTERVAL_QUANTILES),
+        'residual_quantiles': pi.residual_quantiles(y_test, model.predict(X_test)),
+        'surrogate_residual_quantiles': pi.residual_quantiles(y_test, surrogate.predict(X_test))
+    }
+
+
+def test_forest_intervals_use_tree_spread(model_data, data):
+    X_test = data[2]
+    intervals = pi.predict_intervals(model_data, X_test)
+
+    assert intervals['method'] == 'tree_spread'
+    np.testing.assert_allclose(intervals['prediction'], model_data['model'].predict(X_test))
+    width = intervals['upper'] - intervals['lower']
+    assert (width > 0).all()
+    np.testing.assert_allclose(intervals['prediction'], (intervals['lower'] + intervals['upper']) / 2)
+
+
+def test_surrogate_intervals_use_surrogate_residuals(model_data, data):
+    X_test = data[2]
+    intervals = pi.predict_intervals(model_data, X_test, use_surrogate=True)
+
+    assert intervals['method'] == 'residual_quantiles'
+    offsets = model_data['surrogate_residual_quantiles']
+    assert offsets != model_data['residual_quantiles']
+    np.testing.assert_allclose(intervals['upper'] - intervals['lower'], offsets[1] - offsets[0])
+
+
+def test_artifact_keeps_interval_methods(tmp_path, model_data, data):
+    X_test = data[2]
+    path = str(tmp_path / 'model.artifact')
+    ma.save_artifact(model_data, path)
+    loaded = ma.load_artifact(path)
+
+    assert loaded['model'].ensemble == 'forest'
+    assert loaded['surrogate']['model'].ensemble == 'tree'
+    for use_surrogate in (False, True):
+        expected = pi.predict_intervals(model_data, X_test, use_surrogate)
+        intervals = pi.predict_intervals(loaded, X_test, use_surrogate)
+        assert intervals['method'] == expected['method']
+        np.testing.assert_allclose(intervals['lower'], expected['lower'], rtol=1e-4, atol=1e-3)
+        np.testing.assert_allclose(intervals['upper'], expected['upper'], rtol=1e-4, atol=1e-3)
+
+
+def test_single_tree_is_not_a_forest(model_data):
+    ensemble = ma.quantize_trees([model_data['surrogate']['model']], 4)
+    # Artifacts written before the ensemble kind was stored
+    assert ensemble.ensemble is None
+    assert not pi.is_forest(ensemble)
+    assert pi.is_forest(ma.quantize_trees(model_data['model'].estimators_, 4, scale=1 / 20))
+
+
+def test_intervals_without_interval_data_are_empty(data):
+    X_train, y_train, X_test, _ = data
+    model_data = {'model': Ridge().fit(X_train, y_train), 'scaler': None}
+    intervals = pi.predict_intervals(model_data, X_test)
+    assert intervals['method'] is None
+    assert intervals['lower'] is None and intervals['upper'] is None
+
+
+def test_quantile_booster_uses_tuned_parameters(data, monkeypatch):
+    X_train, y_train, X_test, y_test = data
+    tuned = fit_booster('LightGBM', {'n_estimators': 40, 'max_depth': 3, 'learning_rate': 0.2},
+                        BoosterDataset(X_train, y_train), n_jobs=1)
+    fitted = []
+    monkeypatch.setattr(osm, 'fit_quantile_booster',
+                        lambda name, params, *args, **kwargs: fitted.append(params) or
+                        pi.fit_quantile_booster(name, params, *args, n_jobs=1, **kwargs))
+
+    intervals = osm.fit_interval_models(tuned, 'LightGBM', None, X_train, y_train, X_test, y_test)
+
+    assert fitted == [tuned.params]
+    bounds = intervals['quantile_model'].predict(X_test)
+    assert bounds.shape == (len(X_test), 2)
+    assert (bounds[:, 0] <= bounds[:, 1]).all()
+    # Roughly 80% of held-out targets fall inside the bounds
+    coverage = np.mean((y_test >= bounds[:, 0]) & (y_test <= bounds[:, 1]))
+    assert 0.5 < coverage <= 1.0
+    assert 'surrogate_residual_quantiles' not in intervals
@@ -0,0 +1,92 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import response_encoding as encoding
+
+
+@pytest.fixture
+def result():
+    n = 10
+    weather = pd.DataFrame({
+        'DATE': pd.date_range('2024-01-01', periods=n, freq='D'),
+        'SOLAR_RADIATION': np.linspace(100, 1000, n),
+        'TEMPERATURE': np.arange(n, dtype=float),
+        'SEASON': ['winter'] * n
+    })
+    predictions = np.linspace(0, 90, n)
+    return {
+        'weather_data': weather,
+        'predictions': predictions,
+        'prediction_intervals': {'lower': predictions - 5, 'upper': predictions + 5, 'method': 'tree_spread'},
+        'analysis': {'avg': np.float64(1.5), 'days': (1, 2)},
+        'metadata': {'coordinates': (28.6, 77.2), 'temporal_resolution': 'daily'}
+    }
+
+
+def test_columns_include_predictions_and_project_fields(result):
+    columns = encoding.response_columns(result)
+    assert list(columns) == ['DATE', 'SOLAR_RADIATION', 'TEMPERATURE', 'SEASON',
+                             'PREDICTED_POWER', 'PREDICTION_LOWER', 'PREDICTION_UPPER']
+    assert columns['DATE'][1] - columns['DATE'][0] == 86400000
+
+    columns = encoding.response_columns(result, fields=['TEMPERATURE', 'PREDICTED_POWER'])
+    assert list(columns) == ['DATE', 'TEMPERATURE', 'PREDICTED_POWER']
+
+
+def test_downsample_averages_buckets():
+    columns = {'DATE': np.arange(10), 'VALUE': np.arange(10, dtype=float), 'LABEL': np.array(list('abcdefghij'))}
+    downsampled = encoding.downsample_columns(columns, 3)
+
+    np.testing.assert_array_equal(downsampled['DATE'], [0, 3, 6])
+    np.testing.assert_allclose(downsampled['VALUE'], [1, 4, 7.5])
+    np.testing.assert_array_equal(downsampled['LABEL'], ['a', 'd', 'g'])
+    assert encoding.downsample_columns(columns, 20) is columns
+
+
+def test_json_encoding_is_plain_json(result):
+    result['weather_data'].loc[3, 'TEMPERATURE'] = np.nan
+    document = encoding.encode_prediction_response(result, decimals=1)
+
+    assert document['length'] == 10
+    assert document['columns']['TEMPERATURE'][3] is None
+    assert document['metadata']['coordinates'] == [28.6, 77.2]
+    assert document['analysis'] == {'avg': 1.5, 'days': [1, 2]}
+    assert json.loads(json.dumps(document)) == document
+
+
+def test_binary_round_trip(result):
+    payload = encoding.encode_prediction_response(result, max_points=5, binary=True)
+    decoded = encoding.decode_binary_response(payload)
+    expected = encoding.downsample_columns(encoding.response_columns(result), 5)
+
+    assert decoded['length'] == 5
+    assert decoded['metadata']['temporal_resolution'] == 'daily'
+    assert list(decoded['columns']) == list(expected)
+    for name, values in expected.items():
+        if values.dtype.kind == 'f':
+            assert decoded['columns'][name].dtype == np.float32
+            np.testing.assert_allclose(decoded['columns'][name], values, rtol=1e-6)
+        elif values.dtype.kind in 'iu':
+            np.testing.assert_array_equal(decoded['columns'][name], values)
+        else:
+            assert [value.decode('utf-8') for value in decoded['columns'][name]] == list(values)
+
+
+def test_errors_pass_through():
+    assert encoding.encode_prediction_response({'error': 'boom'}) == {'error': 'boom'}
+    payload = encoding.encode_prediction_response({'error': 'boom'}, binary=True)
+    assert encoding.decode_binary_response(payload) == {'error': 'boom', 'columns': {}}
+    with pytest.raises(ValueError):
+        encoding.decode_binary_response(b'not a response')
+
+
+def test_non_ascii_text_columns_round_trip(result):
+    names = ['São Paulo', 'Zürich', 'दिल्ली', '東京', 'Plant A'] * 2
+    result['weather_data']['SITE'] = names
+
+    decoded = encoding.decode_binary_response(encoding.encode_prediction_response(result, binary=True))
+    assert [value.decode('utf-8') for value in decoded['columns']['SITE']] == names
+    assert encoding.encode_prediction_response(result)['columns']['SITE'] == names
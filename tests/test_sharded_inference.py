@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+import nasa_power_integration as npi
+from sharded_inference import ShardedPredictor
+from prediction_intervals import predict_intervals
+
+
+@pytest.fixture(scope='module')
+def features():
+    rng = np.random.default_rng(3)
+    X = np.column_stack([rng.uniform(0, 1000, 301), rng.uniform(10, 40, 301)])
+    return np.column_stack([X, X[:, 0] ** 2, np.ones(301), np.zeros(301)]).astype(np.float32)
+
+
+def test_sharded_intervals_match_in_process(model_path, features):
+    model_data = npi.load_model_data(model_path)
+    expected = predict_intervals(model_data, features)
+
+    with ShardedPredictor(model_path, n_workers=2, min_rows=0) as predictor:
+        sharded = predictor.predict_intervals(features)
+        np.testing.assert_allclose(predictor.predict(features), expected['prediction'])
+
+    assert sharded['method'] == expected['method'] == 'tree_spread'
+    assert sharded['quantiles'] == expected['quantiles']
+    for key in ('prediction', 'lower', 'upper'):
+        np.testing.assert_allclose(sharded[key], expected[key])
+
+
+def test_small_interval_batches_stay_in_process(model_path, features, monkeypatch):
+    model_data = npi.load_model_data(model_path)
+    with ShardedPredictor(model_path, n_workers=2, min_rows=10000) as predictor:
+        monkeypatch.setattr(predictor.executor, 'map', None)
+        result = predictor.predict_intervals(features)
+    np.testing.assert_allclose(result['upper'], predict_intervals(model_data, features)['upper'])
+
+
+def test_predictor_routes_intervals_through_pool(model_path, features):
+    predictor = npi.EnhancedSolarPredictor(model_path)
+    expected = predictor._make_ml_interval_predictions(features)
+    pool = predictor.enable_sharded_inference(n_workers=2, min_rows=0)
+    try:
+        calls = []
+        predict = pool.predict_intervals
+        pool.predict_intervals = lambda *args: calls.append(len(args[0])) or predict(*args)
+        result = predictor._make_ml_interval_predictions(features)
+    finally:
+        pool.close()
+        predictor.nasa_api.close()
+
+    assert calls == [len(features)]
+    np.testing.assert_allclose(result['lower'], expected['lower'])
@@ -0,0 +1,84 @@
+import json
+import os
+import time
+
+import solar_benchmark as sb
+
+
+def write_baseline(path, results):
+    path.write_text(json.dumps({'results': results}))
+    return str(path)
+
+
+def test_regressions_flag_slower_and_larger_runs(tmp_path):
+    baseline = write_baseline(tmp_path / 'baseline.json', {
+        'fit_xgboost': {'wall_seconds': 1.0, 'peak_rss_mb': 100.0},
+        'features': {'wall_seconds': 1.0, 'peak_rss_mb': 100.0},
+        'clean': {'wall_seconds': 1.0, 'peak_rss_mb': 100.0}
+    })
+    results = {
+        'fit_xgboost': {'wall_seconds': 1.3, 'peak_rss_mb': 100.0},
+        'features': {'wall_seconds': 1.1, 'peak_rss_mb': 150.0},
+        'clean': {'wall_seconds': 1.19, 'peak_rss_mb': 119.0}
+    }
+
+    regressions = sb.check_regressions(results, baseline, tolerance=0.2)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith('fit_xgboost: wall time')
+    assert regressions[1].startswith('features: peak RSS')
+
+
+def test_errors_and_new_benchmarks_are_not_gated(tmp_path):
+    baseline = write_baseline(tmp_path / 'baseline.json', {
+        'clean': {'error': 'ImportError: clean'},
+        'features': {'wall_seconds': 1.0, 'peak_rss_mb': None}
+    })
+    results = {
+        'clean': {'wall_seconds': 10.0, 'peak_rss_mb': 10.0},
+        'features': {'wall_seconds': 1.0, 'peak_rss_mb': 500.0},
+        'fit_lightgbm': {'wall_seconds': 10.0, 'peak_rss_mb': 10.0},
+        'nasa_decode': {'error': 'ValueError: bad payload'}
+    }
+    assert sb.check_regressions(results, baseline) == []
+
+
+def test_missing_baseline_passes(tmp_path):
+    assert sb.check_regressions({'clean': {'wall_seconds': 1.0}}, str(tmp_path / 'missing.json')) == []
+
+
+def test_history_appends_one_line_per_run(tmp_path):
+    history = tmp_path / 'benchmarks' / 'history.jsonl'
+    sb.record_history({'clean': {'wall_seconds': 1.0}}, 100, str(history))
+    sb.record_history({'clean': {'wall_seconds': 2.0}}, 200, str(history))
+
+    entries = [json.loads(line) for line in history.read_text().splitlines()]
+    assert [entry['rows'] for entry in entries] == [100, 200]
+    assert entries[1]['results']['clean']['wall_seconds'] == 2.0
+
+
+def test_benchmark_names_cover_every_model_and_batch():
+    names = sb.build_benchmarks(100, ['Random Forest'])
+    assert 'fit_random_forest' in names
+    assert {f'predict_random_forest_batch{size}' for size in sb.PREDICT_BATCH_SIZES} <= set(names)
+
+
+def test_isolated_run_reports_throughput():
+    results = sb.run_benchmarks(200, models=['Elastic Net'], only=['features'])
+    assert set(results) == {'features'}
+    assert results['features']['rows'] > 0
+    assert results['features']['wall_seconds'] > 0
+
+
+def test_crashed_and_stuck_benchmarks_are_recorded(monkeypatch):
+    # Child processes that die without reporting, or never finish
+    monkeypatch.setattr(sb, 'build_benchmarks', lambda n_rows, models: {
+        'crash': (os._exit, (3,)),
+        'stuck': (time.sleep, (60,))
+    })
+    start = time.monotonic()
+    results = sb.run_benchmarks(100, models=['Elastic Net'], timeout=2)
+
+    assert 'code 3' in results['crash']['error']
+    assert 'timed out' in results['stuck']['error']
+    assert time.monotonic() - start < 30
@@ -0,0 +1,77 @@
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import nasa_power_integration as npi
+import solar_cli
+
+
+def test_every_subcommand_parses():
+    parser = solar_cli.build_parser()
+    args = parser.parse_args(['train', '--prune', '--model-selection', 'time_series'])
+    assert args.prune and args.model_selection == 'time_series'
+    assert not parser.parse_args(['train']).prune
+
+    args = parser.parse_args(['predict', '28.6', '77.2', '20240101', '20240131', '--intervals', '--surrogate'])
+    assert (args.latitude, args.longitude, args.temporal) == (28.6, 77.2, 'daily')
+    assert args.intervals and args.surrogate and args.fields is None
+
+    for command in solar_cli.FORWARDED_COMMANDS:
+        assert parser.parse_known_args([command, '--help'])[0].module == solar_cli.FORWARDED_COMMANDS[command][0]
+
+
+def test_train_forwards_prune(monkeypatch):
+    import optimized_solar_ml
+
+    calls = []
+    monkeypatch.setattr(optimized_solar_ml, 'main', lambda **kwargs: calls.append(kwargs))
+    solar_cli.main(['train', '--prune'])
+    solar_cli.main(['train'])
+    assert calls == [{'model_selection': 'holdout', 'prune_features': True},
+                     {'model_selection': 'holdout', 'prune_features': False}]
+
+
+def test_forwarded_commands_keep_their_arguments(monkeypatch):
+    calls = []
+    monkeypatch.setattr(solar_cli.runpy, 'run_module', lambda module, **kwargs: calls.append((module, sys.argv[1:])))
+    solar_cli.main(['pipeline', '--tuning-mode', 'random', '--prune'])
+    assert calls == [('solar_pipeline', ['--tuning-mode', 'random', '--prune'])]
+
+
+@pytest.mark.parametrize('argv', [
+    ['predict', '0', '0', '20240101', '20240102', '--binary'],
+    ['startup', 'nope'],
+    ['analyze', 'weather.csv', '--unknown']
+])
+def test_invalid_arguments_exit(argv, capsys):
+    with pytest.raises(SystemExit):
+        solar_cli.main(argv)
+    assert 'error' in capsys.readouterr().err
+
+
+def test_predict_prints_columnar_response(model_path, monkeypatch, capsys):
+    def fetch(self, latitude, longitude, start_date, end_date, temporal='daily'):
+        return pd.DataFrame({
+            'DATE': pd.date_range('2024-01-01', periods=5, freq='D'),
+            'SOLAR_RADIATION': np.linspace(200, 800, 5),
+            'TEMPERATURE_C': np.full(5, 30.0)
+        })
+
+    monkeypatch.setattr(npi.NASAPowerAPI, 'fetch_weather_data', fetch)
+    solar_cli.main(['predict', '28.6', '77.2', '20240101', '20240105', '--model', model_path,
+                    '--intervals', '--no-analysis', '--fields', 'PREDICTED_POWER', 'PREDICTION_LOWER'])
+
+    response = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert response['length'] == 5
+    assert list(response['columns']) == ['DATE', 'PREDICTED_POWER', 'PREDICTION_LOWER']
+    assert all(lower <= power for lower, power in
+               zip(response['columns']['PREDICTION_LOWER'], response['columns']['PREDICTED_POWER']))
+
+
+def test_startup_times_the_cli_in_a_fresh_interpreter(capsys):
+    solar_cli.main(['startup', 'cli', '--repeats', '1'])
+    line = capsys.readouterr().out.strip().splitlines()[-1]
+    assert line.split()[0] == 'cli' and float(line.split()[1]) > 0
@@ -0,0 +1,52 @@
+import numpy as np
+from sklearn.linear_model import LinearRegression, Ridge
+
+from solar_ensembles import build_stacking_ensemble, build_voting_ensemble
+
+
+class FittedConstant:
+    """Fitted stand-in that fails if anything tries to refit it"""
+
+    def __init__(self, slope):
+        self.slope = slope
+
+    def fit(self, X, y):
+        raise AssertionError("base models must not be refitted")
+
+    def get_params(self, deep=True):
+        return {'slope': self.slope}
+
+    def predict(self, X):
+        return np.asarray(X)[:, 0] * self.slope
+
+
+def test_voting_averages_fitted_models():
+    models = {'a': FittedConstant(1.0), 'b': FittedConstant(3.0)}
+    X = np.array([[1.0], [2.0]])
+
+    voting = build_voting_ensemble(models, ['a', 'b'])
+    np.testing.assert_allclose(voting.predict(X), [2.0, 4.0])
+
+    weighted = build_voting_ensemble(models, ['a', 'b'], weights=[3, 1])
+    np.testing.assert_allclose(weighted.predict(X), [1.5, 3.0])
+
+
+def test_stacking_fits_only_the_meta_learner_on_the_blend_slice():
+    models = {'a': FittedConstant(1.0), 'b': FittedConstant(2.0)}
+    X_blend = np.linspace(0, 1, 50)[:, None]
+    y_blend = 4.0 * X_blend[:, 0]
+
+    stacking = build_stacking_ensemble(models, ['a', 'b'], LinearRegression(), X_blend, y_blend)
+
+    np.testing.assert_allclose(stacking.predict(np.array([[0.5]])), [2.0])
+    assert set(stacking.named_estimators_) == {'a', 'b'}
+
+
+def test_meta_learner_is_cloned():
+    final_estimator = Ridge(alpha=1.0)
+    X_blend = np.arange(10, dtype=float)[:, None]
+    stacking = build_stacking_ensemble({'a': FittedConstant(1.0)}, ['a'], final_estimator,
+                                       X_blend, X_blend[:, 0])
+
+    assert not hasattr(final_estimator, 'coef_')
+    assert hasattr(stacking.final_estimator_, 'coef_')
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import solar_geometry as sg
+
+
+@pytest.mark.parametrize('latitude', [0.0, 23.0, 45.0, -30.0])
+def test_noon_zenith_is_latitude_minus_declination(latitude):
+    noon = pd.DatetimeIndex(['2024-06-21 12:00'])
+    zenith, _ = sg.solar_position(noon, latitude, 0.0)
+    # Declination is about +23.44° at the June solstice
+    assert zenith[0] == pytest.approx(abs(latitude - 23.44), abs=0.5)
+
+
+def test_sun_rises_east_and_sets_west():
+    times = pd.DatetimeIndex(['2024-03-20 08:00', '2024-03-20 12:00', '2024-03-20 16:00'])
+    zenith, azimuth = sg.solar_position(times, 28.6, 77.2)
+
+    assert zenith[1] < zenith[0] and zenith[1] < zenith[2]
+    assert 60 < azimuth[0] < 150
+    assert azimuth[1] == pytest.approx(180, abs=1)
+    assert 210 < azimuth[2] < 300
+
+
+def test_utc_times_are_shifted_by_longitude():
+    lst_noon = pd.DatetimeIndex(['2024-03-20 12:00'])
+    utc_noon_at_90e = pd.DatetimeIndex(['2024-03-20 06:00'])
+    zenith_lst, _ = sg.solar_position(lst_noon, 10.0, 90.0)
+    zenith_utc, _ = sg.solar_position(utc_noon_at_90e, 10.0, 90.0, time_standard='UTC')
+    # Equal up to the equation of time (about 8 minutes, 2° of hour angle, in March)
+    assert zenith_utc[0] == pytest.approx(zenith_lst[0], abs=2.5)
+
+
+def test_module_temperature_at_noct_conditions():
+    assert sg.module_temperature(20.0, 800.0) == pytest.approx(sg.NOCT)
+    assert sg.module_temperature(30.0, 0.0) == pytest.approx(30.0)
+    # Wind cools the module; at 1 m/s the correction factor is exactly 1
+    assert sg.module_temperature(20.0, 800.0, wind_speed=1.0) == pytest.approx(sg.NOCT)
+    assert sg.module_temperature(20.0, 800.0, wind_speed=5.0) < sg.NOCT
+
+
+def frame(hourly):
+    dates = pd.date_range('2024-05-01', periods=48 if hourly else 5, freq='h' if hourly else 'D')
+    df = pd.DataFrame({
+        'DATE': dates,
+        'DAY': dates.day,
+        'MONTH': dates.month,
+        'TEMPERATURE_C': 30.0,
+        'SOLAR_RADIATION': np.linspace(0, 900, len(dates))
+    })
+    if hourly:
+        df['HOUR'] = dates.hour
+    return df
+
+
+def test_hourly_frames_get_geometry_and_noct_module_temperature():
+    df = sg.add_solar_geometry_features(frame(hourly=True), 28.6, 77.2)
+
+    assert {'HOUR_SIN', 'HOUR_COS', 'SOLAR_ZENITH', 'SOLAR_AZIMUTH'} <= set(df.columns)
+    np.testing.assert_allclose(df['MODULE_TEMPERATURE_C'],
+                               30.0 + (sg.NOCT - 20) / 800 * df['SOLAR_RADIATION'])
+    np.testing.assert_allclose(df['TEMP_DIFF'], df['MODULE_TEMPERATURE_C'] - 30.0)
+
+
+def test_daily_frames_keep_ambient_module_temperature():
+    df = sg.add_solar_geometry_features(frame(hourly=False), 28.6, 77.2)
+
+    assert 'SOLAR_ZENITH' not in df.columns and 'HOUR_SIN' not in df.columns
+    assert (df['MODULE_TEMPERATURE_C'] == df['TEMPERATURE_C']).all()
+    assert (df['TEMP_DIFF'] == 0).all()
@@ -0,0 +1,107 @@
+import contextlib
+import pickle
+
+import numpy as np
+import pytest
+from sklearn.tree import DecisionTreeRegressor
+
+import optimized_solar_ml as osm
+import solar_pipeline as sp
+from synthetic_solar_data import synthetic_merged_frame
+
+
+def test_stage_key_depends_on_every_part():
+    assert sp.stage_key('fit', 'abc', {'a': 1, 'b': 2}) == sp.stage_key('fit', 'abc', {'b': 2, 'a': 1})
+    assert sp.stage_key('fit', 'abc', {'a': 1}) != sp.stage_key('fit', 'abd', {'a': 1})
+    assert sp.stage_key('fit', 'abc') != sp.stage_key('abc', 'fit')
+
+
+def test_stage_cache_reuses_and_forces(tmp_path):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'value': len(calls)}
+
+    assert sp.StageCache(str(tmp_path)).run('fit:XGBoost', 'k1', compute) == {'value': 1}
+    assert sp.StageCache(str(tmp_path)).run('fit:XGBoost', 'k1', compute) == {'value': 1}
+    assert sp.StageCache(str(tmp_path)).run('fit:XGBoost', 'k2', compute) == {'value': 2}
+    # Forcing a stage name recomputes all of its per-model variants
+    assert sp.StageCache(str(tmp_path), ['fit']).run('fit:XGBoost', 'k1', compute) == {'value': 3}
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+@pytest.fixture(scope='module')
+def workdir(tmp_path_factory):
+    workdir = tmp_path_factory.mktemp('pipeline')
+    synthetic_merged_frame(800).to_csv(workdir / 'merged.csv', index=False)
+    with contextlib.chdir(workdir):
+        first = sp.run_pipeline(['merged.csv'], cache_dir='cache', tuning_mode='random')
+    return workdir, first
+
+
+def run_recording_fits(workdir, monkeypatch, **kwargs):
+    fitted = []
+    fit_optimized_model = osm.fit_optimized_model
+
+    def recording_fit(name, *args, **fit_kwargs):
+        fitted.append(name)
+        return fit_optimized_model(name, *args, **fit_kwargs)
+
+    monkeypatch.setattr(osm, 'fit_optimized_model', recording_fit)
+    with contextlib.chdir(workdir):
+        results = sp.run_pipeline(['merged.csv'], cache_dir='cache', tuning_mode='random', **kwargs)
+    return fitted, results
+
+
+def test_rerun_uses_every_checkpoint(workdir, monkeypatch):
+    workdir, first = workdir
+    fitted, results = run_recording_fits(workdir, monkeypatch)
+
+    assert fitted == []
+    assert results.equals(first)
+    assert (workdir / 'optimized_solar_power_model.pkl').exists()
+
+
+def test_override_retrains_only_that_model(workdir, monkeypatch):
+    workdir, first = workdir
+    fitted, results = run_recording_fits(workdir, monkeypatch,
+                                         model_overrides={'Elastic Net': {'alpha': 0.5}})
+
+    assert fitted == ['Elastic Net']
+    assert set(results['Model']) == set(first['Model'])
+
+
+def test_distill_stage_is_checkpointed_and_saved(workdir, monkeypatch):
+    workdir, _ = workdir
+    monkeypatch.setattr(sp, 'distill_model', lambda *args, **kwargs: pytest.fail("distill re-ran"))
+    run_recording_fits(workdir, monkeypatch)
+    assert list((workdir / 'cache').glob('distill_*.pkl'))
+
+    # A forced distill stage saves exactly the student it chose
+    chosen = {}
+
+    def distill(teacher, X_train, X_test, y_test, teacher_scaler=None):
+        soft_targets = teacher.predict(teacher_scaler.transform(X_train) if teacher_scaler is not None else X_train)
+        chosen.update(name='Stub Tree', model=DecisionTreeRegressor(max_depth=3).fit(X_train, soft_targets))
+        return dict(chosen), {}
+
+    monkeypatch.setattr(sp, 'distill_model', distill)
+    run_recording_fits(workdir, monkeypatch, force_stages=['distill', 'intervals'])
+    with open(workdir / 'optimized_solar_power_model.pkl', 'rb') as f:
+        saved = pickle.load(f)['surrogate']
+    assert saved['name'] == 'Stub Tree'
+    np.testing.assert_array_equal(saved['model'].tree_.value, chosen['model'].tree_.value)
+
+
+def test_interval_stage_is_checkpointed_and_saved(workdir, monkeypatch):
+    workdir, _ = workdir
+    monkeypatch.setattr(osm, 'fit_interval_models', lambda *args, **kwargs: pytest.fail("intervals re-ran"))
+    run_recording_fits(workdir, monkeypatch)
+
+    assert list((workdir / 'cache').glob('intervals_*.pkl'))
+    with open(workdir / 'optimized_solar_power_model.pkl', 'rb') as f:
+        saved = pickle.load(f)
+    assert len(saved['residual_quantiles']) == 2
+    assert saved['residual_quantiles'][0] <= saved['residual_quantiles'][1]
+    assert ('surrogate_residual_quantiles' in saved) == (saved.get('surrogate') is not None)
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from nasa_power_integration import PhysicalAnalysis
+from streaming_analysis import QuantileSketch, RunningStats, StreamingPhysicalAnalysis
+
+
+def test_running_stats_match_numpy_across_batches_and_merges():
+    values = np.random.default_rng(0).normal(100, 15, 10001)
+    left = RunningStats()
+    for batch in np.array_split(values[:6000], 7):
+        left.update(batch)
+    right = RunningStats().update(values[6000:])
+    stats = left.merge(right)
+
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(values.mean())
+    assert stats.std == pytest.approx(values.std(ddof=1))
+    assert (stats.min, stats.max) == (values.min(), values.max())
+
+
+def test_running_stats_ignore_nan_and_empty_batches():
+    stats = RunningStats().update([]).update([np.nan, 1.0, 3.0])
+    assert stats.count == 2
+    assert stats.mean == 2.0
+    assert np.isnan(RunningStats().update([5.0]).std)
+
+
+@pytest.mark.parametrize('k', [100, 200])
+def test_sketch_rank_error_stays_near_one_over_k(k):
+    values = np.random.default_rng(1).lognormal(5, 1, 50000)
+    sketch = QuantileSketch(k)
+    for batch in np.array_split(values, 50):
+        sketch.update(batch)
+
+    ordered = np.sort(values)
+    assert sketch.count == len(values)
+    for q in [0.01, 0.1, 0.3, 0.5, 0.9, 0.99]:
+        true_rank = np.searchsorted(ordered, sketch.quantile(q)) / len(values)
+        assert abs(true_rank - q) <= 3 / k, q
+    # Memory is O(k log n), not O(n)
+    assert sum(len(level) for level in sketch.levels) < 2 * k * np.log2(len(values))
+
+
+def test_merged_sketches_match_one_sketch():
+    values = np.random.default_rng(2).uniform(0, 1, 40000)
+    merged = QuantileSketch(200).update(values[:10000])
+    for part in np.array_split(values[10000:], 3):
+        merged.merge(QuantileSketch(200).update(part))
+
+    assert merged.count == len(values)
+    assert merged.rank(0.5) == pytest.approx(np.sum(values < 0.5), rel=0.02)
+    assert merged.quantile(0.3) == pytest.approx(0.3, abs=0.015)
+
+
+def test_streaming_analysis_matches_batch_analysis():
+    rng = np.random.default_rng(3)
+    n_days = 3000
+    weather = pd.DataFrame({
+        'SOLAR_RADIATION': rng.uniform(50, 950, n_days),
+        'TEMPERATURE_C': rng.uniform(10, 45, n_days),
+        'HUMIDITY': rng.uniform(20, 95, n_days)
+    })
+    power = rng.uniform(100, 600, n_days)
+
+    streaming = StreamingPhysicalAnalysis()
+    for start in range(0, n_days, 365):
+        streaming.update(weather[start:start + 365], power[start:start + 365])
+    summary = streaming.summary()
+    expected = PhysicalAnalysis().summarize_sites(weather, predicted_power=power).iloc[0]
+
+    for metric, value in summary.items():
+        if metric.startswith('cloudy_days'):
+            # Sketch-based, rank error about 1/k
+            assert value == pytest.approx(expected[metric], rel=0.05)
+        else:
+            assert value == pytest.approx(expected[metric]), metric
+    assert set(summary) == set(expected.index)
+    assert streaming.analysis()['recommendations'] == \
+        PhysicalAnalysis().analyze_solar_performance(weather, pd.Series(power))['recommendations']
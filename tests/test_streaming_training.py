@@ -0,0 +1,72 @@
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import streaming_training as st
+from optimized_solar_ml import FEATURE_COLUMNS, TARGET_COLUMN
+
+
+def chunks(n_chunks=5, rows=400):
+    rng = np.random.default_rng(1)
+    for _ in range(n_chunks):
+        X = rng.random((rows, 3), dtype=np.float32)
+        yield X, X.sum(axis=1)
+
+
+@pytest.mark.parametrize('max_validation_rows', [0, 50, 100000])
+def test_holdout_split_loses_no_rows(max_validation_rows):
+    holdout = st.StreamingHoldout(0.1, max_validation_rows, random_state=3)
+    n_train = 0
+    for X, y in chunks():
+        X_train, y_train = holdout.split(X, y)
+        n_train += len(y_train)
+
+    X_val, y_val = holdout.validation_set()
+    assert len(y_val) == holdout.n_validation <= max_validation_rows
+    assert n_train + len(y_val) == 5 * 400
+    if max_validation_rows:
+        assert len(y_val) > 0
+
+
+def test_holdout_replay_repeats_the_validation_draw():
+    holdout = st.StreamingHoldout(0.2, 150, random_state=7)
+    masks = [holdout.validation_mask(len(y)) for _, y in chunks()]
+
+    replay = holdout.replay()
+    for mask, (_, y) in zip(masks, chunks()):
+        np.testing.assert_array_equal(replay.validation_mask(len(y)), mask)
+    assert replay.n_validation == holdout.n_validation == 150
+
+
+def test_holdout_seed_changes_the_draw():
+    first = st.StreamingHoldout(0.5, random_state=1).validation_mask(1000)
+    second = st.StreamingHoldout(0.5, random_state=2).validation_mask(1000)
+    assert (first != second).any()
+
+
+@pytest.fixture
+def partitions(tmp_path):
+    rng = np.random.default_rng(0)
+    for part in range(3):
+        X = rng.random((300, len(FEATURE_COLUMNS)))
+        df = pd.DataFrame(X, columns=FEATURE_COLUMNS)
+        df[TARGET_COLUMN] = 1000 * df['IRRADIATION'] + 10 * df['AMBIENT_TEMPERATURE']
+        df.to_csv(tmp_path / f"part-{part}.csv", index=False)
+    return str(tmp_path / "part-*.csv")
+
+
+@pytest.mark.parametrize('model_name', st.STREAMING_MODELS)
+def test_train_streaming_fits_each_model(partitions, model_name):
+    result = st.train_streaming(partitions, model_name, max_validation_rows=60,
+                                engineer_features=False, random_state=5)
+    assert result['r2'] > 0.5
+
+
+def test_import_does_not_load_boosters():
+    code = "import sys, streaming_training; print('xgboost' in sys.modules or 'lightgbm' in sys.modules)"
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                            cwd=st.__file__.rsplit('/', 1)[0] or '.').stdout
+    assert output.strip() == 'False'
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import synthetic_solar_data as ssd
+
+
+def concat_chunks(**kwargs):
+    parts = list(ssd.generate_chunks(**kwargs))
+    generation = pd.concat([generation for _, _, generation, _ in parts], ignore_index=True)
+    weather = pd.concat([weather for _, _, _, weather in parts], ignore_index=True)
+    return generation, weather
+
+
+def test_output_does_not_depend_on_chunking():
+    scale = {'n_plants': 2, 'n_inverters': 3, 'n_timestamps': 96 * 5, 'seed': 7}
+    generation_a, weather_a = concat_chunks(chunk_days=1, **scale)
+    generation_b, weather_b = concat_chunks(chunk_days=4, **scale)
+
+    pd.testing.assert_frame_equal(generation_a, generation_b)
+    pd.testing.assert_frame_equal(weather_a, weather_b)
+
+
+def test_seed_changes_the_data():
+    generation_a, _ = concat_chunks(n_plants=1, n_inverters=2, n_timestamps=96, seed=1)
+    generation_b, _ = concat_chunks(n_plants=1, n_inverters=2, n_timestamps=96, seed=2)
+    assert not np.allclose(generation_a['AC_POWER'], generation_b['AC_POWER'])
+
+
+def test_schema_and_physical_ranges():
+    generation, weather = concat_chunks(n_plants=1, n_inverters=4, n_timestamps=96 * 2)
+
+    assert list(generation.columns) == ssd.GENERATION_COLUMNS
+    assert list(weather.columns) == ssd.WEATHER_COLUMNS
+    assert len(generation) == 4 * len(weather) == 4 * 96 * 2
+    assert (generation['AC_POWER'] <= generation['DC_POWER']).all()
+    assert (weather['IRRADIATION'] >= 0).all()
+    # Night readings produce nothing, and the totals only grow
+    night = weather['DATE_TIME'].dt.hour.isin([0, 1, 2, 23])
+    assert (weather.loc[night, 'IRRADIATION'] == 0).all()
+    for _, inverter in generation.groupby('SOURCE_KEY'):
+        assert (np.diff(inverter['TOTAL_YIELD']) >= 0).all()
+
+
+@pytest.mark.parametrize('file_format', ['csv', 'parquet'])
+def test_written_partitions_match_the_stream(tmp_path, file_format):
+    if file_format == 'parquet' and not ssd.HAS_PYARROW:
+        pytest.skip("pyarrow not installed")
+    written = ssd.generate_solar_dataset(str(tmp_path), n_plants=1, n_inverters=2, n_timestamps=96 * 3,
+                                         chunk_days=2, file_format=file_format, kinds=('merged',))
+
+    assert len(written['merged']) == 2
+    read = pd.read_csv if file_format == 'csv' else pd.read_parquet
+    merged = pd.concat([read(path) for path in written['merged']], ignore_index=True)
+    assert list(merged.columns) == ssd.MERGED_COLUMNS
+    assert len(merged) == 2 * 96 * 3
+
+
+def test_merged_frame_is_reproducible():
+    pd.testing.assert_frame_equal(ssd.synthetic_merged_frame(300, seed=5), ssd.synthetic_merged_frame(300, seed=5))
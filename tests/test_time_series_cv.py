@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+
+import time_series_cv as tscv
+
+
+@pytest.mark.parametrize('gap', [0, 1, 3])
+def test_expanding_splits_never_train_on_or_after_the_test_block(gap):
+    splits = tscv.rolling_origin_splits(103, n_splits=4, gap=gap, min_train_fraction=0.3)
+
+    assert len(splits) == 4
+    for train_idx, test_idx in splits:
+        assert train_idx[0] == 0
+        assert train_idx[-1] == test_idx[0] - gap - 1
+        np.testing.assert_array_equal(np.diff(test_idx), 1)
+
+    # Test blocks tile the rows after the first train window, the last one takes the remainder
+    tested = np.concatenate([test_idx for _, test_idx in splits])
+    np.testing.assert_array_equal(tested, np.arange(30, 103))
+
+
+def test_blocked_splits_keep_a_fixed_train_window():
+    splits = tscv.rolling_origin_splits(100, n_splits=5, mode='blocked', gap=1, min_train_fraction=0.3)
+    for train_idx, test_idx in splits:
+        assert train_idx[-1] == test_idx[0] - 2
+    # The first window loses the gap row, later ones slide at full length
+    assert [len(train_idx) for train_idx, _ in splits] == [29, 30, 30, 30, 30]
+
+
+def test_too_few_rows_raise():
+    with pytest.raises(ValueError):
+        tscv.rolling_origin_splits(4, n_splits=5)
+
+
+def test_cross_validate_reports_fold_metrics(tmp_path):
+    rng = np.random.default_rng(0)
+    X = rng.random((200, 2))
+    y = 10 + X @ np.array([1.0, 2.0])
+
+    summary = tscv.time_series_cross_validate(LinearRegression(), X, y, n_splits=3, n_workers=1,
+                                              cache_dir=str(tmp_path))
+
+    assert [fold['test_rows'] for fold in summary['folds']] == [46, 46, 48]
+    assert summary['r2_mean'] == pytest.approx(1.0)
+    assert summary['accuracy_mean'] == pytest.approx(100.0)
@@ -0,0 +1,164 @@
+"""
+Time-series-aware cross-validation engine.
+Rolling-origin (expanding window) and blocked splits that respect time order,
+so lag features such as AC_POWER_LAG1 never leak future rows into training.
+Fold matrices are cached once as memory-mapped .npy files and folds run in
+parallel across processes with per-fold timings.
+"""
+
+import os
+import time
+import hashlib
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.base import clone
+from sklearn.metrics import r2_score, mean_squared_error, mean_absolute_error
+from threadpoolctl import threadpool_limits
+
+FOLD_CACHE_DIR = os.path.join('.cache', 'cv_folds')
+
+def rolling_origin_splits(n_samples, n_splits=5, mode='expanding', gap=1, min_train_fraction=0.3):
+    """
+    Time-ordered train/test index splits
+
+    Args:
+        n_samples (int): Number of rows, assumed sorted by time
+        n_splits (int): Number of folds
+        mode (str): 'expanding' trains on everything before the test block,
+            'blocked' trains only on the block immediately before it
+        gap (int): Rows dropped between train and test, at least the largest lag
+        min_train_fraction (float): Share of rows reserved for the first train window
+
+    Returns:
+        list: (train_idx, test_idx) tuples
+    """
+    first_test_start = int(n_samples * min_train_fraction)
+    test_size = (n_samples - first_test_start) // n_splits
+    if test_size <= 0:
+        raise ValueError(f"Not enough rows ({n_samples}) for {n_splits} time-series folds")
+
+    splits = []
+    for fold in range(n_splits):
+        test_start = first_test_start + fold * test_size
+        test_end = n_samples if fold == n_splits - 1 else test_start + test_size
+        train_end = test_start - gap
+        train_start = 0 if mode == 'expanding' else max(0, train_end - first_test_start)
+        splits.append((np.arange(train_start, train_end), np.arange(test_start, test_end)))
+    return splits
+
+def _fold_cache_key(X, y, splits):
+    """Hash the data and split boundaries"""
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(X).tobytes())
+    digest.update(np.ascontiguousarray(y).tobytes())
+    for train_idx, test_idx in splits:
+        digest.update(np.array([train_idx[0], train_idx[-1], test_idx[0], test_idx[-1]]).tobytes())
+    return digest.hexdigest()[:16]
+
+def cache_fold_matrices(X, y, splits, cache_dir=FOLD_CACHE_DIR):
+    """
+    Write each fold's train/test matrices to .npy files once
+
+    Returns:
+        list: Per-fold dicts of file paths, loadable with np.load(mmap_mode='r')
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    fold_dir = os.path.join(cache_dir, _fold_cache_key(X, y, splits))
+    os.makedirs(fold_dir, exist_ok=True)
+
+    fold_files = []
+    for fold, (train_idx, test_idx) in enumerate(splits):
+        files = {
+            name: os.path.join(fold_dir, f"fold{fold}_{name}.npy")
+            for name in ['X_train', 'y_train', 'X_test', 'y_test']
+        }
+        if not all(os.path.exists(path) for path in files.values()):
+            np.save(files['X_train'], X[train_idx])
+            np.save(files['y_train'], y[train_idx])
+            np.save(files['X_test'], X[test_idx])
+            np.save(files['y_test'], y[test_idx])
+        fold_files.append(files)
+    return fold_files
+
+def _run_fold(fold, estimator, files, n_threads):
+    """Worker: fit and score one fold from its memory-mapped matrices"""
+    start = time.perf_counter()
+    X_train = np.load(files['X_train'], mmap_mode='r')
+    y_train = np.load(files['y_train'], mmap_mode='r')
+    X_test = np.load(files['X_test'], mmap_mode='r')
+    y_test = np.load(files['y_test'], mmap_mode='r')
+
+    model = clone(estimator)
+    if 'n_jobs' in model.get_params():
+        model.set_params(n_jobs=n_threads)
+
+    with threadpool_limits(limits=n_threads):
+        fit_start = time.perf_counter()
+        model.fit(X_train, y_train)
+        fit_seconds = time.perf_counter() - fit_start
+        y_pred = model.predict(X_test)
+
+    return {
+        'fold': fold,
+        'train_rows': len(y_train),
+        'test_rows': len(y_test),
+        'r2': r2_score(y_test, y_pred),
+        'rmse': np.sqrt(mean_squared_error(y_test, y_pred)),
+        'mae': mean_absolute_error(y_test, y_pred),
+        # Same definition as calculate_metrics: predictions within 5% of actual
+        'accuracy': np.mean(np.abs((y_test - y_pred) / (y_test + 1e-8)) <= 0.05) * 100,
+        'fit_seconds': fit_seconds,
+        'total_seconds': time.perf_counter() - start
+    }
+
+def time_series_cross_validate(estimator, X, y, n_splits=5, mode='expanding', gap=1,
+                               n_workers=None, cache_dir=FOLD_CACHE_DIR, name=None):
+    """
+    Cross-validate an estimator on time-ordered data with parallel folds
+
+    Args:
+        estimator: Unfitted sklearn-compatible regressor (cloned per fold)
+        X, y: Features and target sorted by time
+        n_splits, mode, gap: See rolling_origin_splits
+        n_workers (int): Processes running folds (defaults to min(folds, cores))
+        cache_dir (str): Where fold matrices are cached
+
+    Returns:
+        dict: Mean/std R², mean RMSE, MAE, accuracy and the per-fold records
+    """
+    name = name or type(estimator).__name__
+    splits = rolling_origin_splits(len(y), n_splits, mode, gap)
+    fold_files = cache_fold_matrices(X, y, splits, cache_dir)
+
+    n_cores = os.cpu_count() or 1
+    n_workers = n_workers or min(n_splits, n_cores)
+    n_threads = max(1, n_cores // n_workers)
+
+    print(f"🔄 {mode.title()} time-series CV for {name}: {n_splits} folds, "
+          f"{n_workers} workers x {n_threads} threads")
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        folds = list(executor.map(
+            _run_fold, range(n_splits), [estimator] * n_splits, fold_files, [n_threads] * n_splits
+        ))
+
+    for record in folds:
+        print(f"   Fold {record['fold']}: train={record['train_rows']}, test={record['test_rows']}, "
+              f"R²={record['r2']:.4f}, fit={record['fit_seconds']:.2f}s, total={record['total_seconds']:.2f}s")
+
+    r2_scores = np.array([record['r2'] for record in folds])
+    summary = {
+        'r2_mean': r2_scores.mean(),
+        'r2_std': r2_scores.std(),
+        'rmse_mean': np.mean([record['rmse'] for record in folds]),
+        'mae_mean': np.mean([record['mae'] for record in folds]),
+        'accuracy_mean': np.mean([record['accuracy'] for record in folds]),
+        'wall_seconds': time.perf_counter() - start,
+        'cpu_seconds': sum(record['total_seconds'] for record in folds),
+        'folds': folds
+    }
+    print(f"✅ {name} - CV R²: {summary['r2_mean']:.4f} ± {summary['r2_std']:.4f} "
+          f"(wall {summary['wall_seconds']:.1f}s, fold time {summary['cpu_seconds']:.1f}s)")
+    return summary